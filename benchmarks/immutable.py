@@ -0,0 +1,95 @@
+"""
+Compares the cost of constructing, comparing and (failing to) look up
+attributes on instances of :class:`~forge._immutable.Immutable` with that of
+its predecessor, which set fields in a loop of :func:`object.__setattr__`,
+compared :func:`~forge._immutable.asdict` results and defined
+``__getattr__``.
+
+Usage: ``python benchmarks/immutable.py [--number N] [--fields N]``
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# pylint: disable=C0413, wrong-import-position
+from forge._immutable import Immutable, asdict  # noqa: E402
+
+
+class LegacyImmutable:
+    """
+    The previous implementation of :class:`~forge._immutable.Immutable`
+    """
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            object.__setattr__(self, k, v)
+
+    def __eq__(self, other):
+        if not isinstance(other, type(self)):
+            return False
+        return asdict(other) == asdict(self)
+
+    def __getattr__(self, key):
+        return super().__getattribute__(key)
+
+
+def make_class(base: type, count: int) -> type:
+    """
+    :param base: the base class
+    :param count: the number of (public and private) fields of the class
+    :returns: a subclass of ``base`` whose ``__init__`` passes its fields on
+    """
+    names = tuple(
+        '{}field{}'.format('_' if i % 4 == 3 else '', i) for i in range(count)
+    )
+
+    def __init__(self, **kwargs):
+        base.__init__(self, **kwargs)
+
+    return type(base.__name__ + 'Klass', (base,), {
+        '__slots__': names,
+        '__init__': __init__,
+    })
+
+
+def measure(base: type, count: int, number: int) -> dict:
+    """
+    :param base: see :paramref:`make_class.base`
+    :param count: see :paramref:`make_class.count`
+    :param number: the number of repetitions of each operation
+    :returns: a mapping of the operation to the mean time (in microseconds)
+    """
+    klass = make_class(base, count)
+    kwargs = {name: i for i, name in enumerate(klass.__slots__)}
+    ins1, ins2 = klass(**kwargs), klass(**kwargs)
+    cases = {
+        'construct': lambda: klass(**kwargs),
+        '__eq__': lambda: ins1 == ins2,
+        'getattr (missing)': lambda: getattr(ins1, 'missing', None),
+    }
+    return {
+        name: min(timeit.repeat(case, number=number, repeat=5)) / number * 1e6
+        for name, case in cases.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=100000)
+    parser.add_argument('--fields', type=int, default=12)
+    args = parser.parse_args()
+
+    legacy = measure(LegacyImmutable, args.fields, args.number)
+    current = measure(Immutable, args.fields, args.number)
+    for name in legacy:
+        print('{:>18}: {:>7.3f}us -> {:>7.3f}us ({:.1f}x)'.format(
+            name, legacy[name], current[name], legacy[name] / current[name],
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the memory retained by many revised callables, comparing wrappers
+that share a :class:`~forge._revision.MapperPlan` (identical signatures) with
+wrappers that don't (each signature is distinct).
+
+Usage: ``python benchmarks/mappers.py [--wrappers N]``
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import forge  # noqa: E402  pylint: disable=C0413, wrong-import-position
+
+
+def make_wrapper(index: int, shared: bool):
+    """
+    :param index: the index of the wrapper
+    :param shared: whether the wrapper's signature is identical to the others
+    :returns: a revised callable
+    """
+    default = 0 if shared else index
+    def func(a, b=default, *, c=None):
+        return (a, b, c)
+    return forge.sign(
+        forge.arg('a'),
+        forge.arg('b', default=default),
+        forge.kwarg('c', default=None),
+    )(func)
+
+
+def measure(count: int, shared: bool) -> int:
+    """
+    :param count: the number of wrappers to create
+    :param shared: see :paramref:`make_wrapper.shared`
+    :returns: the number of bytes retained by the wrappers
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    wrappers = [make_wrapper(i, shared) for i in range(count)]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del wrappers
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--wrappers', type=int, default=10000)
+    args = parser.parse_args()
+
+    results = {
+        shared: measure(args.wrappers, shared) for shared in (False, True)
+    }
+    for shared, retained in sorted(results.items()):
+        print('{:>8}: {:>12,} bytes ({:,.0f} bytes/wrapper)'.format(
+            'shared' if shared else 'distinct',
+            retained,
+            retained / args.wrappers,
+        ))
+    print('saving: {:.1%}'.format(1 - results[True] / results[False]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Measures how the unit revisions (and :meth:`~forge.FSignature.validate`) scale
+with the number of parameters in a signature.
+
+Each revision should take time proportional to the number of parameters, so
+the time per parameter (the right-most column) should remain roughly constant
+as signatures grow.
+Validating a revision of a validated signature (``validate (insert)``) only
+checks the inserted parameter, so its time per parameter should fall.
+
+Usage: ``python benchmarks/scaling.py [--sizes 10,100,1000,10000]``
+"""
+import argparse
+import inspect
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import forge  # noqa: E402  pylint: disable=C0413, wrong-import-position
+
+
+def make_callable(size: int):
+    """
+    :param size: the number of parameters
+    :returns: a callable with ``size`` positional-or-keyword parameters
+    """
+    def func(*args, **kwargs):
+        return args, kwargs
+    func.__signature__ = inspect.Signature([  # type: ignore
+        inspect.Parameter('p{}'.format(i), inspect.Parameter.KEYWORD_ONLY)
+        for i in range(size)
+    ])
+    return func
+
+
+def make_cases(size: int) -> dict:
+    """
+    :param size: the number of parameters
+    :returns: a mapping of case names to revisions (or a callable)
+    """
+    func = make_callable(size)
+    half = ['p{}'.format(i) for i in range(0, size, 2)]
+    middle = 'p{}'.format(size // 2)
+    last = 'p{}'.format(size - 1)
+    return {
+        'insert (after)': forge.insert(forge.kwo('new'), after=middle),
+        'insert (before)': forge.insert(forge.kwo('new'), before=middle),
+        'translocate': forge.translocate('p0', after=last),
+        'delete (multiple)': forge.delete(half, multiple=True),
+        'modify (multiple)': forge.modify(half, multiple=True, type=int),
+        'replace': forge.replace(last, forge.kwo('new')),
+        'copy (exclude)': forge.copy(func, exclude=half),
+        'copy (include)': forge.copy(func, include=half),
+    }
+
+
+def measure(size: int) -> dict:
+    """
+    :param size: the number of parameters
+    :returns: a mapping of case names to the time taken (in seconds)
+    """
+    fsig = forge.fsignature(make_callable(size))
+    cases = {
+        name: (lambda rev=rev: rev.revise(fsig))
+        for name, rev in make_cases(size).items()
+    }
+    # Validated signatures aren't re-validated, so validate a fresh copy
+    cases['validate'] = lambda: forge.FSignature(fsig).validate()
+    fsig.validate()
+    insert = forge.insert(forge.kwo('new'), after='p{}'.format(size // 2))
+    cases['validate (insert)'] = lambda: insert.revise(fsig).validate()
+    number = max(1, 10000 // size)
+    return {
+        name: min(timeit.repeat(case, number=number, repeat=3)) / number
+        for name, case in cases.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', default='10,100,1000,10000')
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    results = {size: measure(size) for size in sizes}
+    for name in results[sizes[0]]:
+        for size in sizes:
+            elapsed = results[size][name]
+            print('{:>18} {:>6} params: {:>10.1f}us ({:.3f}us/param)'.format(
+                name, size, elapsed * 1e6, elapsed * 1e6 / size,
+            ))
+
+
+if __name__ == '__main__':
+    main()
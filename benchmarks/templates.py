@@ -0,0 +1,65 @@
+"""
+Measures the time taken to create variants of a revised callable that differ
+only in a bound value, comparing revising the callable for each variant with
+specializing a :class:`~forge.template`.
+
+Usage: ``python benchmarks/templates.py [--params N] [--variants N]``
+"""
+import argparse
+import inspect
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import forge  # noqa: E402  pylint: disable=C0413, wrong-import-position
+
+
+def make_callable(size: int):
+    """
+    :param size: the number of parameters (besides ``method``)
+    :returns: a callable with a ``method`` parameter, followed by ``size``
+        keyword-only parameters
+    """
+    def func(method, **kwargs):
+        return method, kwargs
+    func.__signature__ = inspect.Signature([  # type: ignore
+        inspect.Parameter('method', inspect.Parameter.POSITIONAL_OR_KEYWORD),
+    ] + [
+        inspect.Parameter(
+            'p{}'.format(i),
+            inspect.Parameter.KEYWORD_ONLY,
+            default=None,
+        ) for i in range(size)
+    ])
+    return func
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--params', type=int, default=20)
+    parser.add_argument('--variants', type=int, default=1000)
+    args = parser.parse_args()
+
+    func = make_callable(args.params)
+    kind = forge.FParameter.POSITIONAL_ONLY
+    with_method = forge.template(forge.modify('method', kind=kind), func)
+    cases = {
+        'revise': lambda: [
+            forge.modify('method', default=i, bound=True, kind=kind)(func)
+            for i in range(args.variants)
+        ],
+        'specialize': lambda: [
+            with_method.specialize(method=i) for i in range(args.variants)
+        ],
+    }
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=1, repeat=3))
+        print('{:>10}: {:>10.1f}ms ({:.1f}us/variant)'.format(
+            name, elapsed * 1e3, elapsed * 1e6 / args.variants,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Measures the throughput of revised callables called concurrently from an
+increasing number of threads.
+
+On free-threaded builds of CPython (e.g. ``python3.13t``), throughput should
+scale near-linearly with the number of threads (up to the number of cores);
+with the GIL, it remains roughly constant.
+
+Usage: ``python benchmarks/threads.py [--calls N] [--threads 1,2,4,8]``
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import forge  # noqa: E402  pylint: disable=C0413, wrong-import-position
+
+
+def to_int(ctx, name, value):
+    # pylint: disable=W0613, unused-argument
+    return int(value)
+
+
+def non_negative(ctx, name, value):
+    # pylint: disable=W0613, unused-argument
+    if value < 0:
+        raise ValueError('{} must be non-negative'.format(name))
+
+
+@forge.sign(
+    forge.arg('a', converter=to_int, validator=non_negative),
+    forge.arg('b', converter=to_int, default=1),
+    forge.kwarg('scale', default=2),
+)
+def mapped(a, b, scale):
+    return (a + b) * scale
+
+
+@forge.memoize(maxsize=4096, stripes=32)
+def memoized(a, b=1):
+    return a + b
+
+
+CASES = {
+    'mapped': lambda i: mapped(str(i), b='2'),
+    'memoized': lambda i: memoized(i % 1024),
+}
+
+
+def measure(case, threads: int, calls: int) -> float:
+    """
+    :param case: a callable that receives the index of a call
+    :param threads: the number of threads calling ``case``
+    :param calls: the number of calls made by each thread
+    :returns: the number of calls per second, across all threads
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def work():
+        barrier.wait()
+        for i in range(calls):
+            case(i)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--threads', default='1,2,4,8')
+    args = parser.parse_args()
+    counts = [int(count) for count in args.threads.split(',')]
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {} (GIL {})'.format(
+        sys.version.split()[0],
+        'enabled' if gil else 'disabled',
+    ))
+    for name, case in sorted(CASES.items()):
+        baseline = None
+        for count in counts:
+            rate = measure(case, count, args.calls)
+            baseline = baseline or rate
+            print('{:>10} {:>3} threads: {:>12,.0f} calls/s ({:.2f}x)'.format(
+                name, count, rate, rate / baseline,
+            ))
+
+
+if __name__ == '__main__':
+    main()
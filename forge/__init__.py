@@ -1,15 +1,42 @@
+from ._cache import (
+    cached_converter,
+    memoize,
+)
+from ._concurrency import (
+    batch_converter,
+    batched,
+    singleflight,
+    to_async,
+)
 from ._config import (
+    get_intern_parameters,
+    get_lean_coroutines,
     get_run_validators,
+    set_intern_parameters,
+    set_lean_coroutines,
     set_run_validators,
 )
 from ._exceptions import (
     ForgeError,
     ImmutableInstanceError,
 )
+from ._inject import (
+    Provider,
+    ProviderRegistry,
+    inject,
+    providers,
+)
 from ._marker import (
     empty,
     void,
 )
+from ._parallel import (
+    amap,
+    parallel_map,
+)
+from ._recipe import (
+    picklable,
+)
 from ._revision import (
     Mapper,
     Revision,
@@ -27,10 +54,14 @@ from ._revision import (
     replace,
     translocate, move,
 )
+from ._scope import (
+    request_scope,
+)
 from ._signature import (
     Factory,
     FParameter,
     FSignature,
+    Selector,
     findparam,
     fsignature,
     pos, pok, vpo, kwo, vkw,
@@ -38,6 +69,9 @@ from ._signature import (
     self_ as self,
     cls_ as cls,
 )
+from ._template import (
+    template,
+)
 from ._utils import (
     callwith,
     repr_callable,
@@ -0,0 +1,638 @@
+import asyncio
+import collections
+import functools
+import threading
+import time
+import typing
+
+from forge._marker import _void
+from forge._revision import Revision
+from forge._signature import _iscoroutinecallable
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo',
+    ['hits', 'misses', 'maxsize', 'currsize'],
+)
+
+
+_KWD_MARK = (object(),)
+
+
+def make_key(
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Mapping[str, typing.Any],
+        typed: bool = False,
+    ) -> typing.Hashable:
+    """
+    Builds a hashable key from arguments mapped by :class:`~forge.Mapper`.
+    As mapped arguments are in canonical form (bound to their parameters,
+    with defaults applied), no further normalization is necessary.
+
+    :param args: the mapped positional arguments
+    :param kwargs: the mapped keyword arguments
+    :param typed: whether the types of the arguments are included in the key
+    :returns: a hashable key
+    """
+    key = args
+    if kwargs:
+        key += _KWD_MARK + tuple(kwargs.items())
+    if typed:
+        key += tuple(type(v) for v in args)
+        if kwargs:
+            key += tuple(type(v) for v in kwargs.values())
+    return key
+
+
+class Cache:
+    """
+    A thread-safe mapping of bounded size that evicts entries according to
+    an eviction ``policy`` when full, and (optionally) entries that are older
+    than a time-to-live.
+
+    The lock is never held while user code runs, so it's also safe to use
+    from coroutines running on an event loop.
+
+    :param maxsize: the maximum number of entries, or ``None`` for unbounded
+    :param ttl: the number of seconds an entry remains valid, or ``None`` for
+        no expiry
+    :param policy: ``'lru'`` to evict the least-recently used entry, or
+        ``'fifo'`` to evict the oldest entry
+    :param timer: a callable returning the current time in seconds
+    """
+    __slots__ = (
+        'maxsize',
+        'ttl',
+        'policy',
+        'timer',
+        'hits',
+        'misses',
+        '_data',
+        '_lock',
+    )
+
+    POLICIES = ('lru', 'fifo')
+
+    def __init__(
+            self,
+            maxsize: typing.Optional[int] = 128,
+            ttl: typing.Optional[float] = None,
+            policy: str = 'lru',
+            timer: typing.Callable[[], float] = time.monotonic
+        ) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("'maxsize' must be None or a non-negative int")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("'ttl' must be None or a positive number")
+        if policy not in self.POLICIES:
+            raise ValueError(
+                "'policy' must be one of {}".format(', '.join(self.POLICIES))
+            )
+        self.maxsize = maxsize
+        self.policy = policy
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()  # type: collections.OrderedDict
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return '<{} {}>'.format(type(self).__name__, self.info())
+
+    def get(self, key: typing.Hashable, default: typing.Any = _void):
+        """
+        Retrieves the value for ``key``, marking it as recently used (if the
+        ``policy`` is ``'lru'``).
+        Expired entries are evicted and treated as missing.
+
+        :param key: the key to retrieve
+        :param default: the value to return if ``key`` is missing
+        :returns: the value for ``key``, or ``default``
+        """
+        with self._lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            if expires is not None and expires <= self.timer():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            if self.policy == 'lru':
+                self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: typing.Hashable, value: typing.Any) -> None:
+        """
+        Stores ``value`` for ``key``, evicting an entry (as determined by the
+        ``policy``) if the cache is full.
+
+        :param key: the key to store
+        :param value: the value to store
+        """
+        if self.maxsize == 0:
+            return
+        expires = self.timer() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            if self.policy == 'lru':
+                self._data.move_to_end(key)
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(
+            self,
+            key: typing.Hashable,
+            value: typing.Any = _void
+        ) -> None:
+        """
+        Removes the entry for ``key`` (if there is one), without recording a
+        hit or miss.
+
+        :param key: the key to remove
+        :param value: if supplied, the entry is only removed if its value is
+            ``value`` (i.e. it hasn't been replaced since)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and (value is _void or entry[0] is value):
+                del self._data[key]
+
+    def keys(self) -> typing.List[typing.Hashable]:
+        """
+        :returns: a snapshot of the keys, in eviction order
+        """
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the hit and miss statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        :returns: a :class:`~forge._cache.CacheInfo` of the cache statistics
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+class StripedCache:
+    """
+    A :class:`~forge._cache.Cache` that's partitioned into ``stripes``
+    independent caches (each with its own lock) by the hash of the key, so
+    that threads using different keys rarely contend for a lock.
+
+    Each stripe holds (at most) an equal share of ``maxsize`` entries, and
+    evicts entries independently; eviction is therefore approximate, as
+    the entry evicted is the least-recently used (or oldest) of its stripe.
+
+    :param stripes: the number of stripes
+    :param kwargs: see :class:`~forge._cache.Cache`
+    """
+    __slots__ = ('maxsize', '_stripes')
+
+    def __init__(self, stripes: int, **kwargs: typing.Any) -> None:
+        if stripes < 1:
+            raise ValueError("'stripes' must be a positive int")
+        maxsize = kwargs.pop('maxsize', 128)
+        # Validates the arguments
+        Cache(maxsize=maxsize, **kwargs)
+        share = -(-maxsize // stripes) if maxsize else maxsize
+        self.maxsize = maxsize
+        self._stripes = tuple(
+            Cache(maxsize=share, **kwargs) for _ in range(stripes)
+        )
+
+    def __len__(self) -> int:
+        return sum(len(stripe) for stripe in self._stripes)
+
+    def __repr__(self) -> str:
+        return '<{} {}>'.format(type(self).__name__, self.info())
+
+    def _stripe(self, key: typing.Hashable) -> Cache:
+        """
+        :param key: a key
+        :returns: the stripe that ``key`` is stored in
+        """
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def get(self, key: typing.Hashable, default: typing.Any = _void):
+        """
+        See :meth:`~forge._cache.Cache.get`.
+        """
+        return self._stripe(key).get(key, default)
+
+    def set(self, key: typing.Hashable, value: typing.Any) -> None:
+        """
+        See :meth:`~forge._cache.Cache.set`.
+        """
+        self._stripe(key).set(key, value)
+
+    def discard(
+            self,
+            key: typing.Hashable,
+            value: typing.Any = _void
+        ) -> None:
+        """
+        See :meth:`~forge._cache.Cache.discard`.
+        """
+        self._stripe(key).discard(key, value)
+
+    def keys(self) -> typing.List[typing.Hashable]:
+        """
+        :returns: a snapshot of the keys, in eviction order (per stripe)
+        """
+        return [key for stripe in self._stripes for key in stripe.keys()]
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the hit and miss statistics.
+        """
+        for stripe in self._stripes:
+            stripe.clear()
+
+    def info(self) -> CacheInfo:
+        """
+        :returns: a :class:`~forge._cache.CacheInfo` of the cache statistics,
+            summed over the stripes
+        """
+        infos = [stripe.info() for stripe in self._stripes]
+        return CacheInfo(
+            sum(info.hits for info in infos),
+            sum(info.misses for info in infos),
+            self.maxsize,
+            sum(info.currsize for info in infos),
+        )
+
+
+def make_cache(
+        stripes: int = 1,
+        **kwargs: typing.Any
+    ) -> typing.Union[Cache, StripedCache]:
+    """
+    :param stripes: the number of stripes (see
+        :class:`~forge._cache.StripedCache`)
+    :param kwargs: see :class:`~forge._cache.Cache`
+    :returns: a :class:`~forge._cache.Cache` if ``stripes`` is ``1``,
+        otherwise a :class:`~forge._cache.StripedCache`
+    """
+    if stripes == 1:
+        return Cache(**kwargs)
+    return StripedCache(stripes, **kwargs)
+
+
+class cached_converter:  # pylint: disable=C0103, invalid-name
+    """
+    A converter that memoizes the results of an expensive, but pure,
+    converter function. Results are cached on the identity of the ``ctx``
+    argument, the parameter ``name`` and the ``value`` (or the result of
+    ``key``).
+
+    .. testcode::
+
+        import forge
+
+        lookups = []
+        def lookup(ctx, name, value):
+            lookups.append(value)
+            return value * 2
+
+        conv = forge.cached_converter(lookup, maxsize=32)
+
+        @forge.sign(forge.arg('a', converter=conv))
+        def func(a):
+            return a
+
+        assert (func(1), func(1), func(2)) == (2, 2, 4)
+        assert lookups == [1, 2]
+        assert conv.cache_info('a') == (1, 2, 32, 2)
+
+    If ``func`` is a coroutine function, the cached converter is a coroutine
+    callable (and can only be used with coroutine functions) that caches the
+    eventual result of ``func``: concurrent conversions of a value (on an
+    event loop) share a single call, and failed calls aren't cached.
+
+    :param func: a converter; i.e. a callable (or coroutine function) that
+        receives ``ctx``, ``name`` and ``value`` and returns the converted
+        value
+    :param maxsize: the maximum number of cached results, or ``None`` for
+        unbounded
+    :param ttl: the number of seconds a cached result remains valid, or
+        ``None`` for no expiry
+    :param key: a callable that receives ``ctx``, ``name`` and ``value`` and
+        returns a hashable cache key for ``value`` (by default ``value`` is
+        used directly)
+    :param stripes: the number of independently locked partitions of the
+        cache (see :class:`~forge._cache.StripedCache`), reducing contention
+        between threads
+    """
+    def __new__(cls, func, **kwargs):
+        # pylint: disable=W0613, unused-argument
+        if cls is cached_converter and _iscoroutinecallable(func):
+            cls = _coroutine_cached_converter
+        return super().__new__(cls)
+
+    def __init__(
+            self,
+            func: typing.Callable[[typing.Any, str, typing.Any], typing.Any],
+            *,
+            maxsize: typing.Optional[int] = 128,
+            ttl: typing.Optional[float] = None,
+            key: typing.Optional[
+                typing.Callable[[typing.Any, str, typing.Any], typing.Hashable]
+            ] = None,
+            stripes: int = 1
+        ) -> None:
+        self.func = func
+        self.key = key
+        self.cache = make_cache(stripes, maxsize=maxsize, ttl=ttl)
+        # Statistics are recorded per thread (and summed when reported), so
+        # that recording a hit or miss doesn't contend for a lock; those of
+        # exited threads are folded into ``_totals``
+        self._stats = {}  # type: typing.Dict[threading.Thread, typing.Dict]
+        self._totals = {}  # type: typing.Dict[str, typing.List[int]]
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '<{} {}>'.format(
+            type(self).__name__,
+            getattr(self.func, '__qualname__', repr(self.func)),
+        )
+
+    def __call__(self, ctx: typing.Any, name: str, value: typing.Any):
+        key, cached = self._lookup(ctx, name, value)
+        if cached is not _void:
+            return cached
+
+        result = self.func(ctx, name, value)
+        self.cache.set(key, (ctx, result))
+        return result
+
+    def _lookup(
+            self,
+            ctx: typing.Any,
+            name: str,
+            value: typing.Any
+        ) -> typing.Tuple[typing.Hashable, typing.Any]:
+        """
+        Looks up the cached result of converting ``value``, and records a hit
+        or miss.
+
+        :param ctx: see :paramref:`~forge.FParameter.__call__.ctx`
+        :param name: the name of the parameter being converted
+        :param value: the value to convert
+        :returns: the cache key, and the cached result (or ``_void``)
+        """
+        key = self._key(ctx, name, value)
+        cached = self.cache.get(key)
+        # ``ctx`` is retained with the result, guarding against its ``id``
+        # being re-used after it's been garbage collected.
+        if cached is not _void and cached[0] is ctx:
+            self._record(name, hit=True)
+            return key, cached[1]
+
+        self._record(name, hit=False)
+        return key, _void
+
+    def _key(
+            self,
+            ctx: typing.Any,
+            name: str,
+            value: typing.Any
+        ) -> typing.Tuple[typing.Hashable, ...]:
+        """
+        :param ctx: see :paramref:`~forge.FParameter.__call__.ctx`
+        :param name: the name of the parameter being converted
+        :param value: the value to convert
+        :returns: the cache key of converting ``value``; its second item is
+            ``name``
+        """
+        return (
+            id(ctx),
+            name,
+            self.key(ctx, name, value) if self.key is not None else value,
+        )
+
+    def _record(self, name: str, hit: bool) -> None:
+        """
+        Records a hit or miss for the parameter ``name``.
+
+        :param name: the name of the parameter being converted
+        :param hit: whether the result was retrieved from the cache
+        """
+        try:
+            stats = self._local.stats
+        except AttributeError:
+            stats = self._local.stats = {}
+            with self._lock:
+                self._fold()
+                self._stats[threading.current_thread()] = stats
+        counts = stats.get(name)
+        if counts is None:
+            counts = stats[name] = [0, 0]
+        counts[0 if hit else 1] += 1
+
+    def _fold(self) -> None:
+        """
+        Folds the statistics of exited threads into the totals, so that they
+        don't accumulate as threads come and go; called with the lock held.
+        """
+        exited = [thread for thread in self._stats if not thread.is_alive()]
+        for thread in exited:
+            for name, counts in self._stats.pop(thread).items():
+                totals = self._totals.setdefault(name, [0, 0])
+                totals[0] += counts[0]
+                totals[1] += counts[1]
+
+    def cache_info(self, name: typing.Optional[str] = None) -> CacheInfo:
+        """
+        Reports cache statistics, either in aggregate or for the parameter
+        ``name``.
+
+        :param name: the name of a parameter converted by this converter
+        :returns: a :class:`~forge._cache.CacheInfo` of hits, misses, maxsize
+            and current size
+        """
+        with self._lock:
+            self._fold()
+            counts = [
+                counts
+                for stats in [self._totals] + list(self._stats.values())
+                for stats_name, counts in list(stats.items())
+                if name is None or stats_name == name
+            ]
+        hits = sum(count[0] for count in counts)
+        misses = sum(count[1] for count in counts)
+        currsize = len(self.cache) \
+            if name is None \
+            else sum(1 for key in self.cache.keys() if key[1] == name)
+        return CacheInfo(hits, misses, self.cache.maxsize, currsize)
+
+    def cache_clear(self) -> None:
+        """
+        Clears the cache and its statistics.
+        """
+        with self._lock:
+            self.cache.clear()
+            self._totals.clear()
+            for stats in self._stats.values():
+                stats.clear()
+
+
+class _coroutine_cached_converter(cached_converter):
+    # pylint: disable=C0103, invalid-name
+    """
+    A :class:`~forge.cached_converter` of a coroutine function, which caches
+    a future of the result (shared by concurrent conversions of a value).
+    """
+    async def __call__(self, ctx: typing.Any, name: str, value: typing.Any):
+        key, future = self._lookup(ctx, name, value)
+        if future is _void:
+            future = asyncio.ensure_future(self.func(ctx, name, value))
+            entry = (ctx, future)
+            self.cache.set(key, entry)
+            future.add_done_callback(
+                lambda future: self._discard_failed(key, entry)
+            )
+        # Futures are shared; one caller's cancellation mustn't affect others
+        return await asyncio.shield(future)
+
+    def _key(
+            self,
+            ctx: typing.Any,
+            name: str,
+            value: typing.Any
+        ) -> typing.Tuple[typing.Hashable, ...]:
+        # Futures are bound to their event loop
+        return super()._key(ctx, name, value) + (asyncio.get_event_loop(),)
+
+    def _discard_failed(
+            self,
+            key: typing.Hashable,
+            entry: typing.Tuple[typing.Any, asyncio.Future]
+        ) -> None:
+        """
+        Evicts a future that failed (or was cancelled), so that the value is
+        converted again by the next caller.
+
+        :param key: the cache key of the future
+        :param entry: the cached ``ctx`` and (completed) future
+        """
+        future = entry[1]
+        if future.cancelled() or future.exception() is not None:
+            # unless it's been replaced (e.g. after expiring)
+            self.cache.discard(key, entry)
+
+
+class memoize(Revision):  # pylint: disable=C0103, invalid-name
+    """
+    Revision that caches the results of the underlying callable.
+
+    Unlike :func:`functools.lru_cache`, results are cached on the arguments
+    *after* they've been mapped by :class:`~forge.Mapper`; i.e. bound to
+    their parameters, with defaults applied, and converted.
+    Therefore calls that are spelled differently, but are equivalent, share
+    a cache entry:
+
+    .. testcode::
+
+        import forge
+
+        calls = []
+
+        @forge.memoize()
+        def func(a, b=2):
+            calls.append((a, b))
+            return a + b
+
+        assert func(1, b=2) == func(a=1, b=2) == func(1) == 3
+        assert calls == [(1, 2)]
+        assert func.cache_info() == (2, 1, 128, 1)
+
+    The wrapper exposes ``cache_info()`` and ``cache_clear()``, and the
+    underlying cache is retained if the wrapper is subsequently revised.
+    Coroutine functions are supported; their awaited results are cached.
+
+    :param maxsize: the maximum number of cached results, or ``None`` for
+        unbounded
+    :param ttl: the number of seconds a cached result remains valid, or
+        ``None`` for no expiry
+    :param typed: whether arguments of different types are cached separately
+        (e.g. ``1`` and ``1.0``)
+    :param policy: the eviction policy, ``'lru'`` (least-recently used) or
+        ``'fifo'`` (first-in, first-out)
+    :param stripes: the number of independently locked partitions of the
+        cache (see :class:`~forge._cache.StripedCache`), reducing contention
+        between threads
+    """
+    def __init__(
+            self,
+            maxsize: typing.Optional[int] = 128,
+            *,
+            ttl: typing.Optional[float] = None,
+            typed: bool = False,
+            policy: str = 'lru',
+            stripes: int = 1
+        ) -> None:
+        # Validates the arguments
+        make_cache(stripes, maxsize=maxsize, ttl=ttl, policy=policy)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.typed = typed
+        self.policy = policy
+        self.stripes = stripes
+
+    def decorate(
+            self,
+            callable: typing.Callable[..., typing.Any]
+        ) -> typing.Callable[..., typing.Any]:
+        """
+        Wraps the underlying callable with a function that caches its results.
+
+        :param callable: the underlying :term:`callable`
+        :returns: a caching callable with ``cache_info`` and ``cache_clear``
+            attributes
+        """
+        # pylint: disable=W0622, redefined-builtin
+        cache = make_cache(
+            self.stripes,
+            maxsize=self.maxsize,
+            ttl=self.ttl,
+            policy=self.policy,
+        )
+        typed = self.typed
+
+        if asyncio.iscoroutinefunction(callable):
+            @functools.wraps(callable)
+            async def inner(*args, **kwargs):
+                key = make_key(args, kwargs, typed)
+                result = cache.get(key)
+                if result is _void:
+                    result = await callable(*args, **kwargs)
+                    cache.set(key, result)
+                return result
+        else:
+            @functools.wraps(callable)  # type: ignore
+            def inner(*args, **kwargs):
+                key = make_key(args, kwargs, typed)
+                result = cache.get(key)
+                if result is _void:
+                    result = callable(*args, **kwargs)
+                    cache.set(key, result)
+                return result
+
+        inner.cache_info = cache.info  # type: ignore
+        inner.cache_clear = cache.clear  # type: ignore
+        return inner
@@ -0,0 +1,801 @@
+import asyncio
+import collections
+import collections.abc
+import concurrent.futures
+import functools
+import inspect
+import threading
+import time
+import typing
+import weakref
+
+from forge._cache import make_key
+from forge._marker import empty
+from forge._revision import Revision
+from forge._scope import request_scope
+from forge._signature import (
+    KEYWORD_ONLY,
+    POSITIONAL_ONLY,
+    POSITIONAL_OR_KEYWORD,
+    FSignature,
+)
+
+# The origins of annotations of homogeneous sequences (e.g. ``List[int]``)
+_SEQUENCE_ORIGINS = (
+    list,
+    collections.abc.Sequence,
+    collections.abc.Iterable,
+    typing.List,
+    typing.Sequence,
+    typing.Iterable,
+)
+
+
+def _current_task() -> typing.Optional[asyncio.Task]:
+    """
+    :returns: the task running on the current thread's event loop (if any)
+    """
+    # ``asyncio.current_task`` is new in Python 3.7
+    current_task = getattr(asyncio, 'current_task', None) or \
+        asyncio.Task.current_task  # pylint: disable=E1101, no-member
+    try:
+        return current_task()
+    except RuntimeError:
+        return None
+
+
+class _Call:
+    """
+    An in-flight call to a synchronous callable, shared by the callers of a
+    :class:`~forge.singleflight` wrapper.
+
+    :ivar event: set when the call has completed
+    :ivar leader: the identifier of the thread making the call
+    :ivar result: the return value of the call
+    :ivar exception: the exception raised by the call (if any)
+    """
+    __slots__ = ('event', 'leader', 'result', 'exception')
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.leader = threading.get_ident()
+        self.result = None  # type: typing.Any
+        self.exception = None  # type: typing.Optional[BaseException]
+
+
+class singleflight(Revision):  # pylint: disable=C0103, invalid-name
+    """
+    Revision that coalesces concurrent calls with identical arguments into
+    a single call of the underlying callable; every concurrent caller
+    receives the result (or exception) of that single call.
+
+    Arguments are compared after they've been mapped by
+    :class:`~forge.Mapper`, so calls that are spelled differently, but are
+    equivalent, are coalesced.
+    Unlike :class:`~forge.memoize`, results aren't retained once the call
+    completes.
+
+    .. testcode::
+
+        import asyncio
+        import forge
+
+        calls = []
+
+        @forge.singleflight()
+        async def fetch(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key.upper()
+
+        async def main():
+            return await asyncio.gather(fetch('a'), fetch(key='a'), fetch('b'))
+
+        assert asyncio.new_event_loop().run_until_complete(main()) == \
+            ['A', 'A', 'B']
+        assert calls == ['a', 'b']
+
+    Callers of coroutine functions share a single :class:`asyncio.Task`,
+    which is shielded from the cancellation of any individual caller.
+    Callers of synchronous functions (typically in different threads) wait
+    on a :class:`threading.Event` for the first caller to complete the call.
+    Re-entrant calls (i.e. calls made by the call itself, with the same
+    arguments) aren't coalesced, as they'd wait for themselves. However,
+    calls made by tasks the call spawns (e.g. with :func:`asyncio.gather`)
+    can't be told apart from concurrent callers: they await the call, which
+    deadlocks if it awaits them in turn.
+    Calls with unhashable arguments aren't coalesced.
+
+    :param typed: whether arguments of different types are considered
+        distinct (e.g. ``1`` and ``1.0``)
+    """
+    def __init__(self, *, typed: bool = False) -> None:
+        self.typed = typed
+
+    def decorate(
+            self,
+            callable: typing.Callable[..., typing.Any]
+        ) -> typing.Callable[..., typing.Any]:
+        """
+        Wraps the underlying callable with a function that coalesces
+        concurrent calls.
+
+        :param callable: the underlying :term:`callable`
+        :returns: a coalescing callable
+        """
+        # pylint: disable=W0622, redefined-builtin
+        typed = self.typed
+        lock = threading.Lock()
+        inflight = {}  # type: typing.Dict[typing.Hashable, typing.Any]
+
+        if asyncio.iscoroutinefunction(callable):
+            def forget(key, task):
+                with lock:
+                    if inflight.get(key) is task:
+                        del inflight[key]
+
+            @functools.wraps(callable)
+            async def inner(*args, **kwargs):
+                # Futures are bound to their event loop
+                key = (asyncio.get_event_loop(), make_key(args, kwargs, typed))
+                try:
+                    hash(key)
+                except TypeError:
+                    # Unhashable arguments can't be compared; not coalesced
+                    return await callable(*args, **kwargs)
+                with lock:
+                    task = inflight.get(key)
+                    if task is None:
+                        task = asyncio.ensure_future(callable(*args, **kwargs))
+                        task.add_done_callback(
+                            functools.partial(forget, key)
+                        )
+                        inflight[key] = task
+                if task is _current_task():
+                    # A re-entrant call (made by the call) would await itself
+                    return await callable(*args, **kwargs)
+                return await asyncio.shield(task)
+        else:
+            @functools.wraps(callable)  # type: ignore
+            def inner(*args, **kwargs):
+                key = make_key(args, kwargs, typed)
+                try:
+                    hash(key)
+                except TypeError:
+                    # Unhashable arguments can't be compared; not coalesced
+                    return callable(*args, **kwargs)
+                with lock:
+                    call = inflight.get(key)
+                    leader = call is None
+                    if leader:
+                        call = inflight[key] = _Call()
+
+                if not leader:
+                    if call.leader == threading.get_ident():
+                        # A re-entrant call (made by the call) would wait for
+                        # itself
+                        return callable(*args, **kwargs)
+                    call.event.wait()
+                    if call.exception is not None:
+                        raise call.exception
+                    return call.result
+
+                try:
+                    call.result = callable(*args, **kwargs)
+                    return call.result
+                except BaseException as exc:
+                    call.exception = exc
+                    raise
+                finally:
+                    with lock:
+                        del inflight[key]
+                    call.event.set()
+
+        return inner
+
+
+OffloadInfo = collections.namedtuple(
+    'OffloadInfo',
+    ['queued', 'running', 'completed', 'mean_latency', 'max_latency'],
+)
+
+
+class _OffloadStats:
+    """
+    The metrics of a :class:`~forge.to_async` wrapper.
+
+    :ivar queued: the number of calls waiting for a slot (i.e. queue depth)
+    :ivar running: the number of calls running on the executor
+    :ivar completed: the number of calls that have completed (or raised)
+    :ivar total_latency: the total seconds from call to completion
+    :ivar max_latency: the maximum seconds from call to completion
+    """
+    __slots__ = (
+        'queued',
+        'running',
+        'completed',
+        'total_latency',
+        'max_latency',
+        'lock',
+    )
+
+    def __init__(self) -> None:
+        self.queued = self.running = self.completed = 0
+        self.total_latency = self.max_latency = 0.
+        self.lock = threading.Lock()
+
+    def info(self) -> OffloadInfo:
+        """
+        :returns: an :class:`~forge._concurrency.OffloadInfo` of the queue
+            depth, running and completed calls, and the mean and maximum
+            latency (in seconds)
+        """
+        with self.lock:
+            return OffloadInfo(
+                self.queued,
+                self.running,
+                self.completed,
+                self.total_latency / self.completed if self.completed else 0.,
+                self.max_latency,
+            )
+
+
+class to_async(Revision):  # pylint: disable=C0103, invalid-name
+    """
+    Revision that converts a blocking (synchronous) callable into a coroutine
+    function, which runs the callable on a thread pool.
+
+    The revised signature is retained, and arguments are mapped (i.e.
+    converted and validated) inline on the event loop, before the call is
+    offloaded. At most ``limit`` calls run concurrently; further calls wait
+    (without blocking the event loop) for a slot.
+
+    .. testcode::
+
+        import asyncio
+        import time
+        import forge
+
+        @forge.to_async(limit=4)
+        def fetch(delay):
+            time.sleep(delay)  # e.g. a blocking client library
+            return delay
+
+        async def main():
+            return await asyncio.gather(*[fetch(0.01) for _ in range(8)])
+
+        assert asyncio.iscoroutinefunction(fetch)
+        assert asyncio.new_event_loop().run_until_complete(main()) == [0.01] * 8
+        assert fetch.offload_info().completed == 8
+
+    The wrapper exposes ``offload_info()``, which reports the queue depth,
+    the number of running and completed calls, and their mean and maximum
+    latency (from call to completion, in seconds).
+
+    :param executor: a :class:`concurrent.futures.Executor` on which to run
+        the callable, which remains owned (and shut down) by the caller; by
+        default, the event loop's default executor is used, which is owned
+        by the loop (and shut down with it, e.g. by :func:`asyncio.run`)
+    :param limit: the maximum number of concurrent calls, or ``None`` for no
+        limit (other than that of the executor)
+    """
+    def __init__(
+            self,
+            executor: typing.Optional[concurrent.futures.Executor] = None,
+            *,
+            limit: typing.Optional[int] = None
+        ) -> None:
+        if limit is not None and limit < 1:
+            raise ValueError("'limit' must be None or a positive int")
+        self.executor = executor
+        self.limit = limit
+
+    def decorate(
+            self,
+            callable: typing.Callable[..., typing.Any]
+        ) -> typing.Callable[..., typing.Any]:
+        """
+        Wraps the underlying callable with a coroutine function that runs it
+        on the executor.
+
+        :param callable: the underlying (synchronous) :term:`callable`
+        :returns: a coroutine function with an ``offload_info`` attribute
+        :raises TypeError: if ``callable`` is a coroutine function
+        """
+        # pylint: disable=W0622, redefined-builtin
+        if asyncio.iscoroutinefunction(callable):
+            raise TypeError(
+                'to_async requires a synchronous callable, not {}'.\
+                format(callable)
+            )
+
+        # ``None`` selects the loop's default executor; wrappers don't own (so
+        # never have to shut down) an executor of their own
+        executor = self.executor
+        limit = self.limit
+        # Semaphores are bound to their event loop
+        semaphores = weakref.WeakKeyDictionary()  # type: typing.Any
+        stats = _OffloadStats()
+
+        @functools.wraps(callable)
+        async def inner(*args, **kwargs):
+            loop = asyncio.get_event_loop()
+            start = time.monotonic()
+            with stats.lock:
+                stats.queued += 1
+
+            semaphore = None
+            try:
+                if limit is not None:
+                    semaphore = semaphores.get(loop)
+                    if semaphore is None:
+                        semaphore = semaphores[loop] = asyncio.Semaphore(limit)
+                    await semaphore.acquire()
+            except BaseException:
+                with stats.lock:
+                    stats.queued -= 1
+                raise
+
+            with stats.lock:
+                stats.queued -= 1
+                stats.running += 1
+            try:
+                return await loop.run_in_executor(
+                    executor,
+                    functools.partial(callable, *args, **kwargs),
+                )
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+                latency = time.monotonic() - start
+                with stats.lock:
+                    stats.running -= 1
+                    stats.completed += 1
+                    stats.total_latency += latency
+                    stats.max_latency = max(stats.max_latency, latency)
+
+        inner.offload_info = stats.info  # type: ignore
+        return inner
+
+
+class _Batch:
+    """
+    A batch of calls pending a single call of a batch function.
+
+    :ivar items: the mapped ``(args, kwargs)`` of each call
+    :ivar results: the results of the batch function, by call
+    :ivar exception: the exception raised by the batch function (if any)
+    :ivar full: set when the batch is closed to further calls
+    :ivar done: set when the results (or exception) are available
+    :ivar futures: (asyncio) the futures awaited by each call
+    :ivar handle: (asyncio) the timer handle that flushes the batch
+    """
+    __slots__ = (
+        'items',
+        'results',
+        'exception',
+        'full',
+        'done',
+        'futures',
+        'handle',
+    )
+
+    def __init__(self) -> None:
+        self.items = []  # type: typing.List[typing.Tuple[tuple, dict]]
+        self.results = None  # type: typing.Optional[typing.Sequence]
+        self.exception = None  # type: typing.Optional[BaseException]
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.futures = []  # type: typing.List[asyncio.Future]
+        self.handle = None  # type: typing.Optional[asyncio.TimerHandle]
+
+
+def _element_type(annotation: typing.Any, missing: typing.Any) -> typing.Any:
+    """
+    :param annotation: the annotation of a parameter (or the return value) of
+        a batch function, e.g. ``List[int]``
+    :param missing: the value denoting a missing annotation
+    :returns: the annotation of a single element (e.g. ``int``), or
+        :paramref:`._element_type.missing` if it can't be determined
+    """
+    args = getattr(annotation, '__args__', None)
+    if getattr(annotation, '__origin__', None) in _SEQUENCE_ORIGINS and \
+            args and len(args) == 1:
+        return args[0]
+    return missing
+
+
+class batched(Revision):  # pylint: disable=C0103, invalid-name
+    """
+    Revision that gathers concurrent calls into a single call of a batch
+    function, and scatters the results back to the callers.
+
+    The revised callable is the *batch function*: each of its parameters
+    receives a list of arguments (one per call), and it returns a sequence
+    of results (one per call, in the same order).
+    The wrapper exposes the same parameters to callers, but each receives a
+    single (scalar) argument: annotations such as ``List[int]`` are unwrapped
+    to ``int``.
+
+    .. testcode::
+
+        import asyncio
+        import forge
+
+        batches = []
+
+        @forge.batched(max_size=10, max_wait_ms=5)
+        async def score(user_id, factor=1):
+            batches.append(user_id)
+            return [uid * f for uid, f in zip(user_id, factor)]
+
+        async def main():
+            return await asyncio.gather(score(1), score(2, factor=10))
+
+        assert asyncio.new_event_loop().run_until_complete(main()) == [1, 20]
+        assert batches == [[1, 2]]
+
+    If the batch function is a coroutine function, calls are gathered on the
+    running event loop.
+    Otherwise, calls are gathered across threads: the first caller waits for
+    the batch to fill (or for ``max_wait_ms``) and then calls the batch
+    function, while the others wait for their results.
+
+    .. note::
+
+        A batch is dispatched as soon as it holds ``max_size`` calls, but
+        otherwise only after ``max_wait_ms``; so a call that isn't joined by
+        others (e.g. a lone caller) is delayed by up to ``max_wait_ms``.
+
+    :param max_size: the maximum number of calls in a batch; a full batch is
+        dispatched immediately
+    :param max_wait_ms: the maximum number of milliseconds to wait for a
+        batch to fill before it's dispatched
+    """
+    def __init__(
+            self,
+            *,
+            max_size: int = 64,
+            max_wait_ms: float = 1.0
+        ) -> None:
+        if max_size < 1:
+            raise ValueError("'max_size' must be a positive int")
+        if max_wait_ms < 0:
+            raise ValueError("'max_wait_ms' must be a non-negative number")
+        self.max_size = max_size
+        self.max_wait_ms = max_wait_ms
+
+    def revise(self, previous: FSignature) -> FSignature:
+        """
+        Unwraps the annotations of the batch function (e.g. ``List[int]``)
+        to those of a single call (e.g. ``int``); annotations that can't be
+        unwrapped are removed.
+
+        No validation is performed on the updated :class:`~forge.FSignature`,
+        allowing it to be used as an intermediate revision in the context of
+        :class:`~forge.compose`.
+
+        :param previous: the :class:`~forge.FSignature` to modify
+        :returns: a modified instance of :class:`~forge.FSignature`
+        """
+        # https://github.com/python/mypy/issues/5156
+        return previous.replace(  # type: ignore
+            parameters=[
+                fparam.replace(type=_element_type(fparam.type, empty))
+                if fparam.type is not empty
+                else fparam
+                for fparam in previous
+            ],
+            return_annotation=_element_type(
+                previous.return_annotation,
+                empty.native,
+            ),
+            __validate_parameters__=False,
+        )
+
+    @staticmethod
+    def _make_dispatch(
+            callable: typing.Callable[..., typing.Any]
+        ) -> typing.Callable[[typing.List[tuple]], typing.Any]:
+        """
+        Builds a function that transposes a batch of mapped calls into
+        per-parameter lists, and calls the batch function with them.
+
+        :param callable: the batch function
+        :returns: a function that receives the ``(args, kwargs)`` of each call
+        :raises TypeError: if the batch function has variadic parameters
+        """
+        # pylint: disable=W0622, redefined-builtin
+        signature = inspect.signature(callable)
+        positional, keyword = [], []
+        for param in signature.parameters.values():
+            if param.kind in (POSITIONAL_ONLY, POSITIONAL_OR_KEYWORD):
+                positional.append(param.name)
+            elif param.kind is KEYWORD_ONLY:
+                keyword.append(param.name)
+            else:
+                raise TypeError(
+                    "batched callables cannot have variadic parameter '{}'".\
+                    format(param.name)
+                )
+        npositional = len(positional)
+
+        def dispatch(items):
+            rows = []
+            for args, kwargs in items:
+                if len(args) != npositional or len(kwargs) != len(keyword):
+                    bound = signature.bind(*args, **kwargs)
+                    bound.apply_defaults()
+                    args, kwargs = bound.args, bound.kwargs
+                rows.append((*args, *[kwargs[name] for name in keyword]))
+            columns = [list(column) for column in zip(*rows)]
+            return callable(
+                *columns[:npositional],
+                **dict(zip(keyword, columns[npositional:])),
+            )
+        return dispatch
+
+    @staticmethod
+    def _scatter(batch: _Batch, results: typing.Any) -> None:
+        """
+        Validates and stores the results of the batch function on the batch.
+
+        :param batch: the dispatched batch
+        :param results: the return value of the batch function
+        :raises ValueError: if there isn't one result per call
+        """
+        results = list(results)
+        if len(results) != len(batch.items):
+            raise ValueError(
+                'batch function returned {} results for {} calls'.\
+                format(len(results), len(batch.items))
+            )
+        batch.results = results
+
+    def decorate(
+            self,
+            callable: typing.Callable[..., typing.Any]
+        ) -> typing.Callable[..., typing.Any]:
+        """
+        Wraps the batch function with a function that receives a single call
+        and waits for its result from a batch.
+
+        :param callable: the batch function
+        :returns: a scalar callable
+        """
+        # pylint: disable=W0622, redefined-builtin
+        dispatch = self._make_dispatch(callable)
+        max_size, max_wait = self.max_size, self.max_wait_ms / 1000
+        scatter = self._scatter
+
+        if asyncio.iscoroutinefunction(callable):
+            pending = weakref.WeakKeyDictionary()  # type: typing.MutableMapping
+
+            async def run(batch):
+                try:
+                    scatter(batch, await dispatch(batch.items))
+                except BaseException as exc:
+                    # e.g. a ``CancelledError``, which must reach every caller
+                    for future in batch.futures:
+                        if future.done():
+                            continue
+                        elif isinstance(exc, asyncio.CancelledError):
+                            future.cancel()
+                        else:
+                            future.set_exception(exc)
+                    if not isinstance(exc, Exception):
+                        raise
+                else:
+                    for future, result in zip(batch.futures, batch.results):
+                        if not future.done():
+                            future.set_result(result)
+
+            def flush(loop, batch):
+                if pending.get(loop) is batch:
+                    del pending[loop]
+                batch.handle.cancel()
+                loop.create_task(run(batch))
+
+            @functools.wraps(callable)
+            async def inner(*args, **kwargs):
+                loop = asyncio.get_event_loop()
+                batch = pending.get(loop)
+                if batch is None:
+                    batch = pending[loop] = _Batch()
+                    batch.handle = loop.call_later(max_wait, flush, loop, batch)
+                future = loop.create_future()
+                batch.items.append((args, kwargs))
+                batch.futures.append(future)
+                if len(batch.items) >= max_size:
+                    flush(loop, batch)
+                return await future
+        else:
+            lock = threading.Lock()
+            state = [None]  # type: typing.List[typing.Optional[_Batch]]
+
+            @functools.wraps(callable)  # type: ignore
+            def inner(*args, **kwargs):
+                with lock:
+                    batch = state[0]
+                    leader = batch is None
+                    if leader:
+                        batch = state[0] = _Batch()
+                    index = len(batch.items)
+                    batch.items.append((args, kwargs))
+                    if len(batch.items) >= max_size:
+                        state[0] = None
+                        batch.full.set()
+
+                if leader:
+                    batch.full.wait(max_wait)
+                    with lock:
+                        if state[0] is batch:
+                            state[0] = None
+                    try:
+                        scatter(batch, dispatch(batch.items))
+                    except BaseException as exc:
+                        batch.exception = exc
+                        raise
+                    finally:
+                        batch.done.set()
+                else:
+                    batch.done.wait()
+                    if batch.exception is not None:
+                        raise batch.exception
+                return batch.results[index]
+
+        return inner
+
+
+class batch_converter:  # pylint: disable=C0103, invalid-name
+    """
+    A coroutine converter that gathers the values it receives during an
+    iteration of the event loop, and resolves them with a single call of a
+    batch ``load`` function (i.e. the *dataloader* pattern).
+
+    Values (or their ``key``) are de-duplicated across concurrent calls, and
+    within a :class:`~forge.request_scope` the resolved values are re-used
+    for the duration of the scope.
+
+    .. testcode::
+
+        import asyncio
+        import forge
+
+        loads = []
+
+        async def load_users(ids):
+            loads.append(ids)
+            return [{'id': id} for id in ids]
+
+        @forge.modify('user', converter=forge.batch_converter(load_users))
+        async def get_name(user):
+            return 'user{}'.format(user['id'])
+
+        async def main():
+            async with forge.request_scope():
+                return await asyncio.gather(
+                    get_name(1), get_name(2), get_name(1),
+                )
+
+        assert asyncio.new_event_loop().run_until_complete(main()) == \
+            ['user1', 'user2', 'user1']
+        assert loads == [[1, 2]]
+
+    As the converter is a coroutine callable, it can only be used with
+    coroutine functions; the wrapper awaits the resolved value before
+    calling the underlying callable.
+
+    :param load: a callable (or coroutine function) that receives a list of
+        keys, and returns a sequence of values (one per key, in the same
+        order); an :class:`Exception` instance in lieu of a value is raised
+        to the callers awaiting that key
+    :param max_size: the maximum number of keys per call of ``load``, or
+        ``None`` for unbounded
+    :param key: a callable that receives ``ctx``, ``name`` and ``value`` and
+        returns the hashable key passed to ``load`` (by default ``value`` is
+        used directly)
+    """
+    def __init__(
+            self,
+            load: typing.Callable[[typing.List[typing.Hashable]], typing.Any],
+            *,
+            max_size: typing.Optional[int] = None,
+            key: typing.Optional[
+                typing.Callable[[typing.Any, str, typing.Any], typing.Hashable]
+            ] = None
+        ) -> None:
+        if max_size is not None and max_size < 1:
+            raise ValueError("'max_size' must be None or a positive int")
+        self.load = load
+        self.max_size = max_size
+        self.key = key
+        self._pending = weakref.WeakKeyDictionary()  # type: typing.Any
+
+    def __repr__(self) -> str:
+        return '<{} {}>'.format(
+            type(self).__name__,
+            getattr(self.load, '__qualname__', repr(self.load)),
+        )
+
+    async def __call__(self, ctx: typing.Any, name: str, value: typing.Any):
+        key = self.key(ctx, name, value) if self.key is not None else value
+        scope = request_scope.current()
+        if scope is not None:
+            future = scope.cache.get((self, key))
+            if future is not None:
+                return await asyncio.shield(future)
+
+        loop = asyncio.get_event_loop()
+        queue = self._pending.get(loop)
+        if queue is None:
+            queue = self._pending[loop] = collections.OrderedDict()
+            loop.call_soon(self._flush, loop, queue)
+
+        future = queue.get(key)
+        if future is None:
+            future = queue[key] = loop.create_future()
+            if self.max_size is not None and len(queue) >= self.max_size:
+                self._flush(loop, queue)
+        if scope is not None:
+            scope.cache[(self, key)] = future
+        # Futures are shared; one caller's cancellation mustn't affect others
+        return await asyncio.shield(future)
+
+    def _flush(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            queue: typing.MutableMapping[typing.Hashable, asyncio.Future]
+        ) -> None:
+        """
+        Closes the queue to further keys, and schedules its dispatch.
+
+        :param loop: the event loop of the queue
+        :param queue: an ordered mapping of keys to futures
+        """
+        if self._pending.get(loop) is not queue:
+            # already flushed (e.g. when full)
+            return
+        del self._pending[loop]
+        loop.create_task(self._dispatch(queue))
+
+    async def _dispatch(
+            self,
+            queue: typing.MutableMapping[typing.Hashable, asyncio.Future]
+        ) -> None:
+        """
+        Calls ``load`` with the queued keys, and resolves their futures.
+
+        :param queue: an ordered mapping of keys to futures
+        """
+        keys = list(queue)
+        try:
+            values = self.load(keys)
+            if inspect.isawaitable(values):
+                values = await values
+            values = list(values)
+            if len(values) != len(keys):
+                raise ValueError(
+                    'load function returned {} values for {} keys'.\
+                    format(len(values), len(keys))
+                )
+        except BaseException as exc:
+            # e.g. a ``CancelledError``, which must reach every caller
+            for future in queue.values():
+                if future.done():
+                    continue
+                elif isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        for future, value in zip(queue.values(), values):
+            if future.done():
+                continue
+            elif isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
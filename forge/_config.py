@@ -19,3 +19,79 @@ def set_run_validators(run: bool) -> None:
         raise TypeError("'run' must be bool.")
     global _run_validators
     _run_validators = run
+
+
+_lean_coroutines = False
+
+
+def get_lean_coroutines() -> bool:
+    """
+    Check whether lean wrappers are created for coroutine functions.
+    :returns: whether or not lean coroutine wrappers are created.
+    """
+    return _lean_coroutines
+
+
+def set_lean_coroutines(lean: bool) -> None:
+    """
+    Set whether or not lean wrappers are created for coroutine functions.
+
+    A lean wrapper is a plain function that maps the arguments and returns
+    the underlying coroutine (rather than a coroutine that awaits it), which
+    saves a coroutine object and frame per call. It's marked as a coroutine
+    function, so :func:`asyncio.iscoroutinefunction` and
+    :func:`inspect.iscoroutinefunction` report ``True``. As
+    :func:`inspect.iscoroutinefunction` can only be satisfied on Python 3.12+
+    (with :func:`inspect.markcoroutinefunction`), the setting has no effect on
+    earlier versions, where the wrapper is always an ``async def`` function.
+    As arguments are mapped when the wrapper is called (rather than when the
+    coroutine is awaited), a :exc:`TypeError` for invalid arguments is raised
+    immediately.
+
+    The setting applies to callables revised after it's changed.
+    :param lean: whether lean coroutine wrappers are created
+    """
+    # pylint: disable=W0603, global-statement
+    if not isinstance(lean, bool):
+        raise TypeError("'lean' must be bool.")
+    global _lean_coroutines
+    _lean_coroutines = lean
+
+
+_intern_parameters = False
+
+
+def get_intern_parameters() -> bool:
+    """
+    Check whether identical parameters are interned.
+    :returns: whether or not identical parameters are interned.
+    """
+    return _intern_parameters
+
+
+def set_intern_parameters(intern: bool) -> None:
+    """
+    Set whether or not identical parameters are interned.
+
+    When enabled, the parameter constructors (e.g. :func:`~forge.pos`,
+    :func:`~forge.arg`, :func:`~forge.kwarg` and :func:`~forge.ctx`) and
+    :meth:`~forge.FSignature.from_native` return a shared instance for
+    parameters that are identical (i.e. with the same kind, names, default,
+    type, converters, validators, flags and metadata), so that thousands of
+    wrappers with common parameters share their :class:`~forge.FParameter`
+    instances. Defaults (and metadata values) are identical if they're equal
+    scalars of the same type (e.g. ``None``, ``bool``, ``int``, ``str``), or
+    otherwise the same object; parameters with unhashable types or
+    converters are not interned.
+
+    As a shared instance retains the creation order of its first
+    construction, parameters supplied to :func:`~forge.sign` by keyword may
+    be ordered differently.
+
+    :param intern: whether identical parameters are interned
+    """
+    # pylint: disable=W0603, global-statement
+    if not isinstance(intern, bool):
+        raise TypeError("'intern' must be bool.")
+    global _intern_parameters
+    _intern_parameters = intern
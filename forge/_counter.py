@@ -1,18 +1,21 @@
+import itertools
+
+
 class Counter:
     """
-    A counter whose instances provides an incremental value when called
+    A counter whose instances provides an incremental value when called.
 
-    :ivar count: the next index for creation.
+    Values are drawn from an :func:`itertools.count`, whose ``next`` is a
+    single (atomic) C-level call, so concurrent callers never receive the
+    same value.
     """
-    __slots__ = ('count',)
+    __slots__ = ('_count',)
 
     def __init__(self):
-        self.count = 0
+        self._count = itertools.count()
 
     def __call__(self):
-        count = self.count
-        self.count += 1
-        return count
+        return next(self._count)
 
 
 class CreationOrderMeta(type):
@@ -21,9 +24,15 @@ class CreationOrderMeta(type):
     """
     def __call__(cls, *args, **kwargs):
         ins = super().__call__(*args, **kwargs)
-        object.__setattr__(ins, '_creation_order', ins._creation_counter())
+        # Draw from the underlying count directly, saving a Python-level call
+        # pylint: disable=W0212, protected-access
+        object.__setattr__(
+            ins,
+            '_creation_order',
+            next(ins._creation_counter._count),
+        )
         return ins
 
     def __new__(mcs, name, bases, namespace):
         namespace['_creation_counter'] = Counter()
-        return super().__new__(mcs, name, bases, namespace)
\ No newline at end of file
+        return super().__new__(mcs, name, bases, namespace)
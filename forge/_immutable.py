@@ -1,7 +1,30 @@
+import collections.abc
+import threading
 import typing
 
 from forge._exceptions import ImmutableInstanceError
 
+# Guards the (one-off) compilation of an ``Immutable`` subclass
+_compile_lock = threading.Lock()
+
+
+def fields(cls: type) -> typing.Tuple[str, ...]:
+    """
+    Retrieves the names of the slots of a class and its bases (in the order
+    of the method resolution order, from :class:`object`), excluding
+    ``__weakref__`` and ``__dict__``.
+
+    :param cls: any Python class
+    :returns: the names of the slots of :paramref:`.fields.cls`
+    """
+    names = []  # type: typing.List[str]
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__weakref__', '__dict__') and name not in names:
+                names.append(name)
+    return tuple(names)
+
 
 def asdict(obj) -> typing.Dict:
     """
@@ -43,6 +66,90 @@ def replace(obj, **changes):
     return type(obj)(**dict(asdict(obj), **changes))
 
 
+def restore(cls: type, kwargs: typing.Mapping[str, typing.Any]):
+    """
+    Re-creates an instance of ``cls`` from its initialization arguments; used
+    by ``__reduce__`` methods, as instances can't be unpickled attribute by
+    attribute.
+
+    :param cls: the class to instantiate
+    :param kwargs: the keyword arguments to ``cls``
+    :returns: a new instance of ``cls``
+    """
+    return cls(**kwargs)
+
+
+def _hashable(value: typing.Any) -> typing.Any:
+    """
+    :param value: the value of a field
+    :returns: a hashable equivalent of a mapping (e.g. the
+        :paramref:`~forge.FParameter.metadata` of a parameter), or ``value``
+    """
+    if isinstance(value, collections.abc.Mapping):
+        return frozenset(value.items())
+    return value
+
+
+def _compile(cls: type) -> typing.Dict[str, typing.Callable]:
+    """
+    Generates the field setters, ``__eq__`` and ``__hash__`` methods of an
+    :class:`~forge._immutable.Immutable` subclass, storing them on the class.
+
+    The setters are the ``__set__`` methods of the slot descriptors of the
+    class's :func:`~forge._immutable.fields`, which bypass ``__setattr__``
+    (and the look-up of the slot by name).
+    ``__eq__`` and ``__hash__`` compare (or hash) the public slots of the class
+    as a tuple, consistent with :func:`~forge._immutable.asdict`; mappings
+    are hashed by their items.
+    Methods that the class (rather than :class:`~forge._immutable.Immutable`)
+    defines are left in place.
+
+    :param cls: a subclass of :class:`~forge._immutable.Immutable`
+    :returns: a mapping of the fields of :paramref:`._compile.cls` to their
+        setters
+    """
+    setters = {name: getattr(cls, name).__set__ for name in fields(cls)}
+    slots = cls.__slots__
+    public = ''.join(
+        '{{0}}.{}, '.format(name)
+        for name in ((slots,) if isinstance(slots, str) else slots)
+        if not name.startswith('_')
+    )
+    namespace = {
+        '_cls': cls,
+        '_hashable': _hashable,
+    }  # type: typing.Dict[str, typing.Any]
+    exec('\n'.join([  # pylint: disable=W0122, exec-used
+        'def __eq__(self, other):',
+        '    if not isinstance(other, type(self)):',
+        '        return False',
+        '    return ({}) == ({})'.format(
+            public.format('self'),
+            public.format('other'),
+        ),
+        'def __hash__(self):',
+        '    try:',
+        '        return hash((_cls, {}))'.format(public.format('self')),
+        '    except TypeError:',
+        '        return hash((_cls,) + tuple(map(_hashable, ({}))))'.format(
+            public.format('self'),
+        ),
+    ]), namespace)
+
+    with _compile_lock:
+        for method in ('__eq__', '__hash__'):
+            # i.e. not defined by the class (or a base) other than by compiling
+            if cls is not Immutable and \
+                    getattr(getattr(cls, method), '_generated', False):
+                namespace[method]._generated = True
+                namespace[method].__qualname__ = \
+                    '{}.{}'.format(cls.__qualname__, method)
+                setattr(cls, method, namespace[method])
+        # The owner is stored too, as subclasses inherit the attribute
+        cls._Immutable__setters = (cls, setters)
+    return setters
+
+
 class Immutable:
     """
     A class whose instances lack a ``__setattr__`` method, making them 99%
@@ -55,21 +162,42 @@ class Immutable:
     __slots__ = ()
 
     def __init__(self, **kwargs):
-        for k, v in kwargs.items():
-            object.__setattr__(self, k, v)
+        owner, setters = type(self)._Immutable__setters
+        if owner is not type(self):
+            setters = _compile(type(self))
+        try:
+            for k, v in kwargs.items():
+                setters[k](self, v)
+        except KeyError:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".\
+                format(type(self).__name__, k)
+            ) from None
 
     def __eq__(self, other: typing.Any) -> bool:
-        if not isinstance(other, type(self)):
-            return False
-        return asdict(other) == asdict(self)
-
-    def __getattr__(self, key: str) -> typing.Any:
-        """
-        Solely for placating mypy.
-        Not particularly impressed with this hack but it saves a lot of
-        `#type: ignore` effort elsewhere
-        """
-        return super().__getattribute__(key)
+        # Replaced (per class) by a generated comparison of the fields
+        if type(self) is Immutable:
+            return isinstance(other, Immutable)
+        _compile(type(self))
+        return type(self).__eq__(self, other)
+
+    def __hash__(self) -> int:
+        # Replaced (per class) by a generated hash of the fields
+        if type(self) is Immutable:
+            return hash(Immutable)
+        _compile(type(self))
+        return type(self).__hash__(self)
+
+    __eq__._generated = True  # type: ignore
+    __hash__._generated = True  # type: ignore
+    __setters = (None, {})  # type: typing.Tuple[typing.Any, typing.Dict]
+
+    if typing.TYPE_CHECKING:  # pragma: no cover
+        def __getattr__(self, key: str) -> typing.Any:
+            """
+            Solely for placating mypy (and only defined for type checking, as
+            it slows every failing attribute look-up).
+            """
 
     def __setattr__(self, key: str, value: typing.Any):
         """
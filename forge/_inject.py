@@ -0,0 +1,371 @@
+import threading
+import typing
+
+from forge._marker import empty
+from forge._scope import call_scope, request_scope
+from forge._signature import KEYWORD_ONLY, Factory, FParameter
+
+SCOPES = ('singleton', 'thread', 'request', 'call')
+
+
+class Provider:
+    """
+    Provides a resource (e.g. a database connection or an HTTP session) to
+    parameters created with :func:`~forge.inject`.
+
+    Released resources are retained in a pool (of at most ``pool_size``
+    idle resources), and are re-used by subsequent acquisitions rather
+    than constructed anew. Resources that don't fit in the pool are passed
+    to ``dispose``.
+
+    :param factory: a callable that receives no arguments and returns a new
+        resource
+    :param dispose: a callable that receives a resource that's no longer
+        needed (e.g. ``lambda conn: conn.close()``)
+    :param pool_size: the maximum number of idle resources retained for
+        re-use, or ``None`` for unbounded
+    """
+    __slots__ = (
+        'factory',
+        'dispose',
+        'pool_size',
+        '_idle',
+        '_lock',
+        '_local',
+        '_singleton',
+    )
+
+    def __init__(
+            self,
+            factory: typing.Callable[[], typing.Any],
+            *,
+            dispose: typing.Optional[
+                typing.Callable[[typing.Any], None]
+            ] = None,
+            pool_size: typing.Optional[int] = 8
+        ) -> None:
+        if pool_size is not None and pool_size < 0:
+            raise ValueError("'pool_size' must be None or a non-negative int")
+        self.factory = factory
+        self.dispose = dispose
+        self.pool_size = pool_size
+        self._idle = []  # type: typing.List[typing.Any]
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._singleton = empty  # type: typing.Any
+
+    def __repr__(self) -> str:
+        return '<{} {} ({} idle)>'.format(
+            type(self).__name__,
+            getattr(self.factory, '__qualname__', repr(self.factory)),
+            len(self._idle),
+        )
+
+    def acquire(self) -> typing.Any:
+        """
+        Retrieves an idle resource from the pool, or creates a new resource
+        if the pool is empty.
+
+        :returns: a resource
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self.factory()
+
+    def release(self, resource: typing.Any) -> None:
+        """
+        Returns a resource to the pool, or disposes of it if the pool is full.
+
+        :param resource: a resource obtained from
+            :meth:`~forge.Provider.acquire`
+        """
+        with self._lock:
+            if self.pool_size is None or len(self._idle) < self.pool_size:
+                self._idle.append(resource)
+                return
+        if self.dispose is not None:
+            self.dispose(resource)
+
+    def singleton(self) -> typing.Any:
+        """
+        :returns: the resource shared by every caller, creating it on first use
+        """
+        resource = self._singleton
+        if resource is empty:
+            with self._lock:
+                if self._singleton is empty:
+                    self._singleton = self.factory()
+                resource = self._singleton
+        return resource
+
+    def thread_local(self) -> typing.Any:
+        """
+        :returns: the resource of the current thread, acquiring it on first
+            use
+        """
+        try:
+            return self._local.resource
+        except AttributeError:
+            resource = self._local.resource = self.acquire()
+            return resource
+
+    def close(self) -> None:
+        """
+        Disposes of the idle resources and the singleton resource (if any).
+        Thread-local resources are retained by their threads.
+        """
+        with self._lock:
+            resources, self._idle = self._idle, []
+            if self._singleton is not empty:
+                resources.append(self._singleton)
+                self._singleton = empty
+        if self.dispose is not None:
+            for resource in resources:
+                self.dispose(resource)
+
+
+class ProviderRegistry:
+    """
+    A registry of :class:`~forge.Provider` instances by key, so that
+    :func:`~forge.inject` parameters can be declared before their providers
+    are configured (e.g. in tests, or at application start-up).
+
+    :ivar version: incremented whenever a provider is (re-)registered, so
+        that injected parameters can cache their look-ups
+    """
+    __slots__ = ('version', '_providers', '_lock')
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._providers = {}  # type: typing.Dict[typing.Hashable, Provider]
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._providers
+
+    def __getitem__(self, key: typing.Hashable) -> Provider:
+        try:
+            return self._providers[key]
+        except KeyError:
+            raise LookupError('No provider registered for {!r}'.format(key))
+
+    def register(
+            self,
+            key: typing.Hashable,
+            provider: typing.Union[Provider, typing.Callable[[], typing.Any]]
+        ) -> Provider:
+        """
+        Registers (or replaces) the provider for ``key``.
+
+        :param key: a hashable key (e.g. a ``str`` or a ``type``)
+        :param provider: a :class:`~forge.Provider`, or a callable that
+            returns a new resource (from which a :class:`~forge.Provider` is
+            created)
+        :returns: the registered :class:`~forge.Provider`
+        """
+        if not isinstance(provider, Provider):
+            provider = Provider(provider)
+        with self._lock:
+            self._providers[key] = provider
+            self.version += 1
+        return provider
+
+    def unregister(self, key: typing.Hashable) -> None:
+        """
+        Removes the provider for ``key``.
+
+        :param key: a registered key
+        """
+        with self._lock:
+            self._providers.pop(key, None)
+            self.version += 1
+
+
+providers = ProviderRegistry()
+
+
+class _Resolver:
+    """
+    Obtains the resources of an :class:`~forge._inject.Injection`. It's kept
+    apart from the injection (which retains one of its methods as its
+    ``factory``), so that injections don't reference themselves.
+
+    :param provider: see :paramref:`~forge._inject.Injection.provider`
+    :param registry: see :paramref:`~forge._inject.Injection.registry`
+    """
+    __slots__ = ('provider', 'registry', '_lookup')
+
+    def __init__(
+            self,
+            provider: typing.Union[Provider, typing.Hashable],
+            registry: ProviderRegistry
+        ) -> None:
+        self.provider = provider
+        self.registry = registry
+        # The look-up is cached as ``(provider, registry version)``, where a
+        # version of ``None`` denotes a provider that was supplied directly
+        self._lookup = (provider, None) \
+            if isinstance(provider, Provider) \
+            else (None, -1)
+
+    def resolve(self) -> Provider:
+        """
+        :returns: the :class:`~forge.Provider`, looked up in the ``registry``
+            only if it's changed since the last look-up
+        """
+        provider, version = self._lookup
+        if version is None or version == self.registry.version:
+            return provider
+        version = self.registry.version
+        provider = self.registry[self.provider]
+        # Replaced (rather than mutated) so that concurrent callers never
+        # observe a provider with the version of another
+        self._lookup = (provider, version)
+        return provider
+
+    def get_singleton(self) -> typing.Any:
+        return self.resolve().singleton()
+
+    def get_thread(self) -> typing.Any:
+        return self.resolve().thread_local()
+
+    def get_request(self) -> typing.Any:
+        scope = request_scope.current()
+        if scope is None:
+            return self.get_call()
+
+        provider = self.resolve()
+        key = (Provider, id(provider))
+        cached = scope.cache.get(key)
+        # ``provider`` is retained with the resource, guarding against its
+        # ``id`` being re-used after it's been garbage collected.
+        if cached is not None and cached[0] is provider:
+            return cached[1]
+        resource = provider.acquire()
+        scope.cache[key] = (provider, resource)
+        scope.on_close(lambda: provider.release(resource))
+        return resource
+
+    def get_call(self) -> typing.Any:
+        provider = self.resolve()
+        resource = provider.acquire()
+        scope = call_scope.current()
+        if scope is not None:
+            scope.on_close(lambda: provider.release(resource))
+        return resource
+
+
+class Injection(Factory):
+    """
+    The default :class:`~forge.Factory` of a parameter created with
+    :func:`~forge.inject`, which obtains a resource from a
+    :class:`~forge.Provider` for the lifetime of its ``scope``.
+
+    :param provider: a :class:`~forge.Provider`, or the key of a provider in
+        ``registry``
+    :param scope: one of ``'singleton'``, ``'thread'``, ``'request'`` or
+        ``'call'``
+    :param registry: the :class:`~forge.ProviderRegistry` in which to look up
+        ``provider`` (if it's a key)
+    """
+    __slots__ = ('provider', 'scope', 'registry')
+
+    def __init__(
+            self,
+            provider: typing.Union[Provider, typing.Hashable],
+            scope: str = 'call',
+            registry: ProviderRegistry = providers
+        ) -> None:
+        # pylint: disable=W0231, super-init-not-called
+        if scope not in SCOPES:
+            raise ValueError(
+                "'scope' must be one of {}".format(', '.join(SCOPES))
+            )
+        resolver = _Resolver(provider, registry)
+        super(Factory, self).__init__(
+            factory=getattr(resolver, 'get_' + scope),
+            scoped=False,
+            provider=provider,
+            scope=scope,
+            registry=registry,
+        )
+
+    def __repr__(self) -> str:
+        return '<{} {!r} ({})>'.format(
+            type(self).__name__,
+            self.provider,
+            self.scope,
+        )
+
+    def __call__(self) -> typing.Any:
+        return self.factory()
+
+
+def inject(
+        name: str,
+        provider: typing.Union[Provider, typing.Hashable],
+        *,
+        scope: str = 'call',
+        interface_name: typing.Optional[str] = None,
+        type: typing.Any = empty,
+        registry: ProviderRegistry = providers
+    ) -> FParameter:
+    """
+    Creates a ``bound`` :term:`keyword-only` :class:`~forge.FParameter`
+    whose argument is a resource obtained from a :class:`~forge.Provider`.
+    Injected parameters aren't part of the public signature.
+
+    The ``scope`` determines the lifetime of the resource:
+
+    - ``'singleton'``: a single resource is shared by every call
+    - ``'thread'``: a resource is shared by the calls in each thread
+    - ``'request'``: a resource is shared by the calls within the current \
+    :class:`~forge.request_scope`, and released when the scope exits \
+    (without a current scope, ``'call'`` applies)
+    - ``'call'``: a resource is acquired for each call, and released when \
+    the underlying callable returns
+
+    Resources are acquired from (and released to) the provider's pool, and
+    ``provider`` keys are looked up in the ``registry`` only when it changes.
+
+    .. testcode::
+
+        import forge
+
+        connections = []
+
+        def connect():
+            connections.append(object())
+            return connections[-1]
+
+        pool = forge.Provider(connect)
+
+        @forge.sign(forge.arg('sql'), forge.inject('conn', pool))
+        def query(sql, conn):
+            return conn
+
+        assert forge.repr_callable(query) == 'query(sql)'
+        assert query('SELECT 1') is query('SELECT 2')
+        assert len(connections) == 1
+
+    :param name: the name of the parameter on the underlying callable
+    :param provider: a :class:`~forge.Provider`, or the key of a provider in
+        ``registry``
+    :param scope: one of ``'singleton'``, ``'thread'``, ``'request'`` or
+        ``'call'``
+    :param interface_name: see :paramref:`~forge.FParameter.interface_name`
+    :param type: see :paramref:`~forge.FParameter.type`
+    :param registry: the :class:`~forge.ProviderRegistry` in which to look up
+        ``provider`` (if it's a key); by default ``forge.providers``
+    :returns: a ``bound`` :class:`~forge.FParameter`
+    """
+    # pylint: disable=W0622, redefined-builtin
+    return FParameter(
+        kind=KEYWORD_ONLY,
+        name=name,
+        interface_name=interface_name,
+        default=Injection(provider, scope=scope, registry=registry),
+        type=type,
+        bound=True,
+    )
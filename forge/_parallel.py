@@ -0,0 +1,357 @@
+import asyncio
+import collections
+import collections.abc
+import concurrent.futures
+import itertools
+import os
+import typing
+
+from forge._recipe import picklable
+from forge._utils import CallArguments
+
+_TYPE_ROW = typing.Any
+
+
+def _split_row(
+        row: _TYPE_ROW
+    ) -> typing.Tuple[typing.Tuple[typing.Any, ...], typing.Mapping]:
+    """
+    Splits a row into (picklable) positional and keyword arguments:
+
+    - a :class:`~forge._utils.CallArguments` provides both,
+    - a mapping provides keyword arguments,
+    - a tuple provides positional arguments, and
+    - any other value is the sole positional argument.
+
+    :param row: the arguments of a call
+    :returns: the positional and keyword arguments
+    """
+    if isinstance(row, CallArguments):
+        return row.args, dict(row.kwargs)
+    elif isinstance(row, collections.abc.Mapping):
+        return (), row
+    elif isinstance(row, tuple):
+        return row, {}
+    return (row,), {}
+
+
+def _call_chunk(
+        func: typing.Callable[..., typing.Any],
+        chunk: typing.List[typing.Tuple[typing.Tuple, typing.Mapping]]
+    ) -> typing.List[typing.Any]:
+    """
+    Calls ``func`` with each row of ``chunk``; runs in a worker process.
+
+    :param func: a (picklable) revised callable
+    :param chunk: the positional and keyword arguments of each call
+    :returns: the results, in the order of ``chunk``
+    """
+    return [func(*args, **kwargs) for args, kwargs in chunk]
+
+
+def _chunked(
+        rows: typing.Iterable[typing.Any],
+        chunk_size: int
+    ) -> typing.Iterator[typing.List[typing.Any]]:
+    """
+    :param rows: an iterable of rows
+    :param chunk_size: the maximum number of rows per chunk
+    :returns: an iterator of lists of (at most ``chunk_size``) rows
+    """
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parallel_map(
+        wrapper: typing.Callable[..., typing.Any],
+        rows: typing.Iterable[_TYPE_ROW],
+        *,
+        workers: typing.Optional[int] = None,
+        chunk_size: int = 64,
+        ordered: bool = True
+    ) -> typing.Iterator[typing.Any]:
+    """
+    Calls a revised callable with each row of arguments in a pool of worker
+    processes, so that the arguments are mapped (i.e. bound, converted and
+    validated) and the underlying callable is called on multiple cores.
+
+    Rows are sent to the workers in chunks (of ``chunk_size`` rows), and the
+    revised callable is sent by reference or by recipe (see
+    :func:`~forge.picklable`), so its :class:`~forge.Mapper` is built once
+    per worker.
+
+    Each row is a :class:`~forge._utils.CallArguments`, a mapping of keyword
+    arguments, a tuple of positional arguments, or the sole positional
+    argument.
+
+    .. testcode::
+
+        import operator
+        import forge
+
+        add_ten = forge.modify('b', default=10)(operator.add)
+        assert list(forge.parallel_map(add_ten, range(4), chunk_size=2)) == \
+            [10, 11, 12, 13]
+
+    Rows are consumed lazily: at most ``workers * 2`` chunks are in flight at
+    a time, and another is submitted as each is yielded, so ``rows`` may be
+    a large (or unbounded) iterator.
+
+    If a call raises, the exception is raised when its result would be
+    yielded, and the remaining calls are cancelled.
+
+    :param wrapper: a revised (synchronous) callable
+    :param rows: an iterable of rows of arguments
+    :param workers: the number of worker processes (by default, the number
+        of processors)
+    :param chunk_size: the number of rows sent to a worker at a time
+    :param ordered: whether results are yielded in the order of ``rows``, or
+        as each chunk is completed
+    :returns: an iterator of results
+    :raises TypeError: if ``wrapper`` is a coroutine function
+    :raises ValueError: if ``chunk_size`` isn't a positive int
+    """
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be a positive int")
+    if asyncio.iscoroutinefunction(wrapper):
+        raise TypeError(
+            'parallel_map requires a synchronous callable, not {}'.format(
+                wrapper,
+            )
+        )
+    func = picklable(wrapper)
+    return _parallel_map(func, rows, workers, chunk_size, ordered)
+
+
+def _parallel_map(
+        func: typing.Callable[..., typing.Any],
+        rows: typing.Iterable[_TYPE_ROW],
+        workers: typing.Optional[int],
+        chunk_size: int,
+        ordered: bool
+    ) -> typing.Iterator[typing.Any]:
+    """
+    The generator of :func:`~forge.parallel_map` (which validates its
+    arguments eagerly).
+    """
+    workers = workers or os.cpu_count() or 1
+    executor = concurrent.futures.ProcessPoolExecutor(workers)
+    chunks = _chunked(map(_split_row, rows), chunk_size)
+    # The futures in flight, in the order of ``rows``
+    futures = collections.deque()  # type: typing.Deque
+    try:
+        for chunk in itertools.islice(chunks, workers * 2):
+            futures.append(executor.submit(_call_chunk, func, chunk))
+        while futures:
+            if ordered:
+                done = [futures.popleft()]
+            else:
+                done = concurrent.futures.wait(
+                    futures,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                ).done
+                futures = collections.deque(
+                    future for future in futures if future not in done
+                )
+            for future in done:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    futures.append(executor.submit(_call_chunk, func, chunk))
+                yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+class amap:  # pylint: disable=C0103, invalid-name
+    """
+    An asynchronous iterator that awaits a revised coroutine function with
+    each row of arguments, running at most ``concurrency`` calls at a time.
+
+    Calls are made by a fixed pool of ``concurrency`` tasks that pull rows
+    from ``rows`` (lazily) as they become idle, rather than a task per row.
+    When results are yielded in order, only the rows within
+    ``concurrency * 2`` of the next result are called (and each idle task
+    holds at most one more), so a slow row holds up later calls rather than
+    their results accumulating.
+    Each row is a :class:`~forge._utils.CallArguments`, a mapping of keyword
+    arguments, a tuple of positional arguments, or the sole positional
+    argument.
+
+    .. testcode::
+
+        import asyncio
+        import forge
+
+        @forge.sign(forge.arg('a'), forge.arg('b', default=10))
+        async def multiply(a, b):
+            await asyncio.sleep(0)
+            return a * b
+
+        async def main():
+            results = []
+            async with forge.amap(multiply, range(4), concurrency=2) as it:
+                async for result in it:
+                    results.append(result)
+            return results
+
+        assert asyncio.new_event_loop().run_until_complete(main()) == \
+            [0, 10, 20, 30]
+
+    If a call raises, the exception is raised when its result would be
+    yielded, and the remaining calls are cancelled. Exiting the
+    ``async with`` block (or calling :meth:`~forge.amap.aclose`), or
+    cancelling the task that iterates, also cancels the remaining calls.
+
+    :param wrapper: a revised coroutine function
+    :param rows: an iterable of rows of arguments
+    :param concurrency: the maximum number of concurrent calls
+    :param ordered: whether results are yielded in the order of ``rows``, or
+        as completed
+    :raises TypeError: if ``wrapper`` isn't a coroutine function
+    :raises ValueError: if ``concurrency`` isn't a positive int
+    """
+    __slots__ = (
+        'wrapper',
+        'concurrency',
+        'ordered',
+        '_rows',
+        '_tasks',
+        '_queue',
+        '_buffer',
+        '_index',
+        '_advanced',
+        '_running',
+    )
+
+    def __init__(
+            self,
+            wrapper: typing.Callable[..., typing.Awaitable],
+            rows: typing.Iterable[_TYPE_ROW],
+            *,
+            concurrency: int = 8,
+            ordered: bool = True
+        ) -> None:
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be a positive int")
+        if not asyncio.iscoroutinefunction(wrapper):
+            raise TypeError(
+                'amap requires a coroutine function, not {}'.format(wrapper)
+            )
+        self.wrapper = wrapper
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self._rows = enumerate(map(_split_row, rows))
+        # ``None`` until iteration starts, and empty once closed
+        self._tasks = None  # type: typing.Optional[typing.List[asyncio.Future]]
+        self._queue = None  # type: typing.Optional[asyncio.Queue]
+        self._buffer = {}  # type: typing.Dict[int, typing.Tuple]
+        self._index = 0
+        # Set as ``_index`` advances (see ``_work``)
+        self._advanced = None  # type: typing.Optional[asyncio.Event]
+        self._running = 0
+
+    def __repr__(self) -> str:
+        return '<{} {!r} ({} running)>'.format(
+            type(self).__name__,
+            self.wrapper,
+            self._running,
+        )
+
+    def __aiter__(self) -> 'amap':
+        return self
+
+    async def __anext__(self) -> typing.Any:
+        if self._tasks is None:
+            self._queue = asyncio.Queue(self.concurrency)
+            self._advanced = asyncio.Event()
+            self._tasks = [
+                asyncio.ensure_future(self._work())
+                for _ in range(self.concurrency)
+            ]
+            self._running = self.concurrency
+
+        while True:
+            if self._index in self._buffer:
+                value, failed = self._buffer.pop(self._index)
+                self._index += 1
+                self._advanced.set()
+                return await self._result(value, failed)
+            if not self._running:
+                raise StopAsyncIteration
+
+            try:
+                item = await self._queue.get()
+            except asyncio.CancelledError:
+                await self.aclose()
+                raise
+            if item is None:
+                self._running -= 1
+            elif item[0] is None or not self.ordered:
+                return await self._result(*item[1:])
+            else:
+                self._buffer[item[0]] = item[1:]
+
+    async def __aenter__(self) -> 'amap':
+        return self
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.aclose()
+
+    async def _work(self) -> None:
+        """
+        Awaits the :paramref:`~forge.amap.wrapper` with rows until they're
+        exhausted, queueing ``(index, value, failed)`` for each call, and
+        ``None`` once done.
+        """
+        try:
+            for index, (args, kwargs) in self._rows:
+                # In order, rows are read a bounded distance ahead of the next
+                # result to yield, so slow rows don't fill the buffer
+                while self.ordered and \
+                        index - self._index >= self.concurrency * 2:
+                    self._advanced.clear()
+                    await self._advanced.wait()
+                try:
+                    item = (index, await self.wrapper(*args, **kwargs), False)
+                except BaseException as exc:
+                    # e.g. a ``CancelledError`` raised by the call, unless
+                    # this worker was cancelled by closing
+                    if not self._tasks:
+                        raise
+                    item = (index, exc, True)
+                await self._queue.put(item)
+        except Exception as exc:  # pylint: disable=W0703, broad-except
+            # i.e. iterating ``rows`` raised
+            await self._queue.put((None, exc, True))
+        finally:
+            if self._tasks:
+                await self._queue.put(None)
+
+    async def _result(self, value: typing.Any, failed: bool) -> typing.Any:
+        """
+        :param value: the result of a call, or the exception it raised
+        :param failed: whether the call raised
+        :returns: the result of the call
+        :raises Exception: the exception raised by the call (after closing)
+        """
+        if failed:
+            await self.aclose()
+            raise value
+        return value
+
+    async def aclose(self) -> None:
+        """
+        Cancels the remaining calls; iteration then stops.
+        """
+        tasks, self._tasks = self._tasks or [], []
+        self._running = 0
+        self._buffer.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,165 @@
+import hashlib
+import pickle
+import sys
+import threading
+import typing
+
+from forge._revision import Revision
+from forge._signature import FSignature
+
+# Revised callables re-built from recipes, by digest, so that each process
+# compiles a recipe's mapper once
+_recipes = {}  # type: typing.Dict[str, Recipe]
+_recipes_lock = threading.Lock()
+
+
+def _resolve_name(obj: typing.Any) -> typing.Any:
+    """
+    :param obj: an object with ``__module__`` and ``__qualname__`` attributes
+    :returns: the object found at ``obj.__module__`` and ``obj.__qualname__``
+        (i.e. the object that :mod:`pickle` loads in lieu of ``obj``), or
+        ``None``
+    """
+    module = sys.modules.get(getattr(obj, '__module__', None))
+    qualname = getattr(obj, '__qualname__', None)
+    if module is None or not qualname or '<locals>' in qualname:
+        return None
+
+    found = module
+    for part in qualname.split('.'):
+        found = getattr(found, part, None)
+    return found
+
+
+def is_referenceable(obj: typing.Any) -> bool:
+    """
+    Determines whether :mod:`pickle` can pickle an object (e.g. a function)
+    by reference to its module-level name.
+
+    :param obj: the object to pickle
+    :returns: whether ``obj`` is found at its module-level name
+    """
+    return _resolve_name(obj) is obj
+
+
+class _Replay(Revision):
+    """
+    Revision that replaces the signature with a known
+    :class:`~forge.FSignature`; used to re-build a revised callable from a
+    :class:`~forge._recipe.Recipe`.
+
+    :param fsignature: the :class:`~forge.FSignature` of the revised callable
+    """
+    def __init__(self, fsignature: FSignature) -> None:
+        self.fsignature = fsignature
+
+    def revise(self, previous: FSignature) -> FSignature:
+        return self.fsignature
+
+
+class Recipe:
+    """
+    A picklable stand-in for a revised callable that isn't found at its
+    module-level name (e.g. the result of revising a function that's
+    defined elsewhere). Calls are routed to the revised callable.
+
+    A recipe pickles by reference to the underlying callable, and the
+    revised :class:`~forge.FSignature`. On unpickling, the revised callable
+    is re-built once per process, and cached.
+
+    :param callable: a revised callable (i.e. with a ``__mapper__``)
+    :raises TypeError: if ``callable`` isn't a revised callable
+    :raises pickle.PicklingError: if the underlying callable isn't found at
+        its module-level name (as either the underlying callable, or a
+        revised callable that wraps it)
+
+    :ivar wrapper: the revised callable
+    """
+    __slots__ = ('wrapper', '_payload')
+
+    def __init__(self, callable: typing.Callable[..., typing.Any]) -> None:
+        # pylint: disable=W0622, redefined-builtin
+        if not hasattr(callable, '__mapper__'):
+            raise TypeError(
+                '{} is not a revised callable'.format(callable)
+            )
+        self.wrapper = callable
+        self._payload = None  # type: typing.Optional[bytes]
+
+    def __repr__(self) -> str:
+        return '<{} {!r}>'.format(type(self).__name__, self.wrapper)
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        return self.wrapper(*args, **kwargs)
+
+    def __reduce__(self):
+        if self._payload is None:
+            underlying = self.wrapper.__wrapped__
+            if is_referenceable(underlying):
+                reference, unwrap = underlying, False
+            else:
+                # e.g. the function was revised where it's defined
+                reference = _resolve_name(underlying)
+                if getattr(reference, '__wrapped__', None) is not underlying:
+                    raise pickle.PicklingError(
+                        "Can't pickle {!r}: the underlying callable isn't "
+                        "found at its module-level name".format(self.wrapper)
+                    )
+                unwrap = True
+            self._payload = pickle.dumps(
+                (reference, unwrap, self.wrapper.__mapper__.fsignature),
+            )
+        digest = hashlib.sha1(self._payload).hexdigest()
+        return (_load_recipe, (digest, self._payload))
+
+
+def _load_recipe(digest: str, payload: bytes) -> Recipe:
+    """
+    Loads a :class:`~forge._recipe.Recipe`, re-building the revised callable
+    only if it isn't cached.
+
+    :param digest: the digest of ``payload``
+    :param payload: the pickled underlying callable (or a wrapper of it),
+        whether to unwrap it, and the revised :class:`~forge.FSignature`
+    :returns: the :class:`~forge._recipe.Recipe`
+    """
+    recipe = _recipes.get(digest)
+    if recipe is None:
+        reference, unwrap, fsignature = pickle.loads(payload)
+        underlying = reference.__wrapped__ if unwrap else reference
+        recipe = Recipe(_Replay(fsignature)(underlying))
+        recipe._payload = payload  # pylint: disable=W0212, protected-access
+        with _recipes_lock:
+            recipe = _recipes.setdefault(digest, recipe)
+    return recipe
+
+
+def picklable(callable: typing.Callable[..., typing.Any]) -> typing.Callable:
+    """
+    Prepares a revised callable for pickling (e.g. for use with a
+    :class:`concurrent.futures.ProcessPoolExecutor`).
+
+    Revised callables that are found at their module-level name (e.g.
+    decorated module-level functions) already pickle by reference, and are
+    returned unchanged. Otherwise, a :class:`~forge._recipe.Recipe` is
+    returned, which pickles by reference to the underlying callable and the
+    revised :class:`~forge.FSignature`; each process re-builds the revised
+    callable once, and caches it.
+
+    .. testcode::
+
+        import operator
+        import pickle
+        import forge
+
+        add_one = forge.modify('b', default=1)(operator.add)
+        restored = pickle.loads(pickle.dumps(forge.picklable(add_one)))
+        assert restored(2) == 3
+
+    :param callable: a revised callable
+    :returns: a picklable equivalent of ``callable``
+    """
+    # pylint: disable=W0622, redefined-builtin
+    if is_referenceable(callable):
+        return callable
+    return Recipe(callable)
@@ -1,23 +1,180 @@
 import asyncio
 import functools
 import inspect
+import itertools
+import threading
 import types
 import typing
+import weakref
 
 import forge._immutable as immutable
+from forge._config import get_lean_coroutines
+from forge._inject import Injection
 from forge._marker import _void, empty
+from forge._scope import call_scope
 from forge._signature import (
     _TYPE_FINDITER_SELECTOR,
     FParameter,
     FSignature,
+    Selector,
     fsignature,
-    findparam,
     _get_pk_string,
+    _identity,
+    _value_key,
     get_context_parameter,
     get_var_keyword_parameter,
     get_var_positional_parameter,
 )
-from forge._utils import CallArguments
+from forge._utils import CallArguments, markcoroutinefunction
+
+
+# Interned plans, by the identity of their signatures
+_plans = weakref.WeakValueDictionary()  # type: typing.MutableMapping
+_plans_lock = threading.Lock()
+
+
+class MapperPlan(immutable.Immutable):
+    """
+    The callable-independent part of a :class:`~forge.Mapper`: the strategy
+    for mapping arguments from an :class:`~forge.FSignature` to a (private)
+    :class:`inspect.Signature`.
+
+    Plans are interned by :meth:`~forge._revision.MapperPlan.get`, so that
+    wrappers that map the same public signature to the same private signature
+    share a plan.
+
+    :param fsignature: an instance of :class:`~forge.FSignature` that provides
+        the public and private interface.
+    :param private_signature: the :class:`inspect.Signature` of the
+        underlying callable
+
+    :ivar call_scoped: whether any parameter of the
+        :paramref:`~forge._revision.MapperPlan.fsignature` is injected with a
+        ``'call'`` scope, or a ``'request'`` scope (which applies ``'call'``
+        outside a :class:`~forge.request_scope`; see :func:`~forge.inject`),
+        requiring the call to be made within a
+        :class:`~forge._scope.call_scope`
+    :ivar context_param: the context :class:`~forge.FParameter` (or ``None``)
+    :ivar fsignature: see :paramref:`~forge._revision.MapperPlan.fsignature`
+    :ivar is_async: whether any parameter of the
+        :paramref:`~forge._revision.MapperPlan.fsignature` has a coroutine
+        factory, converters or validators, requiring arguments to be mapped with
+        :meth:`~forge.Mapper.resolve`
+    :ivar parameter_map: a :class:`types.MappingProxy` that exposes the strategy
+        of how to map from the
+        :paramref:`~forge._revision.MapperPlan.fsignature` to the
+        :paramref:`~forge._revision.MapperPlan.private_signature`
+    :ivar private_signature: see
+        :paramref:`~forge._revision.MapperPlan.private_signature`
+    :ivar public_signature: a cached copy of
+        :paramref:`~forge._revision.MapperPlan.fsignature`'s manifest as a
+        :class:`inspect.Signature`
+    """
+    __slots__ = (
+        'call_scoped',
+        'context_param',
+        'fsignature',
+        'is_async',
+        'parameter_map',
+        'private_signature',
+        'public_signature',
+        '__weakref__',
+    )
+
+    def __init__(
+            self,
+            fsignature: FSignature,
+            private_signature: inspect.Signature,
+        ) -> None:
+        super().__init__(
+            call_scoped=any(
+                isinstance(fparam.default, Injection) and \
+                fparam.default.scope in ('call', 'request')
+                for fparam in fsignature
+            ),
+            context_param=get_context_parameter(fsignature),
+            fsignature=fsignature,
+            is_async=any(fparam.is_async for fparam in fsignature),
+            parameter_map=Mapper.map_parameters(fsignature, private_signature),
+            private_signature=private_signature,
+            public_signature=fsignature.native,
+        )
+
+    @classmethod
+    def get(
+            cls,
+            fsignature: FSignature,
+            private_signature: inspect.Signature,
+        ) -> 'MapperPlan':
+        """
+        Retrieves the shared plan for mapping ``fsignature`` to
+        ``private_signature``, creating it if necessary.
+        Defaults (other than scalars) are compared by identity, as the plan
+        supplies them (see :func:`~forge._signature._value_key`), and
+        signatures with unhashable parts (e.g. an annotation of ``[]``) have a
+        plan of their own.
+
+        :param fsignature: see
+            :paramref:`~forge._revision.MapperPlan.fsignature`
+        :param private_signature: see
+            :paramref:`~forge._revision.MapperPlan.private_signature`
+        :returns: an instance of :class:`~forge._revision.MapperPlan`
+        """
+        # The plan retains the signatures, and so the keys of their defaults
+        # remain valid while it's interned
+        key = (
+            tuple(_identity(fparam) for fparam in fsignature),
+            fsignature.return_annotation,
+            tuple(
+                (
+                    param.name,
+                    param.kind,
+                    _value_key(param.default),
+                    param.annotation,
+                ) for param in private_signature.parameters.values()
+            ),
+            private_signature.return_annotation,
+        )
+        try:
+            plan = _plans.get(key)
+        except TypeError:
+            return cls(fsignature, private_signature)
+        if plan is None:
+            plan = cls(fsignature, private_signature)
+            with _plans_lock:
+                plan = _plans.setdefault(key, plan)
+        return plan
+
+    def assign(
+            self,
+            private_ba: inspect.BoundArguments,
+            from_param: FParameter,
+            to_val: typing.Any
+        ) -> None:
+        """
+        Maps a transformed argument value into the private bound arguments.
+
+        :param private_ba: the private :class:`inspect.BoundArguments`
+        :param from_param: the :class:`~forge.FParameter` of the value
+        :param to_val: the transformed argument value
+        """
+        to_name = self.parameter_map[from_param.name]
+        to_param = self.private_signature.parameters[to_name]
+
+        if to_param.kind is FParameter.VAR_POSITIONAL:
+            # e.g. f(*args) -> g(*args)
+            private_ba.arguments[to_name] = to_val
+        elif to_param.kind is FParameter.VAR_KEYWORD:
+            if from_param.kind is FParameter.VAR_KEYWORD:
+                # e.g. f(**kwargs) -> g(**kwargs)
+                private_ba.arguments[to_name].update(to_val)
+            else:
+                # e.g. f(a) -> g(**kwargs)
+                private_ba.arguments[to_name]\
+                    [from_param.interface_name] = to_val
+        else:
+            # e.g. f(a) -> g(a)
+            private_ba.arguments[to_name] = to_val
 
 
 class Mapper(immutable.Immutable):
@@ -25,13 +182,32 @@ class Mapper(immutable.Immutable):
     An immutable data structure that provides the recipe for mapping
     an :class:`~forge.FSignature` to an underlying callable.
 
+    The callable-independent part of the recipe (the
+    :class:`~forge._revision.MapperPlan`) is shared by mappers of callables
+    with identical signatures, so each mapper only retains its callable.
+
     :param fsignature: an instance of :class:`~forge.FSignature` that provides
         the public and private interface.
     :param callable: a callable that ultimately receives the arguments provided
         to public :class:`~forge.FSignature` interface.
 
+    :ivar bound_values: pairs of the names of ``bound`` parameters and the
+        values that the mapper supplies for them, in lieu of their defaults
+        (see :class:`~forge.template`)
     :ivar callable: see :paramref:`~forge._signature.Mapper.callable`
+    :ivar plan: the (shared) :class:`~forge._revision.MapperPlan`, which
+        provides the remaining attributes
+    :ivar call_scoped: whether any parameter of the
+        :paramref:`~forge._signature.Mapper.fsignature` is injected with a
+        ``'call'`` scope, or a ``'request'`` scope (which applies ``'call'``
+        outside a :class:`~forge.request_scope`; see :func:`~forge.inject`),
+        requiring the call to be made within a
+        :class:`~forge._scope.call_scope`
     :ivar fsignature: see :paramref:`~forge._signature.Mapper.fsignature`
+    :ivar is_async: whether any parameter of the
+        :paramref:`~forge._signature.Mapper.fsignature` has a coroutine
+        factory, converters or validators, requiring arguments to be mapped with
+        :meth:`~forge.Mapper.resolve`
     :ivar parameter_map: a :class:`types.MappingProxy` that exposes the strategy
         of how to map from the :paramref:`.Mapper.fsignature` to the
         :paramref:`.Mapper.callable`
@@ -42,14 +218,7 @@ class Mapper(immutable.Immutable):
         :paramref:`~forge._signature.Mapper.fsignature`'s manifest as a
         :class:`inspect.Signature`
     """
-    __slots__ = (
-        'callable',
-        'context_param',
-        'fsignature',
-        'parameter_map',
-        'private_signature',
-        'public_signature',
-    )
+    __slots__ = ('bound_values', 'callable', 'plan')
 
     def __init__(
             self,
@@ -57,19 +226,38 @@ class Mapper(immutable.Immutable):
             callable: typing.Callable[..., typing.Any],
         ) -> None:
         # pylint: disable=W0622, redefined-builtin
-        # pylint: disable=W0621, redefined-outer-name
-        private_signature = inspect.signature(callable)
-        public_signature = fsignature.native
-        parameter_map = self.map_parameters(fsignature, private_signature)
-        context_param = get_context_parameter(fsignature)
-
         super().__init__(
+            bound_values=(),
             callable=callable,
-            context_param=context_param,
-            fsignature=fsignature,
-            private_signature=private_signature,
-            public_signature=public_signature,
-            parameter_map=parameter_map,
+            plan=MapperPlan.get(fsignature, inspect.signature(callable)),
+        )
+
+    call_scoped = property(lambda self: self.plan.call_scoped)
+    context_param = property(lambda self: self.plan.context_param)
+    is_async = property(lambda self: self.plan.is_async)
+    parameter_map = property(lambda self: self.plan.parameter_map)
+    private_signature = property(lambda self: self.plan.private_signature)
+    public_signature = property(lambda self: self.plan.public_signature)
+
+    @property
+    def fsignature(self) -> FSignature:
+        """
+        The :class:`~forge.FSignature` of the plan, with the
+        :attr:`~forge.Mapper.bound_values` as the defaults of their parameters
+        """
+        fsignature = self.plan.fsignature
+        if not self.bound_values:
+            return fsignature
+        values = dict(self.bound_values)
+        # https://github.com/python/mypy/issues/5156
+        return fsignature.replace(  # type: ignore
+            parameters=[
+                param.replace(default=values[param.name]) \
+                    if param.name in values \
+                    else param
+                for param in fsignature
+            ],
+            __validate_parameters__=False,
         )
 
     def __call__(
@@ -103,8 +291,117 @@ class Mapper(immutable.Immutable):
             :paramref:`~forge.Mapper.public_signature` to
             :paramref:`~forge.Mapper.private_signature`
         """
+        args, kwargs = self._map(args, kwargs)
+        return CallArguments(*args, **kwargs)
+
+    async def resolve(
+            self,
+            *args: typing.Any,
+            **kwargs: typing.Any
+        ) -> CallArguments:
+        """
+        The coroutine counterpart of :meth:`~forge.Mapper.__call__`, for
+        an :paramref:`~forge.Mapper.fsignature` with parameters that have
+        coroutine factories, converters or validators (see
+        :attr:`~forge.FParameter.is_async`).
+        The arguments of such parameters are resolved concurrently (with
+        :func:`asyncio.gather`).
+
+        :param args: the positional arguments to map
+        :param kwargs: the keyword arguments to map
+        :returns: transformed :paramref:`~forge.Mapper.resolve.args` and
+            :paramref:`~forge.Mapper.resolve.kwargs` mapped from
+            :paramref:`~forge.Mapper.public_signature` to
+            :paramref:`~forge.Mapper.private_signature`
+        """
+        args, kwargs = await self._resolve(args, kwargs)
+        return CallArguments(*args, **kwargs)
+
+    def _map(
+            self,
+            args: typing.Tuple[typing.Any, ...],
+            kwargs: typing.Dict[str, typing.Any]
+        ) -> typing.Tuple[typing.Tuple[typing.Any, ...], typing.Dict]:
+        """
+        The implementation of :meth:`~forge.Mapper.__call__`, which returns
+        the mapped arguments as a plain pair of ``(args, kwargs)`` (rather than
+        as a :class:`~forge.CallArguments`), for the revised callable to unpack.
+
+        :param args: the positional arguments to map
+        :param kwargs: the keyword arguments to map
+        :returns: the mapped positional and keyword arguments
+        """
+        plan = self.plan
+        public_ba, private_ba, ctx = self._bind(args, kwargs)
+        for from_param in plan.fsignature:
+            from_val = public_ba.arguments.get(from_param.name, empty)
+            plan.assign(private_ba, from_param, from_param(ctx, from_val))
+        return private_ba.args, private_ba.kwargs
+
+    async def _resolve(
+            self,
+            args: typing.Tuple[typing.Any, ...],
+            kwargs: typing.Dict[str, typing.Any]
+        ) -> typing.Tuple[typing.Tuple[typing.Any, ...], typing.Dict]:
+        """
+        The implementation of :meth:`~forge.Mapper.resolve`, which returns the
+        mapped arguments as a plain pair of ``(args, kwargs)`` (see
+        :meth:`~forge.Mapper._map`).
+
+        :param args: the positional arguments to map
+        :param kwargs: the keyword arguments to map
+        :returns: the mapped positional and keyword arguments
+        """
+        plan = self.plan
+        public_ba, private_ba, ctx = self._bind(args, kwargs)
+        fparams = list(plan.fsignature)
+        to_vals = []
+        pending = []
+        try:
+            for i, from_param in enumerate(fparams):
+                from_val = public_ba.arguments.get(from_param.name, empty)
+                if from_param.is_async:
+                    to_vals.append(empty)
+                    pending.append((i, from_param.resolve(ctx, from_val)))
+                else:
+                    to_vals.append(from_param(ctx, from_val))
+        except BaseException:
+            # Avoid 'coroutine ... was never awaited' warnings
+            for _, coro in pending:
+                coro.close()
+            raise
+
+        if pending:
+            resolved = await asyncio.gather(*[coro for _, coro in pending])
+            for (i, _), to_val in zip(pending, resolved):
+                to_vals[i] = to_val
+
+        for from_param, to_val in zip(fparams, to_vals):
+            plan.assign(private_ba, from_param, to_val)
+        return private_ba.args, private_ba.kwargs
+
+    def _bind(
+            self,
+            args: typing.Tuple[typing.Any, ...],
+            kwargs: typing.Dict[str, typing.Any]
+        ) -> typing.Tuple[
+            inspect.BoundArguments,
+            inspect.BoundArguments,
+            typing.Any,
+        ]:
+        """
+        Binds the arguments to the :paramref:`~forge.Mapper.public_signature`
+        (with defaults applied), and partially binds the
+        :paramref:`~forge.Mapper.private_signature`.
+
+        :param args: the positional arguments to map
+        :param kwargs: the keyword arguments to map
+        :returns: the public and private :class:`inspect.BoundArguments`, and
+            the context argument value (or ``None``).
+        """
+        plan = self.plan
         try:
-            public_ba = self.public_signature.bind(*args, **kwargs)
+            public_ba = plan.public_signature.bind(*args, **kwargs)
         except TypeError as exc:
             raise TypeError(
                 '{callable_name}() {message}'.\
@@ -114,33 +411,13 @@ class Mapper(immutable.Immutable):
                 ),
             )
         public_ba.apply_defaults()
+        if self.bound_values:
+            # ``bound`` parameters aren't public, so they're never supplied
+            public_ba.arguments.update(self.bound_values)
 
-        private_ba = self.private_signature.bind_partial()
+        private_ba = plan.private_signature.bind_partial()
         private_ba.apply_defaults()
-        ctx = self.get_context(public_ba.arguments)
-
-        for from_name, from_param in self.fsignature.parameters.items():
-            from_val = public_ba.arguments.get(from_name, empty)
-            to_name = self.parameter_map[from_name]
-            to_param = self.private_signature.parameters[to_name]
-            to_val = self.fsignature.parameters[from_name](ctx, from_val)
-
-            if to_param.kind is FParameter.VAR_POSITIONAL:
-                # e.g. f(*args) -> g(*args)
-                private_ba.arguments[to_name] = to_val
-            elif to_param.kind is FParameter.VAR_KEYWORD:
-                if from_param.kind is FParameter.VAR_KEYWORD:
-                    # e.g. f(**kwargs) -> g(**kwargs)
-                    private_ba.arguments[to_name].update(to_val)
-                else:
-                    # e.g. f(a) -> g(**kwargs)
-                    private_ba.arguments[to_name]\
-                        [from_param.interface_name] = to_val
-            else:
-                # e.g. f(a) -> g(a)
-                private_ba.arguments[to_name] = to_val
-
-        return CallArguments.from_bound_arguments(private_ba)
+        return public_ba, private_ba, self.get_context(public_ba.arguments)
 
     def __repr__(self) -> str:
         pubstr = str(self.public_signature)
@@ -258,6 +535,118 @@ class Mapper(immutable.Immutable):
         return types.MappingProxyType(mapping)
 
 
+def _index(
+        parameters: typing.Sequence[FParameter],
+        selector: Selector
+    ) -> int:
+    """
+    Finds the index of the first parameter that matches a selector.
+
+    :param parameters: a sequence of :class:`~forge.FParameter`
+    :param selector: a :class:`~forge.Selector`
+    :raises ValueError: if no parameter matches
+    :returns: the index of the first matching parameter
+    """
+    try:
+        return next(selector.indices(parameters))
+    except StopIteration:
+        raise ValueError(
+            "No parameter matched selector '{}'".format(selector)
+        )
+
+
+def _indices(
+        parameters: typing.Sequence[FParameter],
+        selector: Selector,
+        multiple: bool
+    ) -> typing.List[int]:
+    """
+    Finds the indices of the parameters that match a selector.
+
+    :param parameters: a sequence of :class:`~forge.FParameter`
+    :param selector: a :class:`~forge.Selector`
+    :param multiple: whether to find all matching parameters, or only the
+        first
+    :returns: the indices of the matching parameters (in order)
+    """
+    indices = selector.indices(parameters)
+    return list(indices if multiple else itertools.islice(indices, 1))
+
+
+def _wrap(
+        callable: typing.Callable[..., typing.Any],
+        mapper: Mapper
+    ) -> typing.Callable[..., typing.Any]:
+    """
+    Wraps a callable with a function that maps its arguments with a
+    :class:`~forge.Mapper` before calling the callable.
+
+    :param callable: the :term:`callable` to wrap
+    :param mapper: the :class:`~forge.Mapper` of the wrapper
+    :returns: a function with the :attr:`~forge.Mapper.public_signature` of
+        the :paramref:`~forge._revision._wrap.mapper`
+    """
+    # pylint: disable=W0622, redefined-builtin
+    if mapper.is_async and not asyncio.iscoroutinefunction(callable):
+        raise TypeError(
+            'Coroutine factories, converters and validators require a '
+            'coroutine function, not {}'.format(callable)
+        )
+
+    if mapper.call_scoped:
+        # Resources injected for the call are released on return
+        if asyncio.iscoroutinefunction(callable):
+            @functools.wraps(callable)
+            async def inner(*args, **kwargs):
+                # pylint: disable=E1102, not-callable
+                with call_scope():
+                    args, kwargs = \
+                        await inner.__mapper__._resolve(args, kwargs) \
+                        if inner.__mapper__.is_async \
+                        else inner.__mapper__._map(args, kwargs)
+                    return await callable(*args, **kwargs)
+        else:
+            @functools.wraps(callable)  # type: ignore
+            def inner(*args, **kwargs):
+                # pylint: disable=E1102, not-callable
+                with call_scope():
+                    args, kwargs = inner.__mapper__._map(args, kwargs)
+                    return callable(*args, **kwargs)
+    elif asyncio.iscoroutinefunction(callable):
+        if mapper.is_async:
+            @functools.wraps(callable)
+            async def inner(*args, **kwargs):
+                # pylint: disable=E1102, not-callable
+                args, kwargs = await inner.__mapper__._resolve(args, kwargs)
+                return await callable(*args, **kwargs)
+        elif get_lean_coroutines() and \
+                hasattr(inspect, 'markcoroutinefunction'):
+            # Returns the underlying coroutine, rather than awaiting it; only
+            # where ``inspect`` recognizes it as a coroutine function (3.12+)
+            @markcoroutinefunction
+            @functools.wraps(callable)
+            def inner(*args, **kwargs):
+                # pylint: disable=E1102, not-callable
+                args, kwargs = inner.__mapper__._map(args, kwargs)
+                return callable(*args, **kwargs)
+        else:
+            @functools.wraps(callable)
+            async def inner(*args, **kwargs):
+                # pylint: disable=E1102, not-callable
+                args, kwargs = inner.__mapper__._map(args, kwargs)
+                return await callable(*args, **kwargs)
+    else:
+        @functools.wraps(callable)  # type: ignore
+        def inner(*args, **kwargs):
+            # pylint: disable=E1102, not-callable
+            args, kwargs = inner.__mapper__._map(args, kwargs)
+            return callable(*args, **kwargs)
+
+    inner.__mapper__ = mapper  # type: ignore
+    inner.__signature__ = inner.__mapper__.public_signature  # type: ignore
+    return inner
+
+
 class Revision:
     """
     This is a base class for other revisions.
@@ -312,25 +701,35 @@ class Revision:
             callable = callable.__wrapped__  # type: ignore
         else:
             next_ = self.revise(FSignature.from_callable(callable))
-
-        # Unrevised; not wrapped
-        if asyncio.iscoroutinefunction(callable):
-            @functools.wraps(callable)
-            async def inner(*args, **kwargs):
-                # pylint: disable=E1102, not-callable
-                mapped = inner.__mapper__(*args, **kwargs)
-                return await callable(*mapped.args, **mapped.kwargs)
-        else:
-            @functools.wraps(callable)  # type: ignore
-            def inner(*args, **kwargs):
-                # pylint: disable=E1102, not-callable
-                mapped = inner.__mapper__(*args, **kwargs)
-                return callable(*mapped.args, **mapped.kwargs)
+        callable = self.decorate(callable)
 
         next_.validate()
-        inner.__mapper__ = Mapper(next_, callable)  # type: ignore
-        inner.__signature__ = inner.__mapper__.public_signature  # type: ignore
-        return inner
+        mapper = Mapper(next_, callable)
+
+        return _wrap(callable, mapper)
+
+    def decorate(
+            self,
+            callable: typing.Callable[..., typing.Any]
+        ) -> typing.Callable[..., typing.Any]:
+        """
+        Applies the identity decoration: ``callable`` is returned unmodified.
+
+        Subclasses that alter *how* the underlying callable is invoked (rather
+        than its signature) override this method. The result becomes the
+        wrapper's ``__wrapped__`` attribute, so the behavior is retained when
+        the wrapper is subsequently revised. The decorated callable receives
+        the arguments as mapped by :class:`~forge.Mapper`, and must have the
+        same signature as ``callable``. It must also share its coroutine-ness,
+        unless the revision converts a synchronous callable into a coroutine
+        function (see :class:`~forge.to_async`).
+
+        :param callable: the underlying :term:`callable`
+        :returns: a callable to use in lieu of ``callable``
+        """
+        # pylint: disable=R0201, no-self-use
+        # pylint: disable=W0622, redefined-builtin
+        return callable
 
     def revise(self, previous: FSignature) -> FSignature:
         """
@@ -362,6 +761,24 @@ class compose(Revision):  # pylint: disable=C0103, invalid-name
                 raise TypeError("received non-revision '{}'".format(rev))
         self.revisions = revisions
 
+    def decorate(
+            self,
+            callable: typing.Callable[..., typing.Any]
+        ) -> typing.Callable[..., typing.Any]:
+        """
+        Applies the :meth:`~forge.Revision.decorate` method of each of
+        :paramref:`~forge.compose.revisions`, from top to bottom.
+
+        :param callable: the underlying :term:`callable`
+        :returns: a callable to use in lieu of ``callable``
+        """
+        # pylint: disable=W0622, redefined-builtin
+        return functools.reduce(
+            lambda callable, revision: revision.decorate(callable),
+            self.revisions,
+            callable,
+        )
+
     def revise(self, previous: FSignature) -> FSignature:
         """
         Applies :paramref:`~forge.compose.revisions`
@@ -410,6 +827,8 @@ class copy(Revision):  # pylint: disable=C0103, invalid-name
         self.signature = fsignature(callable)
         self.include = include
         self.exclude = exclude
+        self._include = Selector(include) if include else None
+        self._exclude = Selector(exclude) if exclude else None
 
     def revise(self, previous: FSignature) -> FSignature:
         """
@@ -426,14 +845,15 @@ class copy(Revision):  # pylint: disable=C0103, invalid-name
         :param previous: the :class:`~forge.FSignature` to modify
         :returns: a modified instance of :class:`~forge.FSignature`
         """
-        if self.include:
+        if self._include:
             return self.signature.replace(parameters=list(
-                findparam(self.signature, self.include)
+                self._include.find(self.signature)
             ))
-        elif self.exclude:
-            excluded = list(findparam(self.signature, self.exclude))
+        elif self._exclude:
+            excluded = set(self._exclude.indices(self.signature))
             return self.signature.replace(parameters=[
-                param for param in self.signature if param not in excluded
+                param for i, param in enumerate(self.signature)
+                if i not in excluded
             ])
         return self.signature
 
@@ -552,9 +972,10 @@ class returns(Revision): # pylint: disable=invalid-name
         :param previous: the :class:`~forge.FSignature` to modify
         :returns: a modified instance of :class:`~forge.FSignature`
         """
-        return FSignature(
-            previous,
+        # https://github.com/python/mypy/issues/5156
+        return previous.replace(  # type: ignore
             return_annotation=self.return_annotation,
+            __validate_parameters__=False,
         )
 
 
@@ -726,6 +1147,7 @@ class delete(Revision):  # pylint: disable=C0103, invalid-name
         self.selector = selector
         self.multiple = multiple
         self.raising = raising
+        self._selector = Selector(selector)
 
     def revise(self, previous: FSignature) -> FSignature:
         """
@@ -739,7 +1161,7 @@ class delete(Revision):  # pylint: disable=C0103, invalid-name
         :param previous: the :class:`~forge.FSignature` to modify
         :returns: a modified instance of :class:`~forge.FSignature`
         """
-        excluded = list(findparam(previous, self.selector))
+        excluded = _indices(previous, self._selector, self.multiple)
         if not excluded:
             if self.raising:
                 raise ValueError(
@@ -747,16 +1169,16 @@ class delete(Revision):  # pylint: disable=C0103, invalid-name
                 )
             return previous
 
-        if not self.multiple:
-            del excluded[1:]
-
+        start, stop = excluded[0], excluded[-1] + 1
+        excluded = set(excluded)
         # https://github.com/python/mypy/issues/5156
-        return previous.replace(  # type: ignore
-            parameters=[
-                param for param in previous
-                if param not in excluded
+        return previous._splice(  # type: ignore
+            start,
+            stop,
+            [
+                previous[i] for i in range(start, stop)
+                if i not in excluded
             ],
-            __validate_parameters__=False,
         )
 
 
@@ -811,6 +1233,8 @@ class insert(Revision):  # pylint: disable=C0103, invalid-name
         self.index = index
         self.before = before
         self.after = after
+        self._before = Selector(before) if before else None
+        self._after = Selector(after) if after else None
 
     def revise(self, previous: FSignature) -> FSignature:
         """
@@ -823,42 +1247,15 @@ class insert(Revision):  # pylint: disable=C0103, invalid-name
         :param previous: the :class:`~forge.FSignature` to modify
         :returns: a modified instance of :class:`~forge.FSignature`
         """
-        pparams = list(previous)
-        nparams = []
-        if self.before:
-            try:
-                match = next(findparam(pparams, self.before))
-            except StopIteration:
-                raise ValueError(
-                    "No parameter matched selector '{}'".format(self.before)
-                )
-
-            for param in pparams:
-                if param is match:
-                    nparams.extend(self.insertion)
-                nparams.append(param)
-        elif self.after:
-            try:
-                match = next(findparam(pparams, self.after))
-            except StopIteration:
-                raise ValueError(
-                    "No parameter matched selector '{}'".format(self.after)
-                )
-
-            for param in previous:
-                nparams.append(param)
-                if param is match:
-                    nparams.extend(self.insertion)
+        if self._before:
+            index = _index(previous, self._before)
+        elif self._after:
+            index = _index(previous, self._after) + 1
         else:
-            nparams = pparams[:self.index] + \
-                self.insertion + \
-                pparams[self.index:]
+            index = self.index
 
         # https://github.com/python/mypy/issues/5156
-        return previous.replace(  # type: ignore
-            parameters=nparams,
-            __validate_parameters__=False,
-        )
+        return previous._splice(index, index, self.insertion)  # type: ignore
 
 
 class modify(Revision):  # pylint: disable=C0103, invalid-name
@@ -917,6 +1314,7 @@ class modify(Revision):  # pylint: disable=C0103, invalid-name
         self.selector = selector
         self.multiple = multiple
         self.raising = raising
+        self._selector = Selector(selector)
         self.updates = {
             k: v for k, v in {
                 'kind': kind,
@@ -945,7 +1343,7 @@ class modify(Revision):  # pylint: disable=C0103, invalid-name
         :param previous: the :class:`~forge.FSignature` to modify
         :returns: a modified instance of :class:`~forge.FSignature`
         """
-        matched = list(findparam(previous, self.selector))
+        matched = _indices(previous, self._selector, self.multiple)
         if not matched:
             if self.raising:
                 raise ValueError(
@@ -953,17 +1351,15 @@ class modify(Revision):  # pylint: disable=C0103, invalid-name
                 )
             return previous
 
-        if not self.multiple:
-            del matched[1:]
+        start, stop = matched[0], matched[-1] + 1
+        parameters = previous[start:stop]
+        for i in matched:
+            parameters[i - start] = parameters[i - start].replace(
+                **self.updates
+            )
 
         # https://github.com/python/mypy/issues/5156
-        return previous.replace(  # type: ignore
-            parameters=[
-                param.replace(**self.updates) if param in matched else param
-                for param in previous
-            ],
-            __validate_parameters__=False,
-        )
+        return previous._splice(start, stop, parameters)  # type: ignore
 
 
 class replace(Revision):  # pylint: disable=C0103, invalid-name
@@ -993,6 +1389,7 @@ class replace(Revision):  # pylint: disable=C0103, invalid-name
         ) -> None:
         self.selector = selector
         self.parameter = parameter
+        self._selector = Selector(selector)
 
     def revise(self, previous: FSignature) -> FSignature:
         """
@@ -1006,20 +1403,12 @@ class replace(Revision):  # pylint: disable=C0103, invalid-name
         :param previous: the :class:`~forge.FSignature` to modify
         :returns: a modified instance of :class:`~forge.FSignature`
         """
-        try:
-            match = next(findparam(previous, self.selector))
-        except StopIteration:
-            raise ValueError(
-                "No parameter matched selector '{}'".format(self.selector)
-            )
-
+        index = _index(previous, self._selector)
         # https://github.com/python/mypy/issues/5156
-        return previous.replace(  # type: ignore
-            parameters=[
-                self.parameter if param is match else param
-                for param in previous
-            ],
-            __validate_parameters__=False,
+        return previous._splice(  # type: ignore
+            index,
+            index + 1,
+            [self.parameter],
         )
 
 
@@ -1067,6 +1456,9 @@ class translocate(Revision):  # pylint: disable=C0103, invalid-name
         self.index = index
         self.before = before
         self.after = after
+        self._selector = Selector(selector)
+        self._before = Selector(before) if before else None
+        self._after = Selector(after) if after else None
 
     def revise(self, previous: FSignature) -> FSignature:
         """
@@ -1080,53 +1472,32 @@ class translocate(Revision):  # pylint: disable=C0103, invalid-name
         :param previous: the :class:`~forge.FSignature` to modify
         :returns: a modified instance of :class:`~forge.FSignature`
         """
-        try:
-            selected = next(findparam(previous, self.selector))
-        except StopIteration:
-            raise ValueError(
-                "No parameter matched selector '{}'".format(self.selector)
-            )
-
-        if self.before:
-            try:
-                before = next(findparam(previous, self.before))
-            except StopIteration:
-                raise ValueError(
-                    "No parameter matched selector '{}'".format(self.before)
-                )
-
-            parameters = []
-            for param in previous:
-                if param is before:
-                    parameters.append(selected)
-                elif param is selected:
-                    continue
-                parameters.append(param)
-        elif self.after:
-            try:
-                after = next(findparam(previous, self.after))
-            except StopIteration:
-                raise ValueError(
-                    "No parameter matched selector '{}'".format(self.after)
-                )
+        selected = _index(previous, self._selector)
+        if self._before:
+            index = _index(previous, self._before)
+        elif self._after:
+            index = _index(previous, self._after) + 1
+        else:
+            index = None
 
-            parameters = []
-            for param in previous:
-                if param is not selected:
-                    parameters.append(param)
-                if param is after:
-                    parameters.append(selected)
+        parameters = list(previous)
+        if index is None:
+            parameters.insert(self.index, parameters.pop(selected))
+            # ``list.insert`` bounds its index like the start of a slice
+            moved = slice(self.index, None).indices(len(parameters) - 1)[0]
         else:
-            parameters = [
-                param for param in previous
-                if param is not selected
-            ]
-            parameters.insert(self.index, selected)
+            # The selected parameter shifts up by one if it's inserted before
+            parameters.insert(index, parameters[selected])
+            del parameters[selected if index > selected else selected + 1]
+            moved = index - 1 if index > selected else index
 
+        # Only the parameters between the old and new positions are moved
+        start, stop = min(selected, moved), max(selected, moved) + 1
         # https://github.com/python/mypy/issues/5156
-        return previous.replace(  # type: ignore
-            parameters=parameters,
-            __validate_parameters__=False,
+        return previous._splice(  # type: ignore
+            start,
+            stop,
+            parameters[start:stop],
         )
 
 
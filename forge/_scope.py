@@ -0,0 +1,137 @@
+import threading
+import typing
+
+try:
+    import contextvars
+except ImportError:  # pragma: no cover (Python < 3.7)
+    contextvars = None  # type: ignore
+
+
+class _LocalVar:
+    """
+    A minimal stand-in for :class:`contextvars.ContextVar` (which requires
+    Python 3.7+), backed by :class:`threading.local`.
+    Scopes are isolated between threads, but not between tasks on an event
+    loop.
+    """
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._local = threading.local()
+
+    def get(self, default: typing.Any = None) -> typing.Any:
+        return getattr(self._local, 'value', default)
+
+    def set(self, value: typing.Any) -> typing.Any:
+        token = self.get()
+        self._local.value = value
+        return token
+
+    def reset(self, token: typing.Any) -> None:
+        self._local.value = token
+
+
+def _make_var(name: str) -> typing.Any:
+    """
+    :param name: the name of the variable
+    :returns: a :class:`contextvars.ContextVar` (or a stand-in) with a
+        default value of ``None``
+    """
+    if contextvars is not None:
+        return contextvars.ContextVar(name, default=None)
+    return _LocalVar(name)
+
+
+class request_scope:  # pylint: disable=C0103, invalid-name
+    """
+    A context manager (usable with ``with`` or ``async with``) that delimits
+    a *request*; i.e. a unit of work during which resolved argument values
+    can be re-used.
+
+    Converters (e.g. :class:`~forge.batch_converter`) store values in the
+    :attr:`~forge.request_scope.cache` of the current scope, which is
+    discarded when the scope exits. Scopes are tracked with
+    :mod:`contextvars`, so concurrent tasks each have their own scope.
+
+    .. testcode::
+
+        import forge
+
+        with forge.request_scope() as scope:
+            assert forge.request_scope.current() is scope
+        assert forge.request_scope.current() is None
+
+    :ivar cache: a mapping of values for the duration of the scope
+    """
+    __slots__ = ('cache', '_callbacks', '_token')
+
+    _var = _make_var('forge_request_scope')
+
+    def __init__(self) -> None:
+        self.cache = {}  # type: typing.Dict[typing.Hashable, typing.Any]
+        self._callbacks = []  # type: typing.List[typing.Callable[[], None]]
+        self._token = None  # type: typing.Any
+
+    def __repr__(self) -> str:
+        return '<{} ({} cached)>'.format(type(self).__name__, len(self.cache))
+
+    def __enter__(self) -> 'request_scope':
+        self._token = self._var.set(self)
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self._var.reset(self._token)
+        self._token = None
+        self.close()
+
+    async def __aenter__(self) -> 'request_scope':
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        self.__exit__(*exc_info)
+
+    @classmethod
+    def current(cls) -> typing.Optional['request_scope']:
+        """
+        :returns: the active :class:`~forge.request_scope`, or ``None``
+        """
+        return cls._var.get()
+
+    def on_close(self, callback: typing.Callable[[], None]) -> None:
+        """
+        Registers a callback to call (in reverse order of registration) when
+        the scope exits.
+
+        :param callback: a callable that receives no arguments
+        """
+        self._callbacks.append(callback)
+
+    def close(self) -> None:
+        """
+        Calls the registered callbacks and discards the cached values.
+        Every callback is called, even if an earlier one raises; the first
+        exception raised is then re-raised.
+        """
+        callbacks, self._callbacks = self._callbacks, []
+        error = None  # type: typing.Optional[BaseException]
+        while callbacks:
+            try:
+                callbacks.pop()()
+            except BaseException as exc:  # pylint: disable=W0703
+                if error is None:
+                    error = exc
+        self.cache.clear()
+        if error is not None:
+            raise error
+
+
+class call_scope(request_scope):  # pylint: disable=C0103, invalid-name
+    """
+    A scope that delimits a single call of a wrapper; it's entered by the
+    wrappers of callables with ``call``-scoped injected parameters (see
+    :func:`~forge.inject`), so that their resources are released when the
+    underlying callable returns.
+    Call scopes are tracked independently of request scopes.
+    """
+    __slots__ = ()
+
+    _var = _make_var('forge_call_scope')
@@ -1,13 +1,19 @@
+import asyncio
 import builtins
 import collections
-import functools
+import fnmatch
 import inspect
+import re
+import threading
 import types
 import typing
+import weakref
 
 import forge._immutable as immutable
+from forge._config import get_intern_parameters
 from forge._counter import CreationOrderMeta
 from forge._marker import _void, empty, void
+from forge._scope import request_scope
 
 ## Parameter
 POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
@@ -31,21 +37,61 @@ class Factory(immutable.Immutable):
     A Factory object is a wrapper around a callable that gets called to generate
     a default value everytime a function is invoked.
 
+    The callable may be a coroutine function, in which case the default value
+    is awaited (alongside other coroutine factories, converters and
+    validators) by the wrapper of a coroutine function.
+
     :param factory: a callable which is invoked without argument to generate
         a default value.
+    :param scoped: whether the generated value is re-used for the lifetime of
+        the current :class:`~forge.request_scope` (if any).
     """
-    __slots__ = ('factory',)
+    __slots__ = ('factory', 'scoped')
 
-    def __init__(self, factory: typing.Callable[[], typing.Any]) -> None:
+    def __init__(
+            self,
+            factory: typing.Callable[[], typing.Any],
+            *,
+            scoped: bool = False
+        ) -> None:
         # pylint: disable=C0102, blacklisted-name
-        super().__init__(factory=factory)
+        super().__init__(factory=factory, scoped=scoped)
 
     def __repr__(self) -> str:
         return '<{} {}>'.format(type(self).__name__, self.factory.__qualname__)
 
+    def __reduce__(self):
+        return (immutable.restore, (type(self), immutable.asdict(self)))
+
     def __call__(self) -> typing.Any:
+        if self.scoped:
+            scope = request_scope.current()
+            if scope is not None:
+                return self._call_scoped(scope)
         return self.factory()
 
+    def _call_scoped(self, scope: request_scope) -> typing.Any:
+        """
+        Generates a value, or retrieves the value previously generated in
+        ``scope``. Awaitable values are wrapped in a :class:`asyncio.Future`,
+        so they can be awaited by each caller.
+
+        :param scope: the current :class:`~forge.request_scope`
+        :returns: the generated value
+        """
+        key = (Factory, id(self))
+        cached = scope.cache.get(key)
+        # ``self`` is retained with the value, guarding against its ``id``
+        # being re-used after it's been garbage collected.
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        value = self.factory()
+        if inspect.isawaitable(value):
+            value = asyncio.ensure_future(value)
+        scope.cache[key] = (self, value)
+        return value
+
 
 # Common type hints for FParameter
 _TYPE_FP_CTX_CALLABLE = typing.Callable[
@@ -74,6 +120,225 @@ _TYPE_FP_VALIDATOR = typing.Optional[
 _TYPE_FP_METADATA = typing.Mapping
 
 
+def _iscoroutinecallable(func: typing.Any) -> bool:
+    """
+    Determines whether calling ``func`` returns a coroutine; i.e. whether
+    ``func`` is a coroutine function, or an instance with an ``async def``
+    ``__call__`` method.
+
+    :param func: a callable
+    :returns: whether ``func`` is a coroutine callable
+    """
+    return asyncio.iscoroutinefunction(func) or \
+        asyncio.iscoroutinefunction(getattr(func, '__call__', None))
+
+
+def _as_tuple(
+        callables: typing.Union[_TYPE_FP_CONVERTER, _TYPE_FP_VALIDATOR],
+    ) -> typing.Tuple[_TYPE_FP_CTX_CALLABLE, ...]:
+    """
+    Normalizes a converter or validator (``None``, a callable, or an iterable
+    of callables) into a tuple of callables.
+
+    :param callables: see :paramref:`~forge.FParameter.converter` or
+        :paramref:`~forge.FParameter.validator`
+    :returns: a tuple of callables
+    """
+    if callables is None:
+        return ()
+    elif not isinstance(callables, collections.abc.Iterable):
+        return (callables,)
+    return tuple(callables)
+
+
+def _fuse_converters(
+        converters: typing.Tuple[_TYPE_FP_CTX_CALLABLE, ...],
+    ) -> typing.Optional[_TYPE_FP_CTX_CALLABLE]:
+    """
+    Fuses converters into a single callable (or ``None``), so that
+    :class:`~forge.FParameter` needn't inspect the type of its ``converter``
+    on every call.
+
+    :param converters: the converters, as normalized by ``_as_tuple``
+    :returns: a callable that receives ``ctx``, ``name`` and ``value`` and
+        returns the value transformed by each converter in turn, or ``None``
+        if no conversion is necessary.
+    """
+    if not converters:
+        return None
+    elif len(converters) == 1:
+        return converters[0]
+
+    def convert(ctx, name, value):
+        for func in converters:
+            value = func(ctx, name, value)
+        return value
+    return convert
+
+
+def _fuse_validators(
+        validators: typing.Tuple[_TYPE_FP_CTX_CALLABLE, ...],
+    ) -> typing.Optional[_TYPE_FP_CTX_CALLABLE]:
+    """
+    Fuses validators into a single callable (or ``None``), so that
+    :class:`~forge.FParameter` needn't inspect the type of its ``validator``
+    on every call.
+
+    :param validators: the validators, as normalized by ``_as_tuple``
+    :returns: a callable that receives ``ctx``, ``name`` and ``value`` and
+        calls each validator in turn, or ``None`` if no validation is
+        necessary.
+    """
+    if not validators:
+        return None
+    elif len(validators) == 1:
+        return validators[0]
+
+    def validate(ctx, name, value):
+        for func in validators:
+            func(ctx, name, value)
+    return validate
+
+
+def _compile_async_pipeline(
+        name: _TYPE_FP_NAME,
+        default: _TYPE_FP_DEFAULT,
+        converters: typing.Tuple[_TYPE_FP_CTX_CALLABLE, ...],
+        validators: typing.Tuple[_TYPE_FP_CTX_CALLABLE, ...],
+    ) -> typing.Optional[typing.Callable[[typing.Any, typing.Any], typing.Any]]:
+    """
+    Compiles the coroutine function that resolves an argument value for an
+    :class:`~forge.FParameter` that has a coroutine default
+    :class:`~forge.Factory`, or coroutine converters or validators.
+    Converters and validators are called in order, and the results of those
+    that are coroutine callables are awaited.
+
+    :param name: see :paramref:`~forge.FParameter.name`
+    :param default: see :paramref:`~forge.FParameter.default`
+    :param converters: the converters, as normalized by ``_as_tuple``
+    :param validators: the validators, as normalized by ``_as_tuple``
+    :returns: a coroutine function that receives ``ctx`` and ``value``, or
+        ``None`` if neither the default factory, nor any converters or
+        validators are coroutine callables.
+    """
+    convert = tuple((func, _iscoroutinecallable(func)) for func in converters)
+    validate = tuple((func, _iscoroutinecallable(func)) for func in validators)
+    if not any(is_async for _, is_async in convert + validate) and not (
+            isinstance(default, Factory) and \
+            _iscoroutinecallable(default.factory)
+        ):
+        return None
+
+    async def pipeline(ctx, value):
+        if value is empty:
+            value = default
+        if isinstance(value, Factory):
+            value = value()
+            if asyncio.isfuture(value):
+                # shared within a ``request_scope``
+                value = await asyncio.shield(value)
+            elif inspect.isawaitable(value):
+                value = await value
+
+        for func, is_async in convert:
+            value = func(ctx, name, value)
+            if is_async:
+                value = await value
+        for func, is_async in validate:
+            if is_async:
+                await func(ctx, name, value)
+            else:
+                func(ctx, name, value)
+        return value
+    return pipeline
+
+
+# Shared by parameters without metadata
+_EMPTY_METADATA = types.MappingProxyType({})  # type: types.MappingProxyType
+
+# Interned parameters, by identity (see ``forge.set_intern_parameters``)
+_interned = weakref.WeakValueDictionary()  # type: typing.MutableMapping
+_interned_lock = threading.Lock()
+
+# Immutable types whose equal instances (of the exact type) are
+# interchangeable
+_SCALAR_TYPES = frozenset([
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+])
+
+
+def _value_key(value: typing.Any) -> typing.Hashable:
+    """
+    :param value: a default value (or metadata value) of a parameter
+    :returns: a key that's equal for interchangeable values; i.e. equal
+        scalars of the same type, or otherwise the same object. As the key of
+        other values is their ``id``, it's only valid while ``value`` is
+        retained.
+    """
+    if builtins.type(value) in _SCALAR_TYPES:
+        # e.g. ``1``, ``1.0`` and ``True`` are equal, but not identical
+        return builtins.type(value), value
+    # e.g. ``(1,)`` and ``(1.0,)``, or two equal (mutable) instances
+    return id(value)
+
+
+def _identity(fparam: 'FParameter') -> typing.Tuple:
+    """
+    :param fparam: an instance of :class:`~forge.FParameter`
+    :returns: a key that's equal for identical parameters (i.e. parameters
+        that are interchangeable), which is valid while ``fparam`` is
+        retained (see :func:`~forge._signature._value_key`); it's unhashable
+        if any of the parameter's other fields are unhashable
+    """
+    return (
+        fparam.kind,
+        fparam.name,
+        fparam.interface_name,
+        _value_key(fparam.default),
+        fparam.type,
+        # e.g. ``f`` and ``[f]`` are interchangeable, but not identical
+        builtins.type(fparam.converter),
+        _as_tuple(fparam.converter),
+        builtins.type(fparam.validator),
+        _as_tuple(fparam.validator),
+        fparam.bound,
+        fparam.contextual,
+        tuple(
+            (key, _value_key(value))
+            for key, value in fparam.metadata.items()
+        ),
+    )
+
+
+def _intern(fparam: 'FParameter') -> 'FParameter':
+    """
+    Returns the shared instance of a parameter that's identical to
+    ``fparam`` (if interning is enabled with
+    :func:`~forge.set_intern_parameters`), retaining ``fparam`` as the shared
+    instance if there isn't one yet.
+
+    :param fparam: a newly created :class:`~forge.FParameter`
+    :returns: the shared instance identical to ``fparam``, or ``fparam`` if
+        interning is disabled or ``fparam`` isn't hashable (the interned
+        instances retain their defaults, so their keys remain valid)
+    """
+    if not get_intern_parameters():
+        return fparam
+    key = _identity(fparam)
+    try:
+        hash(key)
+    except TypeError:
+        return fparam
+    with _interned_lock:
+        return _interned.setdefault(key, fparam)
+
+
 class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
     """
     An immutable representation of a signature parameter that encompasses its
@@ -142,7 +407,10 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
     """
 
     __slots__ = (
+        '_convert',
         '_creation_order',
+        '_pipeline',
+        '_validate',
         'kind',
         'name',
         'interface_name',
@@ -153,6 +421,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         'bound',
         'contextual',
         'metadata',
+        '__weakref__',
     )
 
     empty = empty
@@ -200,6 +469,9 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         if bound and default is empty:
             raise TypeError('bound arguments must have a default value')
 
+        converters = _as_tuple(converter)
+        validators = _as_tuple(validator)
+
         super().__init__(
             kind=kind,
             name=name or interface_name,
@@ -210,7 +482,17 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             validator=validator,
             contextual=contextual,
             bound=bound,
-            metadata=types.MappingProxyType(metadata or {}),
+            metadata=types.MappingProxyType(metadata) \
+                if metadata \
+                else _EMPTY_METADATA,
+            _convert=_fuse_converters(converters),
+            _validate=_fuse_validators(validators),
+            _pipeline=_compile_async_pipeline(
+                name or interface_name,
+                default,
+                converters,
+                validators,
+            ),
         )
 
     def __str__(self) -> str:
@@ -254,6 +536,12 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
     def __repr__(self) -> str:
         return '<{} "{}">'.format(type(self).__name__, str(self))
 
+    def __reduce__(self):
+        # The compiled pipelines (private slots) are re-created on unpickling
+        kwargs = immutable.asdict(self)
+        kwargs['metadata'] = dict(kwargs['metadata'])
+        return (immutable.restore, (type(self), kwargs))
+
     def apply_default(self, value: typing.Any) -> typing.Any:
         """
         Return the argument value (if not :class:`~forge.empty`), or the value
@@ -265,9 +553,9 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param value: the argument value for this parameter
         :returns: the input value or a default value
         """
-        if value is not empty:
-            return value() if isinstance(value, Factory) else value
-        return self.default
+        if value is empty:
+            value = self.default
+        return value() if isinstance(value, Factory) else value
 
     def apply_conversion(
             self,
@@ -284,14 +572,9 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :returns: the converted value
         """
         # pylint: disable=W0621, redefined-outer-name
-        if self.converter is None:
+        if self._convert is None:
             return value
-        elif isinstance(self.converter, typing.Iterable):
-            return functools.reduce(
-                lambda val, func: func(ctx, self.name, val),
-                [value, *self.converter],
-            )
-        return self.converter(ctx, self.name, value)
+        return self._convert(ctx, self.name, value)
 
     def apply_validation(
             self,
@@ -308,11 +591,8 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :returns: the (unchanged) validated value
         """
         # pylint: disable=W0621, redefined-outer-name
-        if isinstance(self.validator, typing.Iterable):
-            for validate in self.validator:
-                validate(ctx, self.name, value)
-        elif self.validator is not None:
-            self.validator(ctx, self.name, value)
+        if self._validate is not None:
+            self._validate(ctx, self.name, value)
         return value
 
     def __call__(
@@ -339,9 +619,55 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param value: the user-supplied (or default) value
         """
         # pylint: disable=W0621, redefined-outer-name
-        defaulted = self.apply_default(value)
-        converted = self.apply_conversion(ctx, defaulted)
-        return self.apply_validation(ctx, converted)
+        if self._pipeline is not None:
+            raise TypeError(
+                "Parameter '{}' has a coroutine factory, converters or "
+                "validators; use 'resolve'".\
+                format(self.name)
+            )
+
+        # Inlined ``apply_default``, ``apply_conversion`` and
+        # ``apply_validation``; this is the hot path of ``Mapper.__call__``
+        if value is empty:
+            value = self.default
+        if isinstance(value, Factory):
+            value = value()
+
+        if self._convert is not None:
+            value = self._convert(ctx, self.name, value)
+        if self._validate is not None:
+            self._validate(ctx, self.name, value)
+        return value
+
+    async def resolve(
+            self,
+            ctx: typing.Any,
+            value: typing.Any
+        ) -> typing.Any:
+        """
+        The coroutine counterpart of :meth:`~forge.FParameter.__call__`;
+        converters and validators that are coroutine callables (e.g.
+        :class:`~forge.batch_converter`) are awaited in turn.
+
+        :param ctx: the context of this parameter as provided by the
+            :class:`~forge.FSignature` (typically self or ctx).
+        :param value: the user-supplied (or default) value
+        """
+        # pylint: disable=W0621, redefined-outer-name
+        if self._pipeline is None:
+            return self(ctx, value)
+        return await self._pipeline(ctx, value)
+
+    @property
+    def is_async(self) -> bool:
+        """
+        Whether the :paramref:`~forge.FParameter.default` is a coroutine
+        :class:`~forge.Factory`, or any :paramref:`~forge.FParameter.converter`
+        or :paramref:`~forge.FParameter.validator` is a coroutine callable, in
+        which case the argument value must be obtained with
+        :meth:`~forge.FParameter.resolve`.
+        """
+        return self._pipeline is not None
 
     @property
     def native(self) -> inspect.Parameter:
@@ -377,6 +703,8 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         """
         An evolution method that generates a new :class:`~forge.FParameter`
         derived from this instance and the provided updates.
+        Unchanged fields (and their compiled converters and validators) are
+        copied, rather than re-validated.
 
         :param kind: see :paramref:`~forge.FParameter.kind`
         :param name: see :paramref:`~forge.FParameter.name`
@@ -397,7 +725,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         if factory is not _void and default is _void:
             default = empty
 
-        return immutable.replace(self, **{
+        changes = {
             k: v for k, v in {
                 'kind': kind,
                 'name': name,
@@ -411,7 +739,81 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
                 'contextual': contextual,
                 'metadata': metadata,
             }.items() if v is not _void
-        })
+        }
+        return self._evolve(changes)
+
+    def _evolve(self, changes: typing.Dict[str, typing.Any]) -> 'FParameter':
+        """
+        The fast path of :meth:`~forge.FParameter.replace`: copies the slots
+        of this instance directly (rather than re-running ``__init__``), and
+        only validates (or re-compiles) what depends on the changed fields.
+
+        :param changes: a mapping of changed fields to their (non-``_void``)
+            values, as received by :meth:`~forge.FParameter.replace`
+        :returns: a new instance of :class:`~forge.FParameter`
+        """
+        cls = builtins.type(self)
+        # The slots of subclasses (and their bases) are copied too
+        names = FParameter.__slots__ \
+            if cls is FParameter \
+            else immutable.fields(cls)
+        state = {k: getattr(self, k) for k in names if k != '__weakref__'}
+
+        factory = changes.pop('factory', empty)
+        if factory is not empty:
+            if changes.get('default', empty) is not empty:
+                raise TypeError(
+                    'expected either "default" or "factory", received both'
+                )
+            changes['default'] = Factory(factory)
+
+        if 'name' in changes or 'interface_name' in changes:
+            name = changes.pop('name', self.name)
+            interface_name = changes.pop('interface_name', self.interface_name)
+            if name is not None and not isinstance(name, str):
+                raise TypeError(
+                    'name must be a str, not a {}'.format(name),
+                )
+            if interface_name is not None and \
+                    not isinstance(interface_name, str):
+                raise TypeError(
+                    'interface_name must be a str, not a {}'.\
+                    format(interface_name)
+                )
+            state['name'] = name or interface_name
+            state['interface_name'] = interface_name or name
+
+        if 'metadata' in changes:
+            changes['metadata'] = \
+                types.MappingProxyType(changes['metadata']) \
+                if changes['metadata'] \
+                else _EMPTY_METADATA
+        state.update(changes)
+
+        if ('bound' in changes or 'default' in changes) and \
+                state['bound'] and state['default'] is empty:
+            raise TypeError('bound arguments must have a default value')
+
+        if 'converter' in changes:
+            state['_convert'] = _fuse_converters(_as_tuple(state['converter']))
+        if 'validator' in changes:
+            state['_validate'] = _fuse_validators(_as_tuple(state['validator']))
+        # The pipeline closes over the name, so it's re-compiled on a rename
+        # (but a parameter without a pipeline doesn't need one)
+        if not {'default', 'converter', 'validator'}.isdisjoint(changes) or \
+                (state['name'] != self.name and self._pipeline is not None):
+            state['_pipeline'] = _compile_async_pipeline(
+                state['name'],
+                state['default'],
+                _as_tuple(state['converter']),
+                _as_tuple(state['validator']),
+            )
+
+        # pylint: disable=W0212, protected-access
+        state['_creation_order'] = next(self._creation_counter._count)
+        evolved = object.__new__(cls)
+        immutable.Immutable.__init__(evolved, **state)
+        return evolved
 
     @classmethod
     def from_native(cls, native: inspect.Parameter) -> 'FParameter':
@@ -427,13 +829,13 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             :returns: a new instance of :class:`~forge.FParameter`, using
             :paramref:`~forge.FParameter.from_native.native` as a template
         """
-        return cls(  # type: ignore
+        return _intern(cls(  # type: ignore
             kind=native.kind,
             name=native.name,
             interface_name=native.name,
             default=cls.empty.ccoerce_synthetic(native.default),
             type=cls.empty.ccoerce_synthetic(native.annotation),
-        )
+        ))
 
     @classmethod
     def create_positional_only(
@@ -464,7 +866,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param metadata: see :paramref:`~forge.FParameter.metadata`
         """
         # pylint: disable=W0622, redefined-builtin
-        return cls(  # type: ignore
+        return _intern(cls(  # type: ignore
             kind=cls.POSITIONAL_ONLY,
             name=name,
             interface_name=interface_name,
@@ -475,7 +877,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             validator=validator,
             bound=bound,
             metadata=metadata,
-        )
+        ))
 
     @classmethod
     def create_positional_or_keyword(
@@ -506,7 +908,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param metadata: see :paramref:`~forge.FParameter.metadata`
         """
         # pylint: disable=W0622, redefined-builtin
-        return cls(  # type: ignore
+        return _intern(cls(  # type: ignore
             kind=cls.POSITIONAL_OR_KEYWORD,
             name=name,
             interface_name=interface_name,
@@ -517,7 +919,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             validator=validator,
             bound=bound,
             metadata=metadata,
-        )
+        ))
 
     @classmethod
     def create_contextual(
@@ -540,14 +942,14 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param metadata: see :paramref:`~forge.FParameter.metadata`
         """
         # pylint: disable=W0622, redefined-builtin
-        return cls(  # type: ignore
+        return _intern(cls(  # type: ignore
             kind=cls.POSITIONAL_OR_KEYWORD,
             name=name,
             interface_name=interface_name,
             type=type,
             contextual=True,
             metadata=metadata,
-        )
+        ))
 
     @classmethod
     def create_var_positional(
@@ -570,14 +972,14 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param metadata: see :paramref:`~forge.FParameter.metadata`
         """
         # pylint: disable=W0622, redefined-builtin
-        return cls(  # type: ignore
+        return _intern(cls(  # type: ignore
             kind=cls.VAR_POSITIONAL,
             name=name,
             type=type,
             converter=converter,
             validator=validator,
             metadata=metadata,
-        )
+        ))
 
     @classmethod
     def create_keyword_only(
@@ -608,7 +1010,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param metadata: see :paramref:`~forge.FParameter.metadata`
         """
         # pylint: disable=W0622, redefined-builtin
-        return cls(  # type: ignore
+        return _intern(cls(  # type: ignore
             kind=cls.KEYWORD_ONLY,
             name=name,
             interface_name=interface_name,
@@ -619,7 +1021,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             validator=validator,
             bound=bound,
             metadata=metadata,
-        )
+        ))
 
     @classmethod
     def create_var_keyword(
@@ -642,14 +1044,14 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param metadata: see :paramref:`~forge.FParameter.metadata`
         """
         # pylint: disable=W0622, redefined-builtin
-        return cls(  # type: ignore
+        return _intern(cls(  # type: ignore
             kind=cls.VAR_KEYWORD,
             name=name,
             type=type,
             converter=converter,
             validator=validator,
             metadata=metadata,
-        )
+        ))
 
 # Convenience
 pos = FParameter.create_positional_only
@@ -926,10 +1328,245 @@ _T_PARAM = typing.TypeVar('_T_PARAM', inspect.Parameter, FParameter)
 _TYPE_FINDITER_PARAMETERS = typing.Iterable[_T_PARAM]
 _TYPE_FINDITER_SELECTOR = typing.Union[
     str,
-    typing.Iterable[str],
+    typing.Pattern,
+    inspect._ParameterKind,  # pylint: disable=W0212, protected-access
+    typing.Iterable[typing.Any],
     typing.Callable[[_T_PARAM], bool],
 ]
 
+
+class Selector(immutable.Immutable):
+    """
+    A compiled selector (see :func:`~forge.findparam`) that matches parameters
+    (of type :class:`inspect.Parameter` or :class:`~forge.FParameter`).
+    Selectors are compiled once, and then matched against any number of
+    parameters: names are matched against a :class:`frozenset` (or, for an
+    :class:`~forge.FSignature`, looked up in its index of names), and other
+    forms are combined into a single predicate.
+
+    :paramref:`~forge.Selector.selector` is compiled based on what is supplied:
+
+    - str: a parameter matches if its :attr:`name` is the selector
+    - :func:`compiled regular expression <re.compile>`: a parameter matches
+        if its :attr:`name` (fully) matches the expression
+    - :term:`parameter kind`: a parameter matches if it's of that kind
+    - :class:`~forge.Selector`: the selector is used as-is
+    - callable: a parameter matches if the callable (which receives the
+        parameter) returns a truthy value
+    - iterable: a parameter matches if any of the selectors in the iterable
+        matches (e.g. an iterable of names)
+
+    Selectors for glob patterns, kinds and metadata are created with
+    :meth:`~forge.Selector.glob`, :meth:`~forge.Selector.kind` and
+    :meth:`~forge.Selector.metadata`.
+
+    .. testcode::
+
+        import re
+        import forge
+
+        fsig = forge.fsignature(lambda a, b, *, c_id, d_id=None: None)
+        selector = forge.Selector([re.compile('.*_id'), 'a'])
+        names = [param.name for param in selector.find(fsig)]
+        assert names == ['a', 'c_id', 'd_id']
+
+    :param selector: a selector to compile
+    :raises TypeError: if :paramref:`~forge.Selector.selector` isn't one of
+        the above
+    """
+    __slots__ = ('selector', '_names', '_predicate')
+
+    def __new__(cls, selector: _TYPE_FINDITER_SELECTOR, **kwargs):
+        # Compiled selectors are used as-is
+        if isinstance(selector, Selector):
+            return selector
+        return super().__new__(cls)
+
+    def __init__(
+            self,
+            selector: _TYPE_FINDITER_SELECTOR,
+            *,
+            __predicate__: typing.Optional[typing.Callable] = None
+        ) -> None:
+        if isinstance(selector, Selector):
+            return
+
+        names = set()  # type: typing.Set[str]
+        predicates = []  # type: typing.List[typing.Callable]
+        if __predicate__ is not None:
+            predicates.append(__predicate__)
+        elif isinstance(selector, (str, typing.Pattern, Selector)) or \
+                callable(selector) or \
+                not isinstance(selector, typing.Iterable):
+            self._compile(selector, names, predicates)
+        else:
+            for sel in selector:
+                self._compile(sel, names, predicates)
+            # e.g. a generator that can only be consumed once
+            selector = selector \
+                if isinstance(selector, (tuple, list, set, frozenset)) \
+                else tuple(names) + tuple(predicates)
+
+        super().__init__(
+            selector=selector,
+            _names=frozenset(names),
+            _predicate=predicates[0] \
+                if len(predicates) == 1 \
+                else _any(predicates) if predicates \
+                else None,
+        )
+
+    @staticmethod
+    def _compile(
+            selector: typing.Any,
+            names: typing.Set[str],
+            predicates: typing.List[typing.Callable],
+        ) -> None:
+        """
+        Compiles a single (non-iterable) selector into the ``names`` it
+        matches, or a predicate.
+
+        :param selector: see :paramref:`~forge.Selector.selector`
+        :param names: the names matched by the :class:`~forge.Selector`
+        :param predicates: the predicates of the :class:`~forge.Selector`
+        """
+        # pylint: disable=W0212, protected-access
+        if isinstance(selector, str):
+            names.add(selector)
+        elif isinstance(selector, Selector):
+            names.update(selector._names)
+            if selector._predicate is not None:
+                predicates.append(selector._predicate)
+        elif isinstance(selector, typing.Pattern):
+            match = selector.fullmatch
+            predicates.append(lambda param: match(param.name))
+        elif isinstance(selector, inspect._ParameterKind):
+            predicates.append(lambda param: param.kind is selector)
+        elif callable(selector):
+            predicates.append(selector)
+        else:
+            raise TypeError(
+                'selectors must be strings, regular expressions, parameter '
+                'kinds, callables or iterables, not {}'.format(selector)
+            )
+
+    def __str__(self) -> str:
+        return str(self.selector)
+
+    def __repr__(self) -> str:
+        return '<{} {!r}>'.format(type(self).__name__, self.selector)
+
+    def __call__(self, param: _T_PARAM) -> bool:
+        """
+        Matches a parameter.
+
+        :param param: an instance of :class:`inspect.Parameter` or
+            :class:`~forge.FParameter`
+        :returns: whether the parameter matches
+        """
+        if param.name in self._names:
+            return True
+        return self._predicate is not None and bool(self._predicate(param))
+
+    @classmethod
+    def glob(cls, pattern: str) -> 'Selector':
+        """
+        Creates a :class:`~forge.Selector` that matches the names of parameters
+        with a shell-style wildcard pattern (see :mod:`fnmatch`).
+
+        :param pattern: a pattern, e.g. ``'*_id'``
+        :returns: a :class:`~forge.Selector` for the pattern
+        """
+        match = re.compile(fnmatch.translate(pattern)).match
+        return cls(pattern, __predicate__=lambda param: match(param.name))
+
+    @classmethod
+    def kind(cls, *kinds: inspect._ParameterKind) -> 'Selector':
+        """
+        Creates a :class:`~forge.Selector` that matches parameters of any of
+        the :term:`parameter kinds <parameter kind>`.
+
+        :param kinds: :term:`parameter kinds <parameter kind>`, e.g.
+            :attr:`~forge.FParameter.KEYWORD_ONLY`
+        :returns: a :class:`~forge.Selector` for the kinds
+        """
+        kinds_ = frozenset(kinds)
+        return cls(kinds, __predicate__=lambda param: param.kind in kinds_)
+
+    @classmethod
+    def metadata(
+            cls,
+            *keys: typing.Hashable,
+            **items: typing.Any
+        ) -> 'Selector':
+        """
+        Creates a :class:`~forge.Selector` that matches parameters whose
+        :paramref:`~forge.FParameter.metadata` has all of the ``keys``, and
+        all of the ``items``.
+        Parameters without metadata (e.g. :class:`inspect.Parameter`) don't
+        match.
+
+        :param keys: keys that must be present in the metadata
+        :param items: key-value pairs that must be present in the metadata
+        :returns: a :class:`~forge.Selector` for the metadata
+        """
+        def predicate(param):
+            metadata = getattr(param, 'metadata', None) or {}
+            return all(key in metadata for key in keys) and all(
+                key in metadata and metadata[key] == value
+                for key, value in items.items()
+            )
+        return cls(
+            dict(zip(keys, [void] * len(keys)), **items),
+            __predicate__=predicate,
+        )
+
+    def find(
+            self,
+            parameters: _TYPE_FINDITER_PARAMETERS,
+        ) -> typing.Iterator[_T_PARAM]:
+        """
+        :param parameters: an iterable of :class:`inspect.Parameter` or
+            :class:`~forge.FParameter`
+        :returns: an iterator yielding the matching parameters, in order
+        """
+        if self._predicate is None and isinstance(parameters, FSignature):
+            data = parameters._data  # pylint: disable=W0212, protected-access
+            return iter([data[i] for i in self.indices(parameters)])
+        return filter(self, parameters)
+
+    def indices(
+            self,
+            parameters: _TYPE_FINDITER_PARAMETERS,
+        ) -> typing.Iterator[int]:
+        """
+        :param parameters: an iterable of :class:`inspect.Parameter` or
+            :class:`~forge.FParameter`
+        :returns: an iterator yielding the indices of the matching parameters,
+            in order
+        """
+        # pylint: disable=W0212, protected-access
+        if self._predicate is None and isinstance(parameters, FSignature):
+            # Look up (rather than scan for) the names
+            index = parameters._name_index()
+            if len(self._names) == 1:
+                for name in self._names:
+                    return iter(index.get(name, ()))
+            return iter(sorted(
+                i for name in self._names for i in index.get(name, ())
+            ))
+        return (i for i, param in enumerate(parameters) if self(param))
+
+
+def _any(
+        predicates: typing.List[typing.Callable]
+    ) -> typing.Callable[[typing.Any], bool]:
+    """
+    :param predicates: callables that receive a parameter
+    :returns: a predicate that matches if any of ``predicates`` matches
+    """
+    return lambda param: any(predicate(param) for predicate in predicates)
+
 def findparam(
         parameters: _TYPE_FINDITER_PARAMETERS,
         selector: _TYPE_FINDITER_SELECTOR
@@ -947,6 +1584,11 @@ def findparam(
         contained
     - callable: a parameter is found if the callable (which receives the
         parameter), returns a truthy value.
+    - a compiled regular expression, a :term:`parameter kind`, or a
+        :class:`~forge.Selector` (see :class:`~forge.Selector` for details).
+
+    Selectors that are used repeatedly can be compiled (once) with
+    :class:`~forge.Selector`.
 
     :param parameters: an iterable of :class:`inspect.Parameter` or
         :class:`~forge.FParameter`
@@ -954,15 +1596,25 @@ def findparam(
         parameter matches.
     :returns: an iterator yield parameters
     """
-    if isinstance(selector, str):
-        return filter(lambda param: param.name == selector, parameters)
-    elif isinstance(selector, typing.Iterable):
-        selector = list(selector)
-        return filter(
-            lambda param: param.name in selector,  # type: ignore
-            parameters,
-        )
-    return filter(selector, parameters) # else: callable(selector)
+    return Selector(selector).find(parameters)
+
+
+def findindex(
+        parameters: _TYPE_FINDITER_PARAMETERS,
+        selector: _TYPE_FINDITER_SELECTOR
+    ) -> typing.Iterator[int]:
+    """
+    Return an iterator yielding the indices of those parameters that are
+    matched by the selector (see :func:`~forge.findparam`), so that callers
+    can revise a sequence of parameters by position.
+
+    :param parameters: an iterable of :class:`inspect.Parameter` or
+        :class:`~forge.FParameter`
+    :param selector: an identifier which is used to determine whether a
+        parameter matches.
+    :returns: an iterator yielding indices of parameters
+    """
+    return Selector(selector).indices(parameters)
 
 
 def get_context_parameter(parameters: typing.Iterable[FParameter]):
@@ -1029,7 +1681,7 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
     :param __validate_parameters__: whether the sequence of provided parameters
         should be validated
     """
-    __slots__ = ('_data', 'return_annotation')
+    __slots__ = ('_data', '_names', '_base', '_valid', 'return_annotation')
 
     def __init__(
             self,
@@ -1040,14 +1692,83 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
         ) -> None:
         super().__init__(
             _data=list(parameters or ()),
+            _names=None,
+            _base=None,
+            _valid=None,
             return_annotation=return_annotation,
         )
         if __validate_parameters__:
             self.validate()
 
+    def _name_index(self) -> typing.Dict[str, typing.Tuple[int, ...]]:
+        """
+        Builds (once) an index of the positions of parameters by name.
+        Unvalidated signatures can have multiple parameters with a name.
+
+        :returns: a mapping of parameter names to their indices
+        """
+        if self._names is None:
+            index = {}  # type: typing.Dict[str, typing.Tuple[int, ...]]
+            for i, param in enumerate(self._data):
+                index[param.name] = index.get(param.name, ()) + (i,)
+            object.__setattr__(self, '_names', index)
+        return self._names
+
+    def _splice(
+            self,
+            start: int,
+            stop: int,
+            parameters: typing.Iterable[FParameter]
+        ) -> 'FSignature':
+        """
+        Builds an (unvalidated) signature that replaces the parameters
+        ``self[start:stop]`` with ``parameters``.
+        The result remembers the splice, so that if this signature is valid,
+        :meth:`~forge.FSignature.validate` only checks the spliced parameters
+        and their neighbours.
+
+        :param start: the index of the first replaced parameter
+        :param stop: the index after the last replaced parameter
+        :param parameters: the parameters to splice in
+        :returns: a new instance of :class:`~forge.FSignature`
+        """
+        start, stop, _ = slice(start, stop).indices(len(self._data))
+        stop = max(start, stop)
+        parameters = list(parameters)
+        spliced = type(self)(
+            self._data[:start] + parameters + self._data[stop:],
+            return_annotation=self.return_annotation,
+        )
+        object.__setattr__(
+            spliced,
+            '_base',
+            (self, start, stop, len(parameters)),
+        )
+        return spliced
+
     def __len__(self):
         return len(self._data)
 
+    def __iter__(self) -> typing.Iterator[FParameter]:
+        # In lieu of ``Sequence.__iter__``, which indexes via ``__getitem__``
+        return iter(self._data)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        # The parameters are held in a private slot, so they're compared here
+        if not isinstance(other, type(self)):
+            return False
+        return self.return_annotation == other.return_annotation and \
+            self._data == other._data
+
+    # Hashes the public fields (consistent with, if coarser than, ``__eq__``)
+    __hash__ = immutable.Immutable.__hash__
+
+    def __reduce__(self):
+        return (immutable.restore, (type(self), {
+            'parameters': self._data,
+            'return_annotation': self.return_annotation,
+        }))
+
     @typing.overload
     def __getitem__(self, index: int) -> FParameter:
         pass # pragma: no cover
@@ -1132,10 +1853,10 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
             return self._data[index]
 
         if isinstance(index, str):
-            for param in self._data:
-                if param.name == index:
-                    return param
-            raise KeyError(index)
+            try:
+                return self._data[self._name_index()[index][0]]
+            except KeyError:
+                raise KeyError(index) from None
 
         raise TypeError(
             "indices must be integers, strings or slices, not {}".\
@@ -1251,15 +1972,20 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
         :returns: a new copy of :class:`~forge.FSignature` revised with
             replacements
         """
-        return type(self)(  # type: ignore
+        replaced = type(self)(
             parameters=parameters \
                 if parameters is not void \
                 else self._data,
             return_annotation=return_annotation \
                 if return_annotation is not void \
                 else self.return_annotation,
-            __validate_parameters__=__validate_parameters__,
         )
+        if parameters is void:
+            # The parameters are unchanged, so their validity carries over
+            object.__setattr__(replaced, '_base', (self, 0, 0, 0))
+        if __validate_parameters__:
+            replaced.validate()
+        return replaced  # type: ignore
 
     @property
     def parameters(self) -> types.MappingProxyType:
@@ -1270,6 +1996,14 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
             collections.OrderedDict([(p.name, p) for p in self._data])
         )
 
+    @property
+    def validated(self) -> bool:
+        """
+        Whether the signature is known to be valid; i.e. it has passed
+        :meth:`~forge.FSignature.validate`
+        """
+        return self._valid is not None
+
     def validate(self):
         """
         Validation ensures:
@@ -1301,6 +2035,33 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
         - that no two instances of :class:`~forge.FParameter` share the same
             :paramref:`~forge.FParameter.name` or
             :paramref:`~forge.FParameter.interface_name`.
+
+        Signatures that pass validation are marked as
+        :attr:`~forge.FSignature.validated`, and aren't validated again.
+        For signatures derived from a validated signature by unit revisions
+        (e.g. :class:`~forge.insert`), only the revised parameters and their
+        neighbours are checked.
+        """
+        if self._valid is not None:
+            return
+
+        # Follow the splices back to a validated signature (if there is one)
+        chain = []
+        fsig = self
+        while fsig._valid is None and fsig._base is not None:
+            chain.append(fsig)
+            fsig = fsig._base[0]
+
+        if fsig._valid is None or \
+                not all(link._validate_splice() for link in reversed(chain)):
+            # Raises the same error as validation from scratch
+            self._validate_all()
+
+    def _validate_all(self) -> None:
+        """
+        Validates every parameter of the signature (see
+        :meth:`~forge.FSignature.validate`), and marks the signature as
+        validated.
         """
         # pylint: disable=R0912, too-many-branches
         name_set = set()  # type: typing.Set[str]
@@ -1336,33 +2097,121 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
                 )
             iname_set.add(current.interface_name)
 
-            last = self._data[i-1] if i > 0 else None
-            if not last:
-                continue
+            if i > 0:
+                self._validate_pair(self._data[i-1], current)
 
-            elif current.kind < last.kind:
+        # Parameters are usually exposed by name, so the sets are shared
+        object.__setattr__(self, '_valid', (
+            name_set,
+            name_set if iname_set == name_set else iname_set,
+        ))
+        object.__setattr__(self, '_base', None)
+
+    def _validate_splice(self) -> bool:
+        """
+        Validates the parameters spliced into a validated signature (see
+        :meth:`~forge.FSignature._splice`), and if they're valid, marks the
+        signature as validated.
+
+        :returns: whether the signature is valid
+        """
+        base, start, stop, count = self._base
+        names, inames = base._valid
+        removed = base._data[start:stop]
+        removed_names = {param.name for param in removed}
+        removed_inames = {param.interface_name for param in removed}
+        added_names = set()  # type: typing.Set[str]
+        added_inames = set()  # type: typing.Set[str]
+
+        for param in self._data[start:start + count]:
+            if not isinstance(param, FParameter) or \
+                    not (param.name and param.interface_name) or \
+                    param.name in added_names or \
+                    param.interface_name in added_inames or \
+                    (param.name in names and
+                     param.name not in removed_names) or \
+                    (param.interface_name in inames and
+                     param.interface_name not in removed_inames):
+                return False
+            added_names.add(param.name)
+            added_inames.add(param.interface_name)
+
+        # Only the spliced parameters and the parameter that follows them
+        # have new predecessors
+        for i in range(max(start, 1), min(start + count + 1, len(self))):
+            current = self._data[i]
+            if current.contextual:
+                return False
+            try:
+                self._validate_pair(self._data[i-1], current)
+            except (SyntaxError, TypeError):
+                return False
+
+        updated = self._update_names(names, removed_names, added_names)
+        object.__setattr__(self, '_valid', (
+            updated,
+            updated if inames is names and \
+                removed_inames == removed_names and \
+                added_inames == added_names \
+            else self._update_names(inames, removed_inames, added_inames),
+        ))
+        object.__setattr__(self, '_base', None)
+        return True
+
+    @staticmethod
+    def _update_names(
+            names: typing.Set[str],
+            removed: typing.Set[str],
+            added: typing.Set[str]
+        ) -> typing.Set[str]:
+        """
+        Updates a (shared) set of names, copying it only if it changes.
+
+        :param names: the names of a validated signature
+        :param removed: the names to remove
+        :param added: the names to add
+        :returns: the updated set of names
+        """
+        if not (removed or added):
+            return names
+        names = set(names)
+        names.difference_update(removed)
+        names.update(added)
+        return names
+
+    @staticmethod
+    def _validate_pair(last: FParameter, current: FParameter) -> None:
+        """
+        Validates the order of two adjacent parameters (see
+        :meth:`~forge.FSignature.validate`).
+
+        :param last: the preceding parameter
+        :param current: the parameter that follows
+            :paramref:`~forge.FSignature._validate_pair.last`
+        """
+        if current.kind < last.kind:
+            raise SyntaxError(
+                "'{current}' of kind '{current.kind.name}' follows "
+                "'{last}' of kind '{last.kind.name}'".\
+                format(current=current, last=last)
+            )
+        elif current.kind is last.kind:
+            if current.kind is FParameter.VAR_POSITIONAL:
+                raise TypeError(
+                    'Received multiple variable-positional parameters'
+                )
+            elif current.kind is FParameter.VAR_KEYWORD:
+                raise TypeError(
+                    'Received multiple variable-keyword parameters'
+                )
+            elif current.kind in (
+                    FParameter.POSITIONAL_ONLY,
+                    FParameter.POSITIONAL_OR_KEYWORD
+                ) \
+                and last.default is not empty \
+                and current.default is empty:
                 raise SyntaxError(
-                    "'{current}' of kind '{current.kind.name}' follows "
-                    "'{last}' of kind '{last.kind.name}'".\
-                    format(current=current, last=last)
+                    'non-default parameter follows default parameter'
                 )
-            elif current.kind is last.kind:
-                if current.kind is FParameter.VAR_POSITIONAL:
-                    raise TypeError(
-                        'Received multiple variable-positional parameters'
-                    )
-                elif current.kind is FParameter.VAR_KEYWORD:
-                    raise TypeError(
-                        'Received multiple variable-keyword parameters'
-                    )
-                elif current.kind in (
-                        FParameter.POSITIONAL_ONLY,
-                        FParameter.POSITIONAL_OR_KEYWORD
-                    ) \
-                    and last.default is not empty \
-                    and current.default is empty:
-                    raise SyntaxError(
-                        'non-default parameter follows default parameter'
-                    )
 
 fsignature = FSignature.from_callable  # Convenience
@@ -0,0 +1,126 @@
+import inspect
+import threading
+import typing
+
+import forge._immutable as immutable
+from forge._marker import empty, void
+from forge._revision import Mapper, MapperPlan, Revision, _wrap
+from forge._signature import FSignature
+
+
+class template:  # pylint: disable=C0103, invalid-name
+    """
+    Revises a callable once, and stamps out variants of the revised callable
+    that differ only in the values of their ``bound`` parameters (see
+    :meth:`~forge.template.specialize`).
+
+    The signature is revised and validated once, and the
+    :class:`~forge._revision.MapperPlan` is compiled once for each set of
+    specialized parameters, so variants share their plan and are created
+    without revising (or inspecting) the callable again.
+
+    .. testcode::
+
+        import forge
+
+        def request(method, url, **kwargs):
+            return method, url
+
+        with_method = forge.template(
+            forge.modify('method', kind=forge.FParameter.POSITIONAL_ONLY),
+            request,
+        )
+        get = with_method.specialize(method='GET')
+        post = with_method.specialize(method='POST')
+
+        assert forge.repr_callable(post) == 'request(url, **kwargs)'
+        assert post('/') == ('POST', '/')
+        assert get.__mapper__.plan is post.__mapper__.plan
+
+    :param revision: the :class:`~forge.Revision` shared by the variants
+    :param callable: the :term:`callable` to revise
+
+    :ivar callable: the underlying :term:`callable` (as decorated by the
+        :paramref:`~forge.template.revision`)
+    :ivar fsignature: the revised :class:`~forge.FSignature`
+    :ivar revision: see :paramref:`~forge.template.revision`
+    """
+    def __init__(
+            self,
+            revision: Revision,
+            callable: typing.Callable[..., typing.Any]
+        ) -> None:
+        # pylint: disable=W0622, redefined-builtin
+        revised = revision(callable)
+        self.revision = revision
+        self.callable = revised.__wrapped__  # type: ignore
+        self.fsignature = revised.__mapper__.fsignature  # type: ignore
+        self._plans = {}  # type: typing.Dict[typing.FrozenSet, MapperPlan]
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '<{} {}{}>'.format(
+            type(self).__name__,
+            getattr(self.callable, '__name__', self.callable),
+            self.fsignature,
+        )
+
+    def _plan(self, names: typing.FrozenSet[str]) -> MapperPlan:
+        """
+        Compiles (once) the plan of the variants that specialize the
+        parameters ``names``: the revised signature, with those parameters
+        ``bound``.
+
+        :param names: the names of the specialized parameters
+        :returns: the :class:`~forge._revision.MapperPlan` of the variants
+        """
+        plan = self._plans.get(names)
+        if plan is not None:
+            return plan
+
+        unknown = names.difference(self.fsignature.parameters)
+        if unknown:
+            raise TypeError(
+                "'{}' has no parameter(s) named {}".format(
+                    getattr(self.callable, '__name__', self.callable),
+                    ', '.join("'{}'".format(name) for name in sorted(unknown)),
+                )
+            )
+
+        # The variants supply the values, so the defaults are placeholders
+        fsignature = FSignature([
+            param.replace(
+                bound=True,
+                default=void if param.default is empty else param.default,
+            ) if param.name in names else param
+            for param in self.fsignature
+        ], return_annotation=self.fsignature.return_annotation)
+        fsignature.validate()
+
+        plan = MapperPlan.get(fsignature, inspect.signature(self.callable))
+        with self._lock:
+            return self._plans.setdefault(names, plan)
+
+    def specialize(
+            self,
+            **bound_values: typing.Any
+        ) -> typing.Callable[..., typing.Any]:
+        """
+        Stamps out a variant of the revised callable, with the
+        :paramref:`~forge.template.specialize.bound_values` supplied as the
+        arguments of their (``bound``) parameters.
+
+        :param bound_values: the values of the specialized parameters, by
+            name; like defaults, instances of :class:`~forge.Factory` are
+            called to generate the values
+        :returns: a function with the revised signature (less the specialized
+            parameters) that calls into the underlying callable
+        """
+        mapper = object.__new__(Mapper)
+        immutable.Immutable.__init__(
+            mapper,
+            bound_values=tuple(bound_values.items()),
+            callable=self.callable,
+            plan=self._plan(frozenset(bound_values)),
+        )
+        return _wrap(self.callable, mapper)
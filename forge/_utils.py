@@ -1,27 +1,86 @@
+import asyncio
 import inspect
+import operator
 import types
 import typing
 
-import forge._immutable as immutable
+from forge._exceptions import ImmutableInstanceError
 from forge._marker import empty
 
 
-class CallArguments(immutable.Immutable):
+def _restore_call_arguments(
+        cls: type,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> 'CallArguments':
+    """
+    Re-creates an instance of :class:`~forge.CallArguments`; used by
+    :meth:`~forge.CallArguments.__reduce__`, as the :term:`var-keyword`
+    arguments are exposed as an (unpicklable) :class:`types.MappingProxyType`.
+
+    :param cls: the class to instantiate
+    :param args: the positional arguments
+    :param kwargs: the keyword arguments
+    :returns: a new instance of ``cls``
+    """
+    return cls(*args, **kwargs)
+
+
+class CallArguments(tuple):
     """
     An immutable container for call arguments, i.e. term:`var-positional`
     (e.g. ``*args``) and :term:`var-keyword` (e.g. ``**kwargs``).
 
+    Instances are backed by a pair of ``(args, kwargs)``, so they're as cheap
+    to create as a :class:`tuple`, and can be unpacked as such.
+
     :param args: positional arguments used in a call
     :param kwargs: keyword arguments used in a call
     """
-    __slots__ = ('args', 'kwargs')
+    __slots__ = ()
 
-    def __init__(
-            self,
+    def __new__(
+            cls,
             *args: typing.Any,
             **kwargs: typing.Any
-        ) -> None:
-        super().__init__(args=args, kwargs=types.MappingProxyType(kwargs))
+        ) -> 'CallArguments':
+        return tuple.__new__(cls, (args, types.MappingProxyType(kwargs)))
+
+    args = property(
+        operator.itemgetter(0),
+        doc='positional arguments used in a call',
+    )
+    kwargs = property(
+        operator.itemgetter(1),
+        doc='keyword arguments used in a call',
+    )
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if not isinstance(other, CallArguments):
+            return False
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other: typing.Any) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __reduce__(self):
+        return (
+            _restore_call_arguments,
+            (type(self), self.args, dict(self.kwargs)),
+        )
+
+    def __setattr__(self, key: str, value: typing.Any):
+        """
+        Method exists to inhibit functionality of :func:`setattr`
+
+        :param key: ignored - can't set attributes
+        :param value: ignored - can't set attributes
+        :raises ImmutableInstanceError: attributes cannot be set on a
+            CallArguments instance
+        """
+        raise ImmutableInstanceError("cannot assign to field '{}'".format(key))
 
     def __repr__(self) -> str:
         arguments = ', '.join([
@@ -211,3 +270,22 @@ def repr_callable(callable: typing.Callable) -> str:
     sig = inspect.signature(callable)
     name = getattr(callable, '__name__', str(callable))
     return '{}{}'.format(name, sig)
+
+
+def markcoroutinefunction(func: typing.Callable) -> typing.Callable:
+    """
+    Marks a function that returns a coroutine as a coroutine function, for
+    :func:`inspect.iscoroutinefunction` (with
+    :func:`inspect.markcoroutinefunction` on Python 3.12+), and for
+    :func:`asyncio.iscoroutinefunction`.
+
+    :param func: a function that returns a coroutine
+    :returns: :paramref:`.markcoroutinefunction.func`
+    """
+    if hasattr(inspect, 'markcoroutinefunction'):
+        func = inspect.markcoroutinefunction(func)
+    # pylint: disable=W0212, protected-access
+    marker = getattr(asyncio.coroutines, '_is_coroutine', None)
+    if marker is not None:
+        func._is_coroutine = marker  # type: ignore
+    return func
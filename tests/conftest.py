@@ -24,3 +24,27 @@ def reset_run_validators():
     prerun = forge._config._run_validators
     yield
     forge._config._run_validators = prerun
+
+
+@pytest.fixture
+def reset_lean_coroutines():
+    """
+    Helper fixture that resets the state of the ``lean_coroutines`` to its
+    value before the test was run.
+    """
+    # pylint: disable=W0212, protected-access
+    prerun = forge._config._lean_coroutines
+    yield
+    forge._config._lean_coroutines = prerun
+
+
+@pytest.fixture
+def reset_intern_parameters():
+    """
+    Helper fixture that resets the state of the ``intern_parameters`` to its
+    value before the test was run.
+    """
+    # pylint: disable=W0212, protected-access
+    prerun = forge._config._intern_parameters
+    yield
+    forge._config._intern_parameters = prerun
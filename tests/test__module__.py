@@ -12,22 +12,50 @@ def test_namespace():
     """
     private_ptn = re.compile(r'^\_[a-zA-Z]')
     assert set(filter(private_ptn.match, forge.__dict__.keys())) == set([
+        '_cache',
+        '_concurrency',
         '_config',
         '_counter',
         '_exceptions',
         '_immutable',
+        '_inject',
         '_marker',
+        '_parallel',
+        '_recipe',
         '_revision',
+        '_scope',
         '_signature',
+        '_template',
         '_utils',
     ])
 
     public_ptn = re.compile(r'^[a-zA-Z]')
     assert set(filter(public_ptn.match, forge.__dict__.keys())) == set([
+        ## Cache
+        'cached_converter',
+        'memoize',
+
+        ## Concurrency
+        'batch_converter',
+        'batched',
+        'singleflight',
+        'to_async',
+
         ## Config
+        'get_intern_parameters',
+        'get_lean_coroutines',
         'get_run_validators',
+        'set_intern_parameters',
+        'set_lean_coroutines',
         'set_run_validators',
 
+        ## Parallel
+        'amap',
+        'parallel_map',
+
+        ## Recipe
+        'picklable',
+
         ## Revision
         'Revision',
         # unit
@@ -47,6 +75,7 @@ def test_namespace():
         'fsignature',
         'Factory',
         'FParameter',
+        'Selector',
         'findparam',
         # constructors
         'pos', 'pok', 'arg', 'kwo', 'kwarg', 'vkw', 'vpo',
@@ -55,6 +84,18 @@ def test_namespace():
         # variadic
         'args', 'kwargs',
 
+        ## Scope
+        'request_scope',
+
+        ## Template
+        'template',
+
+        ## Inject
+        'Provider',
+        'ProviderRegistry',
+        'inject',
+        'providers',
+
         ## Exceptions
         'ForgeError',
         'ImmutableInstanceError',
@@ -0,0 +1,509 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+import forge
+from forge._cache import (
+    Cache,
+    CacheInfo,
+    StripedCache,
+    cached_converter,
+    make_cache,
+    memoize,
+)
+from forge._marker import _void
+
+# pylint: disable=C0103, invalid-name
+# pylint: disable=R0201, no-self-use
+
+
+class Timer:
+    """
+    A manually-advanced timer for testing ``ttl`` expiry
+    """
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCache:
+    def test_get_set(self):
+        """
+        Ensure values are retrievable, and hits and misses are recorded
+        """
+        cache = Cache()
+        assert cache.get('a') is _void
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+        assert cache.info() == CacheInfo(1, 1, 128, 1)
+
+    def test_lru_eviction(self):
+        """
+        Ensure the least-recently used entry is evicted when full
+        """
+        cache = Cache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.keys() == ['a', 'c']
+
+    def test_ttl_eviction(self):
+        """
+        Ensure entries expire after ``ttl`` seconds
+        """
+        timer = Timer()
+        cache = Cache(ttl=10, timer=timer)
+        cache.set('a', 1)
+        timer.now = 9
+        assert cache.get('a') == 1
+        timer.now = 10
+        assert cache.get('a', None) is None
+        assert not cache.keys()
+
+    def test_fifo_eviction(self):
+        """
+        Ensure the oldest entry is evicted when full with the 'fifo' policy
+        """
+        cache = Cache(maxsize=2, policy='fifo')
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.keys() == ['b', 'c']
+
+    def test_maxsize_zero(self):
+        """
+        Ensure a cache with ``maxsize=0`` stores nothing
+        """
+        cache = Cache(maxsize=0)
+        cache.set('a', 1)
+        assert not cache.keys()
+
+    def test_discard(self):
+        """
+        Ensure ``discard`` removes an entry (if its value is ``value``, when
+        supplied) without recording a hit or miss
+        """
+        cache = Cache()
+        value = object()
+        cache.set('a', value)
+        cache.discard('a', object())
+        assert cache.keys() == ['a']
+        cache.discard('a', value)
+        cache.discard('b')
+        assert cache.info() == CacheInfo(0, 0, 128, 0)
+
+    def test_clear(self):
+        """
+        Ensure ``clear`` removes entries and resets statistics
+        """
+        cache = Cache()
+        cache.set('a', 1)
+        cache.get('a')
+        cache.clear()
+        assert cache.info() == CacheInfo(0, 0, 128, 0)
+
+    @pytest.mark.parametrize(('kwargs', 'message'), [
+        pytest.param(
+            {'maxsize': -1},
+            "'maxsize' must be None or a non-negative int",
+            id='maxsize',
+        ),
+        pytest.param(
+            {'ttl': 0},
+            "'ttl' must be None or a positive number",
+            id='ttl',
+        ),
+        pytest.param(
+            {'policy': 'lfu'},
+            "'policy' must be one of lru, fifo",
+            id='policy',
+        ),
+    ])
+    def test_invalid_raises(self, kwargs, message):
+        """
+        Ensure invalid ``maxsize`` and ``ttl`` values raise
+        """
+        with pytest.raises(ValueError) as excinfo:
+            Cache(**kwargs)
+        assert excinfo.value.args[0] == message
+
+
+class TestStripedCache:
+    def test_get_set(self):
+        """
+        Ensure values are retrievable across stripes, and statistics are
+        summed
+        """
+        cache = StripedCache(4, maxsize=8)
+        for key in range(4):
+            cache.set(key, key * 2)
+        assert [cache.get(key) for key in range(5)] == [0, 2, 4, 6, _void]
+        assert cache.info() == CacheInfo(4, 1, 8, 4)
+        assert sorted(cache.keys()) == [0, 1, 2, 3]
+
+        cache.clear()
+        assert cache.info() == CacheInfo(0, 0, 8, 0)
+
+    def test_maxsize(self):
+        """
+        Ensure each stripe holds an equal share of ``maxsize``
+        """
+        cache = StripedCache(2, maxsize=3)
+        for key in range(8):
+            cache.set(key, key)
+        # ints hash to themselves: stripes hold evens and odds respectively
+        assert sorted(cache.keys()) == [4, 5, 6, 7]
+
+    def test_make_cache(self):
+        """
+        Ensure a (plain) cache is made for a single stripe
+        """
+        assert type(make_cache(maxsize=4)) is Cache
+        assert type(make_cache(2, maxsize=4)) is StripedCache
+
+    def test_invalid_raises(self):
+        """
+        Ensure an invalid ``stripes`` raises
+        """
+        with pytest.raises(ValueError) as excinfo:
+            StripedCache(0)
+        assert excinfo.value.args[0] == "'stripes' must be a positive int"
+
+
+class TestCachedConverter:
+    def test_caches_on_ctx_name_value(self):
+        """
+        Ensure results are cached on ctx identity, parameter name and value
+        """
+        func = Mock(side_effect=lambda ctx, name, value: (name, value))
+        conv = cached_converter(func)
+        ctx1, ctx2 = object(), object()
+
+        assert conv(ctx1, 'a', 1) == conv(ctx1, 'a', 1) == ('a', 1)
+        assert func.call_count == 1
+        conv(ctx2, 'a', 1)
+        conv(ctx1, 'b', 1)
+        conv(ctx1, 'a', 2)
+        assert func.call_count == 4
+
+    def test_key(self):
+        """
+        Ensure ``key`` is used to build the cache key for the value
+        """
+        func = Mock(side_effect=lambda ctx, name, value: value)
+        conv = cached_converter(
+            func,
+            key=lambda ctx, name, value: value['id'],
+        )
+        assert conv(None, 'a', {'id': 1}) == {'id': 1}
+        assert conv(None, 'a', {'id': 1, 'x': 2}) == {'id': 1}
+        assert func.call_count == 1
+
+    def test_ttl(self):
+        """
+        Ensure cached results expire after ``ttl`` seconds
+        """
+        func = Mock(side_effect=lambda ctx, name, value: value)
+        conv = cached_converter(func, ttl=10)
+        timer = Timer()
+        conv.cache.timer = timer
+        conv(None, 'a', 1)
+        timer.now = 10
+        conv(None, 'a', 1)
+        assert func.call_count == 2
+
+    def test_cache_info_per_parameter(self):
+        """
+        Ensure statistics are reported per-parameter and in aggregate
+        """
+        conv = cached_converter(lambda ctx, name, value: value, maxsize=8)
+
+        @forge.sign(
+            forge.arg('a', converter=conv),
+            forge.arg('b', converter=conv),
+        )
+        def func(a, b):
+            return (a, b)
+
+        assert func(1, 2) == (1, 2)
+        assert func(1, 3) == (1, 3)
+        assert conv.cache_info('a') == CacheInfo(1, 1, 8, 1)
+        assert conv.cache_info('b') == CacheInfo(0, 2, 8, 2)
+        assert conv.cache_info() == CacheInfo(1, 3, 8, 3)
+
+        conv.cache_clear()
+        assert conv.cache_info() == CacheInfo(0, 0, 8, 0)
+
+    def test_in_converter_chain(self):
+        """
+        Ensure ``cached_converter`` composes with other converters
+        """
+        conv = cached_converter(lambda ctx, name, value: value * 2)
+        fparam = forge.arg('a', converter=[conv, lambda c, n, v: v + 1])
+        assert fparam(None, 2) == fparam(None, 2) == 5
+        assert conv.cache_info('a').hits == 1
+
+    def test_coroutine_function(self, loop):
+        """
+        Ensure the results of a coroutine converter are cached (rather than
+        its coroutines), that concurrent conversions share a call, and that
+        failures aren't cached
+        """
+        calls = []
+
+        async def convert(ctx, name, value):
+            calls.append(value)
+            await asyncio.sleep(0)
+            if value < 0:
+                raise ValueError(value)
+            return value * 2
+
+        conv = cached_converter(convert)
+
+        @forge.sign(forge.arg('a', converter=conv))
+        async def func(a):
+            return a
+
+        async def main():
+            first = await asyncio.gather(func(1), func(1))
+            return first + [await func(1)]
+
+        assert asyncio.iscoroutinefunction(conv.__call__)
+        assert loop.run_until_complete(main()) == [2, 2, 2]
+        assert calls == [1]
+        assert conv.cache_info('a') == CacheInfo(2, 1, 128, 1)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                loop.run_until_complete(func(-1))
+        assert calls == [1, -1, -1]
+        # evicting the failures doesn't count as looking them up
+        assert conv.cache.info() == CacheInfo(2, 3, 128, 1)
+
+    def test_coroutine_function_loops(self, loop):
+        """
+        Ensure conversions (which are bound to their event loop) aren't shared
+        across event loops
+        """
+        calls = []
+
+        async def convert(ctx, name, value):
+            calls.append(value)
+            if len(calls) == 1:
+                await asyncio.sleep(3600)
+            return value * 2
+
+        @forge.sign(forge.arg('a', converter=cached_converter(convert)))
+        async def func(a):
+            return a
+
+        pending = loop.create_task(func(1))
+        loop.run_until_complete(asyncio.sleep(0))
+        other = asyncio.new_event_loop()
+        try:
+            assert other.run_until_complete(func(1)) == 2
+        finally:
+            other.close()
+        assert calls == [1, 1]
+
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            loop.run_until_complete(pending)
+
+    @pytest.mark.parametrize(('stripes',), [(1,), (4,)])
+    def test_thread_safety(self, stripes):
+        """
+        Ensure concurrent conversions are consistent and statistics are exact
+        """
+        conv = cached_converter(
+            lambda ctx, name, value: value,
+            maxsize=16,
+            stripes=stripes,
+        )
+        barrier = threading.Barrier(8)
+
+        def work():
+            barrier.wait()
+            for i in range(500):
+                assert conv(None, 'a', i % 32) == i % 32
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = conv.cache_info('a')
+        assert info.hits + info.misses == 8 * 500
+        assert info.currsize <= 16
+
+    def test_thread_churn(self):
+        """
+        Ensure the statistics of exited threads are retained, without
+        accumulating per thread
+        """
+        conv = cached_converter(lambda ctx, name, value: value)
+        for _ in range(20):
+            thread = threading.Thread(target=conv, args=(None, 'a', 1))
+            thread.start()
+            thread.join()
+        assert len(conv._stats) <= 1  # pylint: disable=W0212, protected-access
+        assert conv.cache_info('a') == CacheInfo(19, 1, 128, 1)
+
+        conv.cache_clear()
+        assert conv.cache_info('a') == CacheInfo(0, 0, 128, 0)
+
+
+class TestMemoize:
+    def test_normalized_arguments(self):
+        """
+        Ensure that calls which map to the same arguments share an entry
+        """
+        mock = Mock(return_value=3)
+
+        @memoize()
+        def func(a, b=2):
+            return mock(a, b)
+
+        assert func(1, b=2) == func(a=1, b=2) == func(1) == 3
+        mock.assert_called_once_with(1, 2)
+        assert func.cache_info() == CacheInfo(2, 1, 128, 1)
+
+        func(2)
+        assert mock.call_count == 2
+
+    def test_variadic_arguments(self):
+        """
+        Ensure that var-positional and var-keyword arguments are cached
+        """
+        mock = Mock(side_effect=lambda *args, **kwargs: (args, kwargs))
+        func = memoize()(lambda *args, **kwargs: mock(*args, **kwargs))
+
+        assert func(1, b=2) == ((1,), {'b': 2})
+        assert func(1, b=2) == ((1,), {'b': 2})
+        assert func(1, b=3) == ((1,), {'b': 3})
+        assert func(1, 2) == ((1, 2), {})
+        assert mock.call_count == 3
+
+    @pytest.mark.parametrize(('typed', 'call_count'), [
+        pytest.param(True, 2, id='typed'),
+        pytest.param(False, 1, id='untyped'),
+    ])
+    def test_typed(self, typed, call_count):
+        """
+        Ensure that ``typed`` caches values of different types separately
+        """
+        mock = Mock()
+        func = memoize(typed=typed)(lambda a: mock(a))
+        func(1)
+        func(1.0)
+        assert mock.call_count == call_count
+
+    def test_maxsize(self):
+        """
+        Ensure that ``maxsize`` bounds the cache
+        """
+        func = memoize(maxsize=2)(lambda a: a)
+        for i in range(4):
+            func(i)
+        assert func.cache_info().currsize == 2
+
+    def test_stripes(self):
+        """
+        Ensure that a striped cache is consistent when called concurrently
+        """
+        mock = Mock(side_effect=lambda a: a * 2)
+        func = memoize(maxsize=64, stripes=8)(lambda a: mock(a))
+        barrier = threading.Barrier(8)
+        results = []
+
+        def work():
+            barrier.wait()
+            results.append([func(i % 32) for i in range(500)])
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [[i % 32 * 2 for i in range(500)]] * 8
+        info = func.cache_info()
+        assert info.hits + info.misses == 8 * 500
+        assert (info.maxsize, info.currsize) == (64, 32)
+        # a value may be computed by several threads that miss concurrently
+        assert 32 <= mock.call_count <= 8 * 32
+
+    def test_cache_clear(self):
+        """
+        Ensure that ``cache_clear`` empties the cache
+        """
+        mock = Mock()
+        func = memoize()(lambda a: mock(a))
+        func(1)
+        func.cache_clear()
+        func(1)
+        assert mock.call_count == 2
+        assert func.cache_info() == CacheInfo(0, 1, 128, 1)
+
+    def test_converted_arguments(self):
+        """
+        Ensure that the cache is keyed on converted arguments
+        """
+        mock = Mock()
+
+        @forge.compose(
+            memoize(),
+            forge.modify('a', converter=lambda ctx, name, value: int(value)),
+        )
+        def func(a):
+            return mock(a)
+
+        func('1')
+        func(1)
+        mock.assert_called_once_with(1)
+
+    def test_retained_when_revised(self):
+        """
+        Ensure that a memoized callable retains its cache when revised
+        """
+        mock = Mock()
+        func = memoize()(lambda a: mock(a))
+        func2 = forge.modify('a', name='b', default=1)(func)
+
+        assert forge.repr_callable(func2) == '<lambda>(b=1)'
+        func(1)
+        func2()
+        func2(b=1)
+        mock.assert_called_once_with(1)
+        assert func2.cache_info() == CacheInfo(2, 1, 128, 1)
+
+    def test_coroutine(self, loop):
+        """
+        Ensure that the awaited results of coroutine functions are cached
+        """
+        mock = Mock()
+
+        @memoize()
+        async def func(a):
+            return mock(a)
+
+        assert asyncio.iscoroutinefunction(func)
+        loop.run_until_complete(func(1))
+        loop.run_until_complete(func(a=1))
+        mock.assert_called_once_with(1)
+
+    def test_unhashable_raises(self):
+        """
+        Ensure that unhashable arguments raise ``TypeError`` (as with
+        ``functools.lru_cache``)
+        """
+        func = memoize()(lambda a: a)
+        with pytest.raises(TypeError):
+            func([])
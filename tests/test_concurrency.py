@@ -0,0 +1,677 @@
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+import time
+import typing
+from unittest.mock import Mock
+
+import pytest
+
+import forge
+from forge._concurrency import (
+    OffloadInfo,
+    batch_converter,
+    batched,
+    singleflight,
+    to_async,
+)
+
+# pylint: disable=C0103, invalid-name
+# pylint: disable=R0201, no-self-use
+
+
+class TestSingleflight:
+    def test_coroutine_coalesced(self, loop):
+        """
+        Ensure concurrent coroutine calls with equivalent arguments share a
+        single call of the underlying coroutine function
+        """
+        mock = Mock(side_effect=lambda a, b: a + b)
+
+        @singleflight()
+        async def func(a, b=2):
+            await asyncio.sleep(0)
+            return mock(a, b)
+
+        assert asyncio.iscoroutinefunction(func)
+        results = loop.run_until_complete(asyncio.gather(
+            func(1), func(1, 2), func(a=1, b=2), func(2),
+        ))
+        assert results == [3, 3, 3, 4]
+        assert mock.call_count == 2
+
+    def test_coroutine_not_retained(self, loop):
+        """
+        Ensure results aren't retained after the call completes
+        """
+        mock = Mock()
+
+        @singleflight()
+        async def func(a):
+            return mock(a)
+
+        loop.run_until_complete(func(1))
+        loop.run_until_complete(func(1))
+        assert mock.call_count == 2
+
+    def test_coroutine_exception_shared(self, loop):
+        """
+        Ensure every concurrent caller receives the exception
+        """
+        mock = Mock(side_effect=ValueError('failed'))
+
+        @singleflight()
+        async def func(a):
+            await asyncio.sleep(0)
+            return mock(a)
+
+        results = loop.run_until_complete(asyncio.gather(
+            func(1), func(1), return_exceptions=True,
+        ))
+        assert [type(r) for r in results] == [ValueError, ValueError]
+        assert mock.call_count == 1
+
+    def test_coroutine_cancellation_isolated(self, loop):
+        """
+        Ensure cancelling one caller doesn't cancel the shared call
+        """
+        @singleflight()
+        async def func(a):
+            await asyncio.sleep(0.01)
+            return a
+
+        async def main():
+            first = asyncio.ensure_future(func(1))
+            second = asyncio.ensure_future(func(1))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert loop.run_until_complete(main()) == 1
+
+    def test_sync_coalesced(self):
+        """
+        Ensure concurrent calls from multiple threads with equivalent
+        arguments share a single call of the underlying function
+        """
+        started, release = threading.Event(), threading.Event()
+        mock = Mock(side_effect=lambda a: a * 2)
+
+        @singleflight()
+        def func(a):
+            started.set()
+            release.wait()
+            return mock(a)
+
+        results = []
+        def call(**kwargs):
+            results.append(func(**kwargs))
+
+        leader = threading.Thread(target=call, kwargs={'a': 1})
+        leader.start()
+        started.wait()
+        followers = [
+            threading.Thread(target=call, kwargs={'a': 1}) for _ in range(4)
+        ]
+        for thread in followers:
+            thread.start()
+        # Allow the followers to reach the in-flight call
+        time.sleep(0.1)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert results == [2] * 5
+        mock.assert_called_once_with(1)
+
+    def test_sync_exception_shared(self):
+        """
+        Ensure every concurrent caller receives the exception
+        """
+        started, release = threading.Event(), threading.Event()
+
+        @singleflight()
+        def func(a):
+            started.set()
+            release.wait()
+            raise ValueError(a)
+
+        errors = []
+        def call():
+            try:
+                func(1)
+            except ValueError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 3
+
+    def test_revised(self):
+        """
+        Ensure coalescing is retained when the wrapper is revised
+        """
+        func = singleflight()(lambda a: a)
+        func2 = forge.modify('a', name='b')(func)
+        assert func2.__wrapped__ is func.__wrapped__
+        assert func2(b=1) == 1
+
+    def test_sync_reentrant(self):
+        """
+        Ensure a re-entrant call (with the same arguments) calls through,
+        rather than waiting for itself
+        """
+        calls = []
+
+        @singleflight()
+        def countdown(n):
+            calls.append(n)
+            return countdown(n) if len(calls) < 3 else n
+
+        # Fails (rather than hangs) if the re-entrant call waits for itself
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(countdown(1)),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout=1)
+        assert results == [1]
+        assert calls == [1, 1, 1]
+
+    def test_coroutine_reentrant(self, loop):
+        """
+        Ensure a re-entrant call of a coroutine function (with the same
+        arguments) calls through, rather than awaiting itself
+        """
+        calls = []
+
+        @singleflight()
+        async def countdown(n):
+            calls.append(n)
+            return await countdown(n) if len(calls) < 3 else n
+
+        assert loop.run_until_complete(
+            asyncio.wait_for(countdown(1), timeout=1)
+        ) == 1
+        assert calls == [1, 1, 1]
+
+
+    def test_unhashable(self, loop):
+        """
+        Ensure calls with unhashable arguments call through, rather than
+        raising
+        """
+        @singleflight()
+        def func(a):
+            return len(a)
+
+        @singleflight()
+        async def afunc(a):
+            return len(a)
+
+        assert func([1, 2]) == 2
+        assert loop.run_until_complete(asyncio.gather(
+            afunc([1]), afunc([1]),
+        )) == [1, 1]
+
+
+class TestToAsync:
+    def test_offloaded(self, loop):
+        """
+        Ensure the wrapper is a coroutine function with the revised
+        signature, that arguments are mapped on the event loop, and that the
+        callable runs on another thread
+        """
+        threads = {}
+
+        def converter(ctx, name, value):
+            threads['map'] = threading.current_thread()
+            return value * 2
+
+        @forge.compose(
+            to_async(),
+            forge.modify('a', converter=converter),
+        )
+        def func(a, b=1):
+            threads['call'] = threading.current_thread()
+            return a + b
+
+        assert asyncio.iscoroutinefunction(func)
+        assert forge.repr_callable(func) == 'func(a, b=1)'
+        assert loop.run_until_complete(func(1)) == 3
+        assert threads['map'] is threading.current_thread()
+        assert threads['call'] is not threading.current_thread()
+
+    def test_limit(self, loop):
+        """
+        Ensure at most ``limit`` calls run concurrently, and that waiting
+        calls are reported as queued
+        """
+        lock = threading.Lock()
+        running, peak = [0], [0]
+        infos = []
+
+        @to_async(limit=2)
+        def func():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        async def main():
+            tasks = [asyncio.ensure_future(func()) for _ in range(6)]
+            await asyncio.sleep(0.01)
+            infos.append(func.offload_info())
+            await asyncio.gather(*tasks)
+
+        loop.run_until_complete(main())
+        assert peak[0] == 2
+        assert infos[0][:3] == (4, 2, 0)
+
+        info = func.offload_info()
+        assert info[:3] == (0, 0, 6)
+        assert 0 < info.mean_latency <= info.max_latency
+
+    def test_exception(self, loop):
+        """
+        Ensure exceptions are raised to the caller and the call is recorded
+        """
+        @to_async()
+        def func():
+            raise ValueError()
+
+        with pytest.raises(ValueError):
+            loop.run_until_complete(func())
+        assert func.offload_info()[:3] == (0, 0, 1)
+
+    def test_executor(self, loop):
+        """
+        Ensure a supplied executor is used
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+        submit = Mock(side_effect=executor.submit)
+        executor.submit = submit
+        func = to_async(executor)(lambda a: a)
+        assert loop.run_until_complete(func(1)) == 1
+        submit.assert_called_once()
+        executor.shutdown()
+
+    def test_default_executor(self, loop):
+        """
+        Ensure the loop's default executor is used (rather than an executor
+        owned by each wrapper), and that ``limit`` is still enforced
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(4)
+        submit = Mock(side_effect=executor.submit)
+        executor.submit = submit
+        loop.set_default_executor(executor)
+
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        funcs = [to_async(limit=2)(work) for _ in range(3)]
+        loop.run_until_complete(asyncio.gather(*[funcs[0]() for _ in range(4)]))
+        assert peak[0] == 2
+        loop.run_until_complete(asyncio.gather(*[func() for func in funcs]))
+        assert submit.call_count == 7
+        executor.shutdown()
+
+    def test_retained_when_revised(self, loop):
+        """
+        Ensure the offloading behavior is retained when revised
+        """
+        func = forge.modify('a', name='b')(to_async()(lambda a: a))
+        assert asyncio.iscoroutinefunction(func)
+        assert loop.run_until_complete(func(b=1)) == 1
+        assert isinstance(func.offload_info(), OffloadInfo)
+        assert func.offload_info().completed == 1
+
+    def test_coroutine_raises(self):
+        """
+        Ensure coroutine functions can't be offloaded
+        """
+        async def func():
+            pass
+        with pytest.raises(TypeError) as excinfo:
+            to_async()(func)
+        assert excinfo.value.args[0].startswith(
+            'to_async requires a synchronous callable'
+        )
+
+    def test_invalid_raises(self):
+        """
+        Ensure an invalid ``limit`` raises
+        """
+        with pytest.raises(ValueError) as excinfo:
+            to_async(limit=0)
+        assert excinfo.value.args[0] == "'limit' must be None or a positive int"
+
+
+class TestBatched:
+    def test_coroutine_batched(self, loop):
+        """
+        Ensure concurrent coroutine calls are gathered into one batch call,
+        with results scattered in order
+        """
+        batches = []
+
+        @batched(max_size=10, max_wait_ms=5)
+        async def func(a, b=1, *, c=0):
+            batches.append((a, b, c))
+            return [x * y + z for x, y, z in zip(a, b, c)]
+
+        assert forge.repr_callable(func) == 'func(a, b=1, *, c=0)'
+        results = loop.run_until_complete(asyncio.gather(
+            func(1), func(2, 3), func(a=4, c=5),
+        ))
+        assert results == [1, 6, 9]
+        assert batches == [([1, 2, 4], [1, 3, 1], [0, 0, 5])]
+
+    def test_annotations(self):
+        """
+        Ensure the annotations of the batch function are unwrapped to those
+        of a single call
+        """
+        @batched()
+        def func(a: typing.List[int], b: 'c' = 1, d=2) -> typing.List[str]:
+            return [str(x) for x in a]
+
+        signature = inspect.signature(func)
+        assert [param.annotation for param in signature.parameters.values()]\
+            == [int, inspect.Parameter.empty, inspect.Parameter.empty]
+        assert signature.return_annotation is str
+        assert func(1) == '1'
+
+    def test_coroutine_max_size(self, loop):
+        """
+        Ensure a full batch is dispatched immediately
+        """
+        batches = []
+
+        @batched(max_size=2, max_wait_ms=1000)
+        async def func(a):
+            batches.append(a)
+            return a
+
+        results = loop.run_until_complete(asyncio.gather(
+            *[func(i) for i in range(5)]
+        ))
+        assert results == list(range(5))
+        assert batches[:2] == [[0, 1], [2, 3]]
+
+    def test_coroutine_exception(self, loop):
+        """
+        Ensure every caller in a batch receives the batch's exception
+        """
+        @batched(max_wait_ms=0)
+        async def func(a):
+            raise ValueError(a)
+
+        results = loop.run_until_complete(asyncio.gather(
+            func(1), func(2), return_exceptions=True,
+        ))
+        assert [type(r) for r in results] == [ValueError, ValueError]
+
+    def test_coroutine_cancelled(self, loop):
+        """
+        Ensure every caller in a batch is cancelled if the batch function is
+        cancelled (rather than awaiting forever)
+        """
+        @batched(max_wait_ms=0)
+        async def func(a):
+            raise asyncio.CancelledError()
+
+        results = loop.run_until_complete(asyncio.wait_for(
+            asyncio.gather(func(1), func(2), return_exceptions=True),
+            timeout=1,
+        ))
+        assert [type(r) for r in results] == \
+            [asyncio.CancelledError, asyncio.CancelledError]
+
+    def test_result_count_mismatch(self, loop):
+        """
+        Ensure a batch function returning the wrong number of results raises
+        """
+        @batched(max_wait_ms=0)
+        async def func(a):
+            return []
+
+        with pytest.raises(ValueError) as excinfo:
+            loop.run_until_complete(func(1))
+        assert excinfo.value.args[0] == \
+            'batch function returned 0 results for 1 calls'
+
+    def test_threads_batched(self):
+        """
+        Ensure calls from multiple threads are gathered into batch calls
+        """
+        batches = []
+
+        @batched(max_size=4, max_wait_ms=1000)
+        def func(a):
+            batches.append(a)
+            return [x * 2 for x in a]
+
+        results = {}
+        def call(i):
+            results[i] = func(i)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {i: i * 2 for i in range(8)}
+        assert sorted(len(batch) for batch in batches) == [4, 4]
+
+    def test_threads_max_wait(self):
+        """
+        Ensure a lone call is dispatched after ``max_wait_ms``
+        """
+        func = batched(max_wait_ms=1)(lambda a: a)
+        assert func(1) == 1
+
+    def test_threads_exception(self):
+        """
+        Ensure the batch's exception is raised
+        """
+        def func(a):
+            raise ValueError(a)
+
+        with pytest.raises(ValueError):
+            batched(max_wait_ms=0)(func)(1)
+
+    @pytest.mark.parametrize(('func', 'name'), [
+        pytest.param(lambda *args: args, 'args', id='var_positional'),
+        pytest.param(lambda **kwargs: kwargs, 'kwargs', id='var_keyword'),
+    ])
+    def test_variadic_raises(self, func, name):
+        """
+        Ensure batch functions with variadic parameters are rejected
+        """
+        with pytest.raises(TypeError) as excinfo:
+            batched()(func)
+        assert excinfo.value.args[0] == \
+            "batched callables cannot have variadic parameter '{}'".\
+            format(name)
+
+    @pytest.mark.parametrize(('kwargs', 'message'), [
+        pytest.param(
+            {'max_size': 0},
+            "'max_size' must be a positive int",
+            id='max_size',
+        ),
+        pytest.param(
+            {'max_wait_ms': -1},
+            "'max_wait_ms' must be a non-negative number",
+            id='max_wait_ms',
+        ),
+    ])
+    def test_invalid_raises(self, kwargs, message):
+        """
+        Ensure invalid ``max_size`` and ``max_wait_ms`` values raise
+        """
+        with pytest.raises(ValueError) as excinfo:
+            batched(**kwargs)
+        assert excinfo.value.args[0] == message
+
+
+class TestBatchConverter:
+    def test_batched_and_deduplicated(self, loop):
+        """
+        Ensure values converted in the same loop iteration are loaded in a
+        single (de-duplicated) batch
+        """
+        load = Mock(side_effect=lambda keys: [k * 10 for k in keys])
+
+        @forge.modify('a', converter=batch_converter(load))
+        async def func(a):
+            return a
+
+        results = loop.run_until_complete(asyncio.gather(
+            func(1), func(2), func(1),
+        ))
+        assert results == [10, 20, 10]
+        load.assert_called_once_with([1, 2])
+
+    def test_coroutine_load(self, loop):
+        """
+        Ensure the ``load`` function can be a coroutine function
+        """
+        async def load(keys):
+            return [str(k) for k in keys]
+
+        func = forge.modify('a', converter=batch_converter(load))(
+            self._identity
+        )
+        assert loop.run_until_complete(func(1)) == '1'
+
+    def test_max_size(self, loop):
+        """
+        Ensure batches are dispatched when they reach ``max_size``
+        """
+        load = Mock(side_effect=lambda keys: keys)
+        func = forge.modify('a', converter=batch_converter(load, max_size=2))(
+            self._identity
+        )
+        loop.run_until_complete(asyncio.gather(*[func(i) for i in range(5)]))
+        assert [c[0][0] for c in load.call_args_list] == [[0, 1], [2, 3], [4]]
+
+    def test_key(self, loop):
+        """
+        Ensure ``key`` determines the keys passed to ``load``
+        """
+        load = Mock(side_effect=lambda keys: keys)
+        conv = batch_converter(load, key=lambda ctx, name, value: value['id'])
+        func = forge.modify('a', converter=conv)(self._identity)
+        assert loop.run_until_complete(func({'id': 1})) == 1
+        load.assert_called_once_with([1])
+
+    def test_request_scope(self, loop):
+        """
+        Ensure values are re-used within a ``request_scope``, but not across
+        scopes
+        """
+        load = Mock(side_effect=lambda keys: keys)
+        func = forge.modify('a', converter=batch_converter(load))(
+            self._identity
+        )
+
+        async def request():
+            async with forge.request_scope():
+                await func(1)
+                await func(1)
+
+        loop.run_until_complete(request())
+        assert load.call_count == 1
+        loop.run_until_complete(request())
+        assert load.call_count == 2
+
+    def test_exceptions(self, loop):
+        """
+        Ensure that exceptions from ``load`` (or returned in lieu of values)
+        are raised to the awaiting callers
+        """
+        def load(keys):
+            return [ValueError(k) if k < 0 else k for k in keys]
+        func = forge.modify('a', converter=batch_converter(load))(
+            self._identity
+        )
+
+        results = loop.run_until_complete(asyncio.gather(
+            func(1), func(-1), return_exceptions=True,
+        ))
+        assert results[0] == 1
+        assert isinstance(results[1], ValueError)
+
+        func2 = forge.modify('a', converter=batch_converter(lambda keys: []))(
+            self._identity
+        )
+        with pytest.raises(ValueError) as excinfo:
+            loop.run_until_complete(func2(1))
+        assert excinfo.value.args[0] == \
+            'load function returned 0 values for 1 keys'
+
+    def test_load_cancelled(self, loop):
+        """
+        Ensure every caller in a batch is cancelled if ``load`` is cancelled
+        (rather than awaiting forever)
+        """
+        async def load(keys):
+            raise asyncio.CancelledError()
+
+        func = forge.modify('a', converter=batch_converter(load))(
+            self._identity
+        )
+        results = loop.run_until_complete(asyncio.wait_for(
+            asyncio.gather(func(1), func(2), return_exceptions=True),
+            timeout=1,
+        ))
+        assert [type(r) for r in results] == \
+            [asyncio.CancelledError, asyncio.CancelledError]
+
+    def test_sync_callable_raises(self):
+        """
+        Ensure coroutine converters can't be used with synchronous callables
+        """
+        conv = batch_converter(lambda keys: keys)
+        with pytest.raises(TypeError) as excinfo:
+            forge.modify('a', converter=conv)(lambda a: a)
+        assert excinfo.value.args[0].startswith(
+            'Coroutine factories, converters and validators require a '
+            'coroutine function'
+        )
+
+    def test_invalid_raises(self):
+        """
+        Ensure an invalid ``max_size`` raises
+        """
+        with pytest.raises(ValueError) as excinfo:
+            batch_converter(lambda keys: keys, max_size=0)
+        assert excinfo.value.args[0] == \
+            "'max_size' must be None or a positive int"
+
+    @staticmethod
+    async def _identity(a):
+        return a
@@ -3,7 +3,14 @@ from unittest.mock import Mock
 import pytest
 
 import forge._config
-from forge._config import get_run_validators, set_run_validators
+from forge._config import (
+    get_intern_parameters,
+    get_lean_coroutines,
+    get_run_validators,
+    set_intern_parameters,
+    set_lean_coroutines,
+    set_run_validators,
+)
 
 # pylint: disable=C0103, invalid-name
 # pylint: disable=R0201, no-self-use
@@ -35,3 +42,59 @@ class TestRunValidators:
         with pytest.raises(TypeError) as excinfo:
             set_run_validators(Mock())
         assert excinfo.value.args[0] == "'run' must be bool."
+
+
+@pytest.mark.usefixtures('reset_lean_coroutines')
+class TestLeanCoroutines:
+    def test_get_lean_coroutines(self):
+        """
+        Ensure ``get_lean_coroutines`` is global.
+        """
+        lcmock = Mock()
+        forge._config._lean_coroutines = lcmock
+        assert get_lean_coroutines() == lcmock
+
+    @pytest.mark.parametrize(('val',), [(True,), (False,)])
+    def test_set_lean_coroutines(self, val):
+        """
+        Ensure ``set_lean_coroutines`` is global.
+        """
+        forge._config._lean_coroutines = not val
+        set_lean_coroutines(val)
+        assert forge._config._lean_coroutines == val
+
+    def test_set_lean_coroutines_bad_param_raises(self):
+        """
+        Ensure calling ``set_lean_coroutines`` with a non-boolean raises.
+        """
+        with pytest.raises(TypeError) as excinfo:
+            set_lean_coroutines(Mock())
+        assert excinfo.value.args[0] == "'lean' must be bool."
+
+
+@pytest.mark.usefixtures('reset_intern_parameters')
+class TestInternParameters:
+    def test_get_intern_parameters(self):
+        """
+        Ensure ``get_intern_parameters`` is global.
+        """
+        ipmock = Mock()
+        forge._config._intern_parameters = ipmock
+        assert get_intern_parameters() == ipmock
+
+    @pytest.mark.parametrize(('val',), [(True,), (False,)])
+    def test_set_intern_parameters(self, val):
+        """
+        Ensure ``set_intern_parameters`` is global.
+        """
+        forge._config._intern_parameters = not val
+        set_intern_parameters(val)
+        assert forge._config._intern_parameters == val
+
+    def test_set_intern_parameters_bad_param_raises(self):
+        """
+        Ensure calling ``set_intern_parameters`` with a non-boolean raises.
+        """
+        with pytest.raises(TypeError) as excinfo:
+            set_intern_parameters(Mock())
+        assert excinfo.value.args[0] == "'intern' must be bool."
@@ -1,3 +1,6 @@
+import concurrent.futures
+import sys
+
 from forge._counter import Counter, CreationOrderMeta
 
 
@@ -25,3 +28,28 @@ def test_cretion_order_meta():
     for i, kls in enumerate([klass1, klass2]):
         assert hasattr(kls, '_creation_order')
         assert i == kls._creation_order
+
+
+def test_creation_order_meta_threads():
+    """
+    Ensure that instances created concurrently in many threads are assigned
+    distinct, increasing ``_creation_order`` values.
+    """
+    class Klass(metaclass=CreationOrderMeta):
+        pass
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            batches = list(executor.map(
+                lambda _: [Klass()._creation_order for _ in range(2000)],
+                range(8),
+            ))
+    finally:
+        sys.setswitchinterval(interval)
+
+    orders = [order for batch in batches for order in batch]
+    assert sorted(orders) == list(range(len(orders)))
+    for batch in batches:
+        assert batch == sorted(batch)
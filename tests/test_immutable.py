@@ -1,7 +1,12 @@
 import pytest
 
 from forge._exceptions import ImmutableInstanceError
-from forge._immutable import Immutable, asdict, replace
+from forge._immutable import (
+    Immutable,
+    asdict,
+    fields,
+    replace,
+)
 
 # pylint: disable=C0103, invalid-name
 # pylint: disable=R0201, no-self-use
@@ -40,6 +45,20 @@ class TestAsDict:
         assert asdict(ins) == kwargs
 
 
+def test_fields():
+    """
+    Ensure that ``fields`` collects the slots of a class and its bases, in
+    order, excluding ``__weakref__``
+    """
+    class Parent:
+        __slots__ = ('a', '__weakref__')
+
+    class Child(Parent):
+        __slots__ = 'b'
+
+    assert fields(Child) == ('a', 'b')
+
+
 def test_replace():
     """
     Ensure that ``replace`` produces a varied copy
@@ -108,21 +127,104 @@ class TestImmutable:
 
         assert Klass1(1) != Klass2(1)
 
-    def test__getattr__(self):
+    def test__init__partial(self):
         """
-        Ensure ``__getattr__`` passes request to ``super().__getattribute__``
+        Ensure that fields that aren't provided are left unset
         """
-        class Parent:
-            called_with = None
-            def __getattribute__(self, key):
-                type(self).called_with = key
-
-        class Klass(Immutable, Parent):
-            pass
+        class Klass(Immutable):
+            __slots__ = ('a', '_b')
+            def __init__(self):
+                super().__init__(a=1)
 
         ins = Klass()
-        assert not ins.default
-        assert Klass.called_with == 'default'
+        assert ins.a == 1
+        assert not hasattr(ins, '_b')
+
+    def test__init__new(self):
+        """
+        Ensure that ``Immutable.__init__`` sets the fields (including those of
+        base classes) of an instance created with ``object.__new__``, and
+        rejects unknown fields
+        """
+        class Parent(Immutable):
+            __slots__ = ('a',)
+            def __init__(self):
+                raise NotImplementedError()
+
+        class Klass(Parent):
+            __slots__ = ('b',)
+
+        ins = object.__new__(Klass)
+        Immutable.__init__(ins, a=1, b=2)
+        assert (ins.a, ins.b) == (1, 2)
+
+        with pytest.raises(AttributeError) as excinfo:
+            Immutable.__init__(ins, c=3)
+        assert excinfo.value.args[0] == "'Klass' object has no attribute 'c'"
+
+    @pytest.mark.parametrize(('val1', 'val2', 'eq'), [
+        pytest.param(1, 1, True, id='eq'),
+        pytest.param(1, 2, False, id='ne'),
+    ])
+    def test__hash__(self, val1, val2, eq):
+        """
+        Ensure hashing is consistent with the equality check
+        """
+        class Klass(Immutable):
+            __slots__ = ('a', '_b')
+            def __init__(self, a, b):
+                super().__init__(a=a, _b=b)
+
+        assert (hash(Klass(val1, 1)) == hash(Klass(val2, 2))) == eq
+
+    def test__eq__no_fields(self):
+        """
+        Ensure instances without public fields (including those of
+        ``Immutable`` itself) compare and hash by type
+        """
+        class Klass(Immutable):
+            __slots__ = ('_a',)
+            def __init__(self, a):
+                super().__init__(_a=a)
+
+        assert (Klass(1) == Klass(2)) is True
+        assert hash(Klass(1)) == hash(Klass(2))
+        assert Immutable() == Immutable()
+        assert isinstance(hash(Immutable()), int)
+
+    def test__eq__subclass(self):
+        """
+        Ensure each subclass compares its own public slots, and that
+        comparison methods defined by a class are retained
+        """
+        class Parent(Immutable):
+            __slots__ = ('a',)
+            def __init__(self, a, b=None):
+                super().__init__(a=a)
+
+        class Child(Parent):
+            __slots__ = ('b',)
+            def __init__(self, a, b):
+                super(Parent, self).__init__(a=a, b=b)
+
+        class Custom(Parent):
+            __slots__ = ()
+            def __eq__(self, other):
+                return True
+            __hash__ = Immutable.__hash__
+
+        assert Parent(1) != Parent(2)
+        assert Child(1, 2) == Child(2, 2)
+        assert Child(1, 2) != Child(1, 3)
+        assert Custom(1) == Custom(2)
+        assert hash(Custom(1)) == hash(Custom(1))
+
+    def test_no__getattr__(self):
+        """
+        Ensure there's no ``__getattr__`` at runtime (which would slow every
+        failing attribute look-up)
+        """
+        assert not hasattr(Immutable, '__getattr__')
 
     def test__setattr__(self):
         """
@@ -0,0 +1,285 @@
+import gc
+import threading
+import weakref
+from unittest.mock import Mock
+
+import pytest
+
+import forge
+from forge._inject import Injection, Provider, ProviderRegistry, inject
+from forge._signature import KEYWORD_ONLY
+
+# pylint: disable=C0103, invalid-name
+# pylint: disable=R0201, no-self-use
+
+
+class TestProvider:
+    def test_pool(self):
+        """
+        Ensure released resources are re-used, and those that don't fit in
+        the pool are disposed of
+        """
+        dispose = Mock()
+        provider = Provider(object, dispose=dispose, pool_size=1)
+        first, second = provider.acquire(), provider.acquire()
+        assert first is not second
+
+        provider.release(first)
+        provider.release(second)
+        dispose.assert_called_once_with(second)
+        assert provider.acquire() is first
+
+    def test_singleton(self):
+        """
+        Ensure the singleton resource is created once
+        """
+        factory = Mock(side_effect=object)
+        provider = Provider(factory)
+        assert provider.singleton() is provider.singleton()
+        factory.assert_called_once_with()
+
+    def test_thread_local(self):
+        """
+        Ensure each thread acquires its own resource
+        """
+        provider = Provider(object)
+        resources = []
+        def work():
+            resources.append(provider.thread_local())
+            resources.append(provider.thread_local())
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        work()
+        assert resources[0] is resources[1]
+        assert resources[2] is resources[3]
+        assert resources[0] is not resources[2]
+
+    def test_close(self):
+        """
+        Ensure idle and singleton resources are disposed of on ``close``
+        """
+        dispose = Mock()
+        provider = Provider(object, dispose=dispose)
+        singleton = provider.singleton()
+        idle = provider.acquire()
+        provider.release(idle)
+        provider.close()
+        assert [c[0][0] for c in dispose.call_args_list] == [idle, singleton]
+
+    def test_invalid_raises(self):
+        """
+        Ensure an invalid ``pool_size`` raises
+        """
+        with pytest.raises(ValueError) as excinfo:
+            Provider(object, pool_size=-1)
+        assert excinfo.value.args[0] == \
+            "'pool_size' must be None or a non-negative int"
+
+
+class TestProviderRegistry:
+    def test_register(self):
+        """
+        Ensure providers (or factories) are registered by key
+        """
+        registry = ProviderRegistry()
+        provider = registry.register('db', object)
+        assert isinstance(provider, Provider)
+        assert 'db' in registry
+        assert registry['db'] is provider
+        assert registry.version == 1
+
+        registry.unregister('db')
+        assert 'db' not in registry
+        assert registry.version == 2
+
+    def test_missing_raises(self):
+        """
+        Ensure looking up an unregistered key raises
+        """
+        with pytest.raises(LookupError) as excinfo:
+            ProviderRegistry()['db']
+        assert excinfo.value.args[0] == "No provider registered for 'db'"
+
+
+class TestInject:
+    def test_parameter(self):
+        """
+        Ensure ``inject`` creates a bound keyword-only parameter
+        """
+        provider = Provider(object)
+        fparam = inject('db', provider, scope='singleton')
+        assert fparam.kind is KEYWORD_ONLY
+        assert fparam.bound
+        assert fparam.default == Injection(provider, scope='singleton')
+        assert repr(fparam.default) == \
+            '<Injection {!r} (singleton)>'.format(provider)
+
+    def test_no_reference_cycle(self):
+        """
+        Ensure injected parameters don't reference themselves, so that their
+        providers (and pools) are freed without the cyclic garbage collector
+        """
+        class TrackedProvider(Provider):
+            pass
+
+        provider = TrackedProvider(object)
+        ref = weakref.ref(provider)
+        gc.disable()
+        try:
+            inject('db', provider, scope='singleton')
+            del provider
+            assert ref() is None
+        finally:
+            gc.enable()
+
+    def test_call_scope(self, loop):
+        """
+        Ensure ``call``-scoped resources are released to the pool when the
+        underlying callable returns (or raises)
+        """
+        provider = Provider(Mock(side_effect=object))
+
+        @forge.sign(forge.arg('fail', default=False), inject('db', provider))
+        def func(fail, db):
+            assert provider.acquire() is not db  # not idle
+            if fail:
+                raise ValueError()
+            return db
+
+        assert forge.repr_callable(func) == 'func(fail=False)'
+        db = func()
+        assert func() is db
+        with pytest.raises(ValueError):
+            func(True)
+        assert provider.acquire() is db
+
+        @forge.sign(inject('db', provider))
+        async def afunc(db):
+            return db
+
+        db = loop.run_until_complete(afunc())
+        assert loop.run_until_complete(afunc()) is db
+
+    def test_request_scope(self):
+        """
+        Ensure ``request``-scoped resources are shared within a scope, and
+        released when it exits
+        """
+        provider = Provider(object)
+        func = forge.sign(inject('db', provider, scope='request'))(
+            lambda db: db
+        )
+
+        with forge.request_scope():
+            db = func()
+            assert func() is db
+            assert provider.acquire() is not db
+        assert provider.acquire() is db
+
+    def test_request_scope_release_raises(self):
+        """
+        Ensure every ``request``-scoped resource is released when a scope
+        exits, even if releasing another raises
+        """
+        def dispose(resource):
+            raise ValueError('dispose failed')
+
+        pooled = Provider(object)
+        failing = Provider(object, dispose=dispose, pool_size=0)
+        func = forge.sign(
+            inject('db', pooled, scope='request'),
+            inject('cache', failing, scope='request'),
+        )(lambda db, cache: db)
+
+        with pytest.raises(ValueError) as excinfo:
+            with forge.request_scope():
+                db = func()
+        assert excinfo.value.args[0] == 'dispose failed'
+        assert pooled.acquire() is db
+
+    def test_request_scope_outside_request(self):
+        """
+        Ensure ``request``-scoped resources acquired outside a request scope
+        are released when the underlying callable returns
+        """
+        factory = Mock(side_effect=object)
+        provider = Provider(factory)
+        func = forge.sign(inject('db', provider, scope='request'))(
+            lambda db: db
+        )
+
+        dbs = [func() for _ in range(5)]
+        factory.assert_called_once_with()
+        assert dbs == [dbs[0]] * 5
+        assert provider.acquire() is dbs[0]
+
+    @pytest.mark.parametrize(('scope',), [('singleton',), ('thread',)])
+    def test_shared_scopes(self, scope):
+        """
+        Ensure ``singleton`` and ``thread``-scoped resources are shared
+        across calls
+        """
+        factory = Mock(side_effect=object)
+        func = forge.sign(inject('db', Provider(factory), scope=scope))(
+            lambda db: db
+        )
+        assert func() is func()
+        factory.assert_called_once_with()
+
+    def test_registry(self):
+        """
+        Ensure registry keys are looked up once, and again when the registry
+        changes
+        """
+        registry = ProviderRegistry()
+        func = forge.sign(inject('db', 'db', registry=registry))(
+            lambda db: db
+        )
+        with pytest.raises(LookupError):
+            func()
+
+        registry.register('db', lambda: 1)
+        assert func() == 1
+        registry.register('db', lambda: 2)
+        assert func() == 2
+
+    def test_registry_threads(self):
+        """
+        Ensure registry look-ups are consistent while providers are
+        re-registered concurrently
+        """
+        registry = ProviderRegistry()
+        registry.register('db', lambda: 0)
+        func = forge.sign(
+            inject('db', 'db', scope='singleton', registry=registry)
+        )(lambda db: db)
+        barrier = threading.Barrier(5)
+        results = []
+
+        def work():
+            barrier.wait()
+            results.extend(func() for _ in range(1000))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        for i in range(1, 50):
+            registry.register('db', lambda i=i: i)
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4000
+        assert set(results) <= set(range(50))
+        assert func() == 49
+
+    def test_invalid_scope_raises(self):
+        """
+        Ensure an invalid ``scope`` raises
+        """
+        with pytest.raises(ValueError) as excinfo:
+            inject('db', Provider(object), scope='session')
+        assert excinfo.value.args[0] == \
+            "'scope' must be one of singleton, thread, request, call"
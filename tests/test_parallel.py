@@ -0,0 +1,310 @@
+import asyncio
+import itertools
+import os
+
+import pytest
+
+import forge
+from forge._parallel import _chunked, _split_row, parallel_map
+from forge._utils import CallArguments
+
+# pylint: disable=C0103, invalid-name
+# pylint: disable=R0201, no-self-use
+
+
+def positive(ctx, name, value):
+    # pylint: disable=W0613, unused-argument
+    if value < 0:
+        raise ValueError('{} must be positive'.format(name))
+
+
+def with_pid(ctx, name, value):
+    # pylint: disable=W0613, unused-argument
+    return (value, os.getpid())
+
+
+@forge.sign(
+    forge.arg('a', validator=positive),
+    forge.arg('b', default=0, converter=with_pid),
+)
+def revised(a, b):
+    return a + b[0], b[1]
+
+
+def multiply(a, b):
+    return a * b
+
+
+@pytest.mark.parametrize(('row', 'expected'), [
+    pytest.param(CallArguments(1, b=2), ((1,), {'b': 2}), id='call_arguments'),
+    pytest.param({'a': 1}, ((), {'a': 1}), id='mapping'),
+    pytest.param((1, 2), ((1, 2), {}), id='tuple'),
+    pytest.param(1, ((1,), {}), id='value'),
+])
+def test_split_row(row, expected):
+    """
+    Ensure rows are split into positional and keyword arguments
+    """
+    assert _split_row(row) == expected
+
+
+def test_chunked():
+    """
+    Ensure rows are chunked lazily, with a shorter final chunk
+    """
+    assert list(_chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+
+
+class TestParallelMap:
+    @pytest.mark.parametrize(('ordered',), [(True,), (False,)])
+    def test_map(self, ordered):
+        """
+        Ensure arguments are mapped in worker processes, and results are
+        yielded in order (or as completed)
+        """
+        rows = [(i, i) for i in range(20)]
+        results = list(parallel_map(
+            revised,
+            rows,
+            workers=2,
+            chunk_size=3,
+            ordered=ordered,
+        ))
+        values = [value for value, _ in results]
+        if ordered:
+            assert values == [i * 2 for i in range(20)]
+        else:
+            assert sorted(values) == [i * 2 for i in range(20)]
+        assert os.getpid() not in {pid for _, pid in results}
+
+    @pytest.mark.parametrize(('ordered',), [(True,), (False,)])
+    def test_bounded(self, ordered):
+        """
+        Ensure rows are consumed lazily, with a bounded number of chunks in
+        flight
+        """
+        consumed = []
+
+        def rows():
+            for i in range(1000):
+                consumed.append(i)
+                yield i, 1
+
+        results = parallel_map(
+            multiply,
+            rows(),
+            workers=1,
+            chunk_size=2,
+            ordered=ordered,
+        )
+        values = list(itertools.islice(results, 3))
+        if ordered:
+            assert values == [0, 1, 2]
+        else:
+            assert len(values) == 3
+        # two chunks (of two rows) in flight, and another submitted as each
+        # chunk is yielded
+        assert len(consumed) <= 8
+        results.close()
+
+    def test_recipe(self):
+        """
+        Ensure revised callables that aren't found at their module-level name
+        are sent to workers by recipe
+        """
+        func = forge.modify('b', default=10)(multiply)
+        rows = [1, {'a': 2}, CallArguments(3, b=2)]
+        assert list(parallel_map(func, rows, workers=1)) == [10, 20, 6]
+
+    def test_raises(self):
+        """
+        Ensure exceptions raised in worker processes are re-raised
+        """
+        results = parallel_map(revised, [1, -1], workers=1, chunk_size=1)
+        with pytest.raises(ValueError) as excinfo:
+            list(results)
+        assert excinfo.value.args[0] == 'a must be positive'
+
+    def test_coroutine_function_raises(self):
+        """
+        Ensure coroutine functions are rejected
+        """
+        @forge.sign()
+        async def func():
+            pass
+
+        with pytest.raises(TypeError) as excinfo:
+            parallel_map(func, [])
+        assert excinfo.value.args[0] == \
+            'parallel_map requires a synchronous callable, not {}'.format(func)
+
+    def test_invalid_chunk_size_raises(self):
+        """
+        Ensure an invalid ``chunk_size`` raises
+        """
+        with pytest.raises(ValueError) as excinfo:
+            parallel_map(revised, [], chunk_size=0)
+        assert excinfo.value.args[0] == "'chunk_size' must be a positive int"
+
+
+class TestAmap:
+    @staticmethod
+    def collect(iterator):
+        async def collect():
+            return [result async for result in iterator]
+        return collect()
+
+    @pytest.mark.parametrize(('ordered',), [(True,), (False,)])
+    def test_map(self, loop, ordered):
+        """
+        Ensure at most ``concurrency`` calls run at once, and results are
+        yielded in order (or as completed)
+        """
+        running = []
+        peak = []
+
+        @forge.sign(forge.arg('delay', converter=lambda ctx, name, v: v / 100))
+        async def func(delay):
+            running.append(delay)
+            peak.append(len(running))
+            await asyncio.sleep(delay)
+            running.remove(delay)
+            return delay
+
+        rows = [4, 1, 2, 0]
+        results = loop.run_until_complete(
+            self.collect(forge.amap(func, rows, concurrency=2, ordered=ordered))
+        )
+        if ordered:
+            assert results == [0.04, 0.01, 0.02, 0]
+        else:
+            assert results == [0.01, 0.02, 0, 0.04]
+        assert max(peak) == 2
+
+    def test_read_ahead(self, loop):
+        """
+        Ensure rows are read a bounded distance ahead of a slow row, when
+        results are yielded in order
+        """
+        consumed = []
+
+        def rows():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        @forge.sign(forge.arg('a'))
+        async def func(a):
+            await asyncio.sleep(0.05 if a == 0 else 0)
+            return a
+
+        async def main():
+            async with forge.amap(func, rows(), concurrency=2) as iterator:
+                async for result in iterator:
+                    return result, len(consumed)
+
+        # the rows within ``concurrency * 2`` of the slow row, and a row held
+        # by each waiting worker
+        assert loop.run_until_complete(main()) == (0, 6)
+
+    def test_raises(self, loop):
+        """
+        Ensure an exception raised by a call is re-raised, and the remaining
+        calls are cancelled
+        """
+        cancelled = []
+
+        @forge.sign(forge.arg('a', validator=positive))
+        async def func(a):
+            try:
+                await asyncio.sleep(a)
+            except asyncio.CancelledError:
+                cancelled.append(a)
+                raise
+            return a
+
+        iterator = forge.amap(func, [1, -1], ordered=False)
+        with pytest.raises(ValueError) as excinfo:
+            loop.run_until_complete(self.collect(iterator))
+        assert excinfo.value.args[0] == 'a must be positive'
+        assert cancelled == [1]
+
+    def test_call_cancelled(self, loop):
+        """
+        Ensure a ``CancelledError`` raised by a call is re-raised (rather than
+        iteration awaiting forever)
+        """
+        @forge.sign(forge.arg('a'))
+        async def func(a):
+            if a:
+                raise asyncio.CancelledError()
+            return a
+
+        results = []
+
+        async def main():
+            async for result in forge.amap(func, [0, 1], concurrency=1):
+                results.append(result)
+
+        with pytest.raises(asyncio.CancelledError):
+            loop.run_until_complete(asyncio.wait_for(main(), timeout=1))
+        assert results == [0]
+
+    def test_cancel(self, loop):
+        """
+        Ensure cancelling the iterating task cancels the remaining calls
+        """
+        cancelled = []
+
+        @forge.sign(forge.arg('a'))
+        async def func(a):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(a)
+                raise
+
+        task = loop.create_task(self.collect(forge.amap(func, range(3))))
+        loop.call_later(0.01, task.cancel)
+        with pytest.raises(asyncio.CancelledError):
+            loop.run_until_complete(task)
+        assert sorted(cancelled) == [0, 1, 2]
+
+    def test_aclose(self, loop):
+        """
+        Ensure exiting the ``async with`` block cancels the remaining calls,
+        and stops iteration
+        """
+        @forge.sign(forge.arg('a'))
+        async def func(a):
+            await asyncio.sleep(a)
+            return a
+
+        async def main():
+            async with forge.amap(func, [0, 1]) as iterator:
+                async for result in iterator:
+                    break
+            return result, await self.collect(iterator)
+
+        assert loop.run_until_complete(main()) == (0, [])
+
+    def test_synchronous_raises(self):
+        """
+        Ensure synchronous callables are rejected
+        """
+        with pytest.raises(TypeError) as excinfo:
+            forge.amap(revised, [])
+        assert excinfo.value.args[0] == \
+            'amap requires a coroutine function, not {}'.format(revised)
+
+    def test_invalid_concurrency_raises(self):
+        """
+        Ensure an invalid ``concurrency`` raises
+        """
+        @forge.sign()
+        async def func():
+            pass
+
+        with pytest.raises(ValueError) as excinfo:
+            forge.amap(func, [], concurrency=0)
+        assert excinfo.value.args[0] == "'concurrency' must be a positive int"
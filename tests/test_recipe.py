@@ -0,0 +1,96 @@
+import concurrent.futures
+import operator
+import pickle
+
+import pytest
+
+import forge
+from forge._recipe import Recipe, is_referenceable, picklable
+
+# pylint: disable=C0103, invalid-name
+# pylint: disable=R0201, no-self-use
+
+
+@forge.sign(forge.arg('a'), forge.kwarg('b', default=2))
+def revised(a, b):
+    return a * b
+
+
+def multiply(a, b):
+    return a * b
+
+
+def test_is_referenceable():
+    """
+    Ensure objects are referenceable only if found at their module-level name
+    """
+    assert is_referenceable(revised)
+    assert is_referenceable(multiply)
+    assert not is_referenceable(revised.__wrapped__)
+    assert not is_referenceable(lambda: None)
+
+
+class TestPicklable:
+    def test_referenceable(self):
+        """
+        Ensure revised callables found at their module-level name are
+        returned unchanged, and pickle by reference
+        """
+        assert picklable(revised) is revised
+        assert pickle.loads(pickle.dumps(revised)) is revised
+
+    @pytest.mark.parametrize(('func',), [
+        pytest.param(multiply, id='underlying'),
+        pytest.param(revised, id='wrapper'),
+    ])
+    def test_recipe(self, func):
+        """
+        Ensure other revised callables pickle by recipe, whether the
+        underlying callable is found at its module-level name, or wrapped by
+        a revised callable that is
+        """
+        func2 = forge.modify('b', name='y', default=3)(func)
+        recipe = picklable(func2)
+        assert isinstance(recipe, Recipe)
+        assert recipe(1) == func2(1) == 3
+
+        restored = pickle.loads(pickle.dumps(recipe))
+        assert forge.repr_callable(restored.wrapper) == \
+            forge.repr_callable(func2)
+        assert restored(2, y=4) == 8
+
+    def test_recipe_cached(self):
+        """
+        Ensure a recipe's revised callable is re-built once
+        """
+        data = pickle.dumps(picklable(forge.modify('b', default=1)(multiply)))
+        first, second = pickle.loads(data), pickle.loads(data)
+        assert first is second
+
+    def test_process_pool(self):
+        """
+        Ensure recipes can be used with a ``ProcessPoolExecutor``
+        """
+        func = picklable(forge.modify('b', default=10)(operator.mul))
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            assert list(executor.map(func, range(4))) == [0, 10, 20, 30]
+
+    def test_unreferenceable_raises(self):
+        """
+        Ensure revised callables of local functions can't be pickled
+        """
+        def func(a):
+            return a
+        with pytest.raises(pickle.PicklingError) as excinfo:
+            pickle.dumps(picklable(forge.modify('a', name='b')(func)))
+        assert excinfo.value.args[0].endswith(
+            "the underlying callable isn't found at its module-level name"
+        )
+
+    def test_unrevised_raises(self):
+        """
+        Ensure only revised callables are accepted
+        """
+        with pytest.raises(TypeError) as excinfo:
+            picklable(lambda: None)
+        assert excinfo.value.args[0].endswith('is not a revised callable')
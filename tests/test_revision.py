@@ -1,6 +1,8 @@
 import asyncio
+import concurrent.futures
 import inspect
-from unittest.mock import Mock
+import threading
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -123,6 +125,8 @@ class TestMapper:
             else CallArguments(1)
         result = mapper(*call_args.args, **call_args.kwargs)
         assert result == expected
+        assert mapper._map(call_args.args, call_args.kwargs) == \
+            (expected.args, expected.kwargs)
 
     def test__call__bound_injected(self):
         """
@@ -194,6 +198,177 @@ class TestMapper:
 
         assert mapper() == CallArguments(a=1)
 
+    def test__call__threads(self):
+        """
+        Ensure that a mapper shared by many threads maps each call's
+        arguments independently
+        """
+        fsig = FSignature([
+            forge.arg('a', converter=lambda ctx, name, value: value * 2),
+            forge.kwarg('b', default=forge.Factory(list)),
+        ])
+        mapper = Mapper(fsig, lambda a, *, b: None)
+        barrier = threading.Barrier(8)
+
+        def work(offset):
+            barrier.wait()
+            return [mapper(offset + i) for i in range(500)]
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            batches = list(executor.map(work, range(0, 8000, 1000)))
+
+        for offset, batch in zip(range(0, 8000, 1000), batches):
+            assert batch == [
+                CallArguments((offset + i) * 2, b=[]) for i in range(500)
+            ]
+        defaults = [ca.kwargs['b'] for batch in batches for ca in batch]
+        assert len(set(map(id, defaults))) == len(defaults)
+
+    def test_plan_shared(self):
+        """
+        Ensure mappers of callables with identical signatures share a plan,
+        and retain only their callable
+        """
+        fsig = FSignature([forge.arg('a'), forge.kwarg('b', default=1)])
+        func1, func2 = (lambda a, *, b: (a, b)), (lambda a, *, b: (b, a))
+        mapper1, mapper2 = Mapper(fsig, func1), Mapper(fsig, func2)
+
+        assert mapper1.plan is mapper2.plan
+        assert mapper1.callable is func1 and mapper2.callable is func2
+        for attr in (
+                'call_scoped',
+                'context_param',
+                'fsignature',
+                'is_async',
+                'parameter_map',
+                'private_signature',
+                'public_signature',
+            ):
+            assert getattr(mapper1, attr) is getattr(mapper1.plan, attr)
+
+    @pytest.mark.parametrize(('fparam1', 'fparam2', 'func2'), [
+        pytest.param(
+            forge.arg('a', default=1),
+            forge.arg('a', default=1.0),
+            lambda a=1: None,
+            id='public_default_type',
+        ),
+        pytest.param(
+            forge.arg('a', default=1),
+            forge.arg('a', default=1),
+            lambda a=1.0: None,
+            id='private_default_type',
+        ),
+        pytest.param(
+            forge.arg('a', default=[]),
+            forge.arg('a', default=[]),
+            lambda a=1: None,
+            id='unhashable',
+        ),
+    ])
+    def test_plan_not_shared(self, fparam1, fparam2, func2):
+        """
+        Ensure plans are only shared by identical (hashable) signatures
+        """
+        mapper1 = Mapper(FSignature([fparam1]), lambda a=1: None)
+        mapper2 = Mapper(FSignature([fparam2]), func2)
+        assert mapper1.plan is not mapper2.plan
+
+    def test_plan_default_identity(self):
+        """
+        Ensure plans aren't shared by signatures whose defaults are equal, but
+        not identical
+        """
+        class Box:
+            def __init__(self, value):
+                self.value = value
+
+            def __eq__(self, other):
+                return self.value == other.value
+
+            def __hash__(self):
+                return hash(self.value)
+
+        # public defaults
+        func1 = forge.sign(forge.arg('a', default=(1,)))(lambda a: a)
+        func2 = forge.sign(forge.arg('a', default=(1.0,)))(lambda a: a)
+        assert type(func1()[0]) is int and type(func2()[0]) is float
+
+        box1, box2 = Box(1), Box(1)
+        func1 = forge.sign(forge.arg('a', default=box1))(lambda a: a)
+        func2 = forge.sign(forge.arg('a', default=box2))(lambda a: a)
+        assert func1() is box1 and func2() is box2
+
+        # private defaults
+        func1 = forge.sign()(lambda a=(1,): a)
+        func2 = forge.sign()(lambda a=(1.0,): a)
+        assert type(func1()[0]) is int and type(func2()[0]) is float
+
+        func1 = forge.sign()(lambda a=box1: a)
+        func2 = forge.sign()(lambda a=box2: a)
+        assert func1() is box1 and func2() is box2
+
+    def test_resolve(self, loop):
+        """
+        Ensure ``resolve`` awaits fparams with coroutine converters
+        """
+        async def converter(ctx, name, value):
+            return value * 2
+
+        fsig = FSignature([forge.arg('a', converter=converter), forge.arg('b')])
+        mapper = Mapper(fsig, lambda a, b: None)
+        assert mapper.is_async
+        assert loop.run_until_complete(mapper.resolve(1, b=2)) == \
+            CallArguments(2, 2)
+
+    def test_resolve_concurrent(self, loop):
+        """
+        Ensure ``resolve`` awaits the pipelines of fparams concurrently, and
+        awaits coroutine validators
+        """
+        events = {'a': asyncio.Event(), 'b': asyncio.Event()}
+
+        async def converter(ctx, name, value):
+            events[name].set()
+            await events['b' if name == 'a' else 'a'].wait()
+            return value
+
+        validator = Mock()
+        async def async_validator(ctx, name, value):
+            validator(ctx, name, value)
+
+        fsig = FSignature([
+            forge.arg('a', converter=converter),
+            forge.arg('b', converter=converter, validator=async_validator),
+        ])
+        mapper = Mapper(fsig, lambda a, b: None)
+        result = loop.run_until_complete(
+            asyncio.wait_for(mapper.resolve(1, 2), 1)
+        )
+        assert result == CallArguments(1, 2)
+        validator.assert_called_once_with(None, 'b', 2)
+
+    def test_resolve_factories_concurrent(self, loop):
+        """
+        Ensure ``resolve`` awaits coroutine default factories concurrently
+        """
+        events = [asyncio.Event(), asyncio.Event()]
+
+        def make_factory(i):
+            async def factory():
+                events[i].set()
+                await events[1 - i].wait()
+                return i
+            return factory
+
+        fsig = FSignature([
+            forge.arg('a', factory=make_factory(0)),
+            forge.arg('b', factory=make_factory(1), bound=True),
+        ])
+        mapper = Mapper(fsig, lambda a, b: None)
+        result = loop.run_until_complete(asyncio.wait_for(mapper.resolve(), 1))
+        assert result == CallArguments(0, 1)
+
     def test__call__binding_error_raises_named(self):
         """
         Ensure that a lack of required (non-default) arguments raises a
@@ -439,7 +614,7 @@ class TestRevision:
         ])
         assert mapper == Mapper(mapper.fsignature, func2.__wrapped__)
 
-        func2.__mapper__ = Mock(side_effect=func2.__mapper__)
+        func2.__mapper__ = Mock(wraps=func2.__mapper__, is_async=False)
         call_args = CallArguments(0, a=1)
 
         result = func2(*call_args.args, **call_args.kwargs)
@@ -447,11 +622,78 @@ class TestRevision:
             result = loop.run_until_complete(result)
 
         assert result == call_args
-        func2.__mapper__.assert_called_once_with(
-            *call_args.args,
-            **call_args.kwargs,
+        func2.__mapper__._map.assert_called_once_with(
+            call_args.args,
+            call_args.kwargs,
         )
 
+    @pytest.mark.parametrize(('is_async',), [
+        pytest.param(True, id='async_pipeline'),
+        pytest.param(False, id='sync_pipeline'),
+    ])
+    def test__call__coroutine_pipeline(self, loop, is_async):
+        """
+        Ensure coroutine functions with coroutine converters or validators
+        map arguments with ``Mapper.resolve``, and otherwise with
+        ``Mapper.__call__``
+        """
+        async def async_validator(ctx, name, value):
+            if value < 0:
+                raise ValueError(value)
+
+        def sync_validator(ctx, name, value):
+            if value < 0:
+                raise ValueError(value)
+
+        @forge.modify(
+            'a',
+            validator=async_validator if is_async else sync_validator,
+        )
+        async def func(a):
+            return a
+
+        assert func.__mapper__.is_async == is_async
+        mapper = func.__mapper__
+        func.__mapper__ = Mock(wraps=mapper, is_async=is_async)
+        assert loop.run_until_complete(func(1)) == 1
+        assert func.__mapper__._resolve.called == is_async
+        assert func.__mapper__._map.called != is_async
+        with pytest.raises(ValueError):
+            loop.run_until_complete(func(-1))
+
+    @pytest.mark.usefixtures('reset_lean_coroutines')
+    def test__call__lean_coroutine(self, loop):
+        """
+        Ensure that with ``lean_coroutines`` enabled, the wrapper of a
+        coroutine function is a plain function (marked as a coroutine
+        function) that returns the underlying coroutine; or, where
+        ``inspect`` can't recognize it as a coroutine function, an
+        ``async def`` function
+        """
+        forge.set_lean_coroutines(True)
+        lean = hasattr(inspect, 'markcoroutinefunction')
+
+        @forge.modify('a', name='b')
+        async def func(a):
+            return a
+
+        assert asyncio.iscoroutinefunction(func)
+        assert inspect.iscoroutinefunction(func)
+
+        coro = func(1)
+        assert inspect.iscoroutine(coro)
+        assert (coro.cr_code is func.__wrapped__.__code__) == lean
+        assert loop.run_until_complete(coro) == 1
+
+        with pytest.raises(TypeError):
+            if lean:
+                func()
+            else:
+                loop.run_until_complete(func())
+
+        func2 = forge.modify('b', name='c')(func)
+        assert loop.run_until_complete(func2(c=2)) == 2
+
     def test__call__existing(self):
         """
         Ensure ``__call__`` replaces the wrapper, and that a call to the
@@ -475,13 +717,13 @@ class TestRevision:
         assert f3mapper is not f2mapper
         assert f3mapper.fsignature == f2mapper.fsignature
 
-        func2.__mapper__ = Mock(side_effect=f2mapper)
-        func3.__mapper__ = Mock(side_effect=f3mapper)
+        func2.__mapper__ = Mock(wraps=f2mapper)
+        func3.__mapper__ = Mock(wraps=f3mapper)
 
         call_args = CallArguments(b=1)
         assert func3(*call_args.args, **call_args.kwargs) == call_args
-        func3.__mapper__.assert_called_once_with(**call_args.kwargs)
-        func2.__mapper__.assert_not_called()
+        func3.__mapper__._map.assert_called_once_with((), call_args.kwargs)
+        func2.__mapper__._map.assert_not_called()
 
     def test_revise(self):
         """
@@ -491,6 +733,33 @@ class TestRevision:
         in_ = FSignature()
         assert rev.revise(in_) is in_
 
+    def test__call__decorates(self):
+        """
+        Ensure that ``__call__`` wraps the result of ``decorate``, and that
+        the decorated callable is re-used when the wrapper is revised.
+        """
+        rev = Revision()
+        func = lambda a: a
+        decorated = lambda a: a + 1
+        rev.decorate = Mock(return_value=decorated)
+
+        func2 = rev(func)
+        rev.decorate.assert_called_once_with(func)
+        assert func2.__wrapped__ is decorated
+        assert func2.__mapper__.callable is decorated
+        assert func2(1) == 2
+
+        func3 = forge.modify('a', name='b')(func2)
+        assert func3.__wrapped__ is decorated
+        assert func3(b=1) == 2
+
+    def test_decorate(self):
+        """
+        Ensure that the decorate function is the identity function
+        """
+        func = lambda: None
+        assert Revision().decorate(func) is func
+
     def test__call__validates(self):
         """
         Ensure that `__call__` validates the signature. Notable because
@@ -508,6 +777,22 @@ class TestRevision:
             "'POSITIONAL_OR_KEYWORD'"
         )
 
+    def test__call__existing_validates_splice(self):
+        """
+        Ensure that re-wrapping a wrapped function only validates the
+        revised parameters of its (validated) signature
+        """
+        @forge.sign(*[forge.arg('a{}'.format(i)) for i in range(10)])
+        def func(**kwargs):
+            return kwargs
+
+        assert func.__mapper__.fsignature.validated
+        with patch.object(FSignature, '_validate_all') as validate_all:
+            func = forge.insert(forge.arg('b'), index=5)(func)
+        validate_all.assert_not_called()
+        assert func.__mapper__.fsignature.validated
+        assert func.__mapper__.fsignature[5].name == 'b'
+
 
 ## Test Group Revisions
 class TestCompose:
@@ -543,6 +828,40 @@ class TestCompose:
         rev = compose()
         assert rev.revise(fsig) is fsig
 
+    def test_decorate(self):
+        """
+        Ensure that ``compose`` applies the underlying decorations from top to
+        bottom.
+        """
+        func, func1, func2 = lambda: 0, lambda: 1, lambda: 2
+        mock1 = Mock(spec=Revision, decorate=Mock(return_value=func1))
+        mock2 = Mock(spec=Revision, decorate=Mock(return_value=func2))
+
+        assert compose(mock1, mock2).decorate(func) is func2
+        mock1.decorate.assert_called_once_with(func)
+        mock2.decorate.assert_called_once_with(func1)
+
+    def test__call__validates_result(self):
+        """
+        Ensure that ``compose`` only validates its resulting signature, so
+        intermediate signatures needn't be valid
+        """
+        @forge.sign(forge.arg('a'), forge.arg('b'))
+        def func(**kwargs):
+            return kwargs
+
+        revised = compose(
+            modify('a', interface_name='b'),
+            delete('b'),
+        )(func)
+        assert revised.__mapper__.fsignature.validated
+        assert revised(1) == {'b': 1}
+
+        with pytest.raises(ValueError) as excinfo:
+            compose(modify('a', interface_name='b'))(func)
+        assert excinfo.value.args[0] == \
+            "Received multiple parameters with interface_name 'b'"
+
     def test_non_revision_raises(self):
         """
         Ensure that supplying a non-revision to ``compose`` raises TypeError
@@ -1047,6 +1366,21 @@ class TestModify:
         rev = modify('a', **revision)
         assert rev.revise(FSignature([in_param])) == FSignature([out_param])
 
+    def test_revise_compiled_selector(self):
+        """
+        Ensure that the selector is compiled once, so that an iterator selector
+        matches on every revision
+        """
+        rev = modify(iter(['a', 'c']), multiple=True, type=int)
+        in_ = FSignature([forge.arg('a'), forge.arg('b'), forge.arg('c')])
+        out_ = FSignature([
+            forge.arg('a', type=int),
+            forge.arg('b'),
+            forge.arg('c', type=int),
+        ])
+        assert rev.revise(in_) == out_
+        assert rev.revise(in_) == out_
+
     def test_revise_void_cls(self):
         """
         Ensure that passing ``void`` as a ``default`` or ``type`` is passed
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+
+import forge
+from forge._scope import request_scope
+
+# pylint: disable=C0103, invalid-name
+# pylint: disable=R0201, no-self-use
+
+
+class TestRequestScope:
+    def test_context_manager(self):
+        """
+        Ensure the scope is current within the ``with`` block, and nests
+        """
+        assert request_scope.current() is None
+        with request_scope() as outer:
+            assert request_scope.current() is outer
+            with request_scope() as inner:
+                assert request_scope.current() is inner
+            assert request_scope.current() is outer
+        assert request_scope.current() is None
+
+    def test_async_context_manager(self, loop):
+        """
+        Ensure concurrent tasks each have their own scope
+        """
+        async def task():
+            async with request_scope() as scope:
+                await asyncio.sleep(0)
+                return request_scope.current() is scope
+
+        assert loop.run_until_complete(asyncio.gather(task(), task())) == \
+            [True, True]
+
+    def test_thread_isolation(self):
+        """
+        Ensure a scope isn't current in other threads
+        """
+        seen = []
+        with request_scope():
+            thread = threading.Thread(
+                target=lambda: seen.append(request_scope.current())
+            )
+            thread.start()
+            thread.join()
+        assert seen == [None]
+
+    def test_close(self):
+        """
+        Ensure callbacks are called in reverse order and the cache is cleared
+        on exit
+        """
+        calls = []
+        with request_scope() as scope:
+            scope.cache['a'] = 1
+            scope.on_close(lambda: calls.append(1))
+            scope.on_close(lambda: calls.append(2))
+        assert calls == [2, 1]
+        assert not scope.cache
+
+    def test_repr(self):
+        """
+        Ensure the repr reports the number of cached values
+        """
+        scope = forge.request_scope()
+        scope.cache['a'] = 1
+        assert repr(scope) == '<request_scope (1 cached)>'
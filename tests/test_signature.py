@@ -1,8 +1,11 @@
+import asyncio
 import inspect
+import re
+import pickle
 import types
 import typing
 from collections import OrderedDict
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -19,8 +22,10 @@ from forge._signature import (
     Factory,
     FParameter,
     FSignature,
+    Selector,
     VarKeyword,
     VarPositional,
+    findindex,
     findparam,
     fsignature,
     get_context_parameter,
@@ -38,6 +43,11 @@ dummy_func = lambda: None
 dummy_converter = lambda ctx, name, value: (ctx, name, value)
 dummy_validator = lambda ctx, name, value: None
 
+
+def increment_converter(ctx, name, value):
+    # pylint: disable=W0613, unused-argument
+    return value + 1
+
 FPARAM_DEFAULTS = dict(
     name=None,
     interface_name=None,
@@ -107,6 +117,53 @@ class TestFactory:
         factory()
         mock.assert_called_once_with()
 
+    def test_pickle(self):
+        """
+        Ensure factories can be pickled
+        """
+        factory = Factory(dict, scoped=True)
+        assert pickle.loads(pickle.dumps(factory)) == factory
+
+    def test__call__scoped(self):
+        """
+        Ensure scoped factories re-use their value within a ``request_scope``
+        """
+        mock = Mock(side_effect=object)
+        factory = Factory(mock, scoped=True)
+        assert factory() is not factory()
+        assert mock.call_count == 2
+
+        with forge.request_scope():
+            assert factory() is factory()
+        assert mock.call_count == 3
+
+        with forge.request_scope():
+            factory()
+        assert mock.call_count == 4
+
+    def test__call__scoped_coroutine(self, loop):
+        """
+        Ensure scoped coroutine factories are awaited once within a
+        ``request_scope``
+        """
+        mock = Mock(side_effect=object)
+
+        async def func():
+            await asyncio.sleep(0)
+            return mock()
+
+        @forge.sign(forge.arg('a', default=Factory(func, scoped=True)))
+        async def use(a):
+            return a
+
+        async def request():
+            async with forge.request_scope():
+                return await asyncio.gather(use(), use())
+
+        first, second = loop.run_until_complete(request())
+        assert first is second
+        mock.assert_called_once_with()
+
 
 class TestFParameter:
     # pylint: disable=R0904, too-many-public-methods
@@ -371,6 +428,48 @@ class TestFParameter:
         assert called_with[0] == called_with[1] == \
             CallArguments(ctx, name, value)
 
+    @pytest.mark.parametrize(('attr',), [
+        pytest.param('converter', id='converter'),
+        pytest.param('validator', id='validator'),
+    ])
+    def test_pipeline_fused_at_init(self, attr):
+        """
+        Ensure that iterables of converters and validators are materialized
+        once at construction (e.g. generators can be re-used across calls),
+        and that each user callable is called exactly once per call.
+        """
+        calls = []
+        def make(i):
+            def func(ctx, name, value):
+                calls.append(i)
+                return value + 1
+            return func
+
+        fparam = FParameter(
+            POSITIONAL_ONLY,
+            name='myparam',
+            **{attr: (make(i) for i in range(3))},
+        )
+        for _ in range(2):
+            result = fparam(None, 0)
+            if attr == 'converter':
+                assert result == 3
+            else:
+                assert result == 0
+        assert calls == [0, 1, 2, 0, 1, 2]
+
+    @pytest.mark.parametrize(('attr', 'slot'), [
+        pytest.param('converter', '_convert', id='converter'),
+        pytest.param('validator', '_validate', id='validator'),
+    ])
+    def test_pipeline_single_unwrapped(self, attr, slot):
+        """
+        Ensure that a single-item iterable of converters or validators is
+        unwrapped, rather than chained.
+        """
+        fparam = FParameter(POSITIONAL_ONLY, **{attr: [dummy_converter]})
+        assert getattr(fparam, slot) is dummy_converter
+
     @pytest.mark.parametrize(('is_factory',), [
         pytest.param(False, id='non_factory'),
         pytest.param(True, id='factory'),
@@ -404,6 +503,72 @@ class TestFParameter:
             converter.assert_called_once_with(ctx, name, mock)
             mock.assert_not_called()
 
+    def test_resolve(self, loop):
+        """
+        Ensure that ``resolve`` awaits coroutine converters in turn (with
+        synchronous converters and validators), and that calling such an
+        ``FParameter`` directly raises.
+        """
+        async def async_converter(ctx, name, value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        validator = Mock()
+        fparam = FParameter(
+            POSITIONAL_ONLY,
+            name='a',
+            default=1,
+            converter=[async_converter, lambda ctx, name, value: value + 1],
+            validator=validator,
+        )
+        assert fparam.is_async
+        assert loop.run_until_complete(fparam.resolve(None, empty)) == 3
+        validator.assert_called_once_with(None, 'a', 3)
+
+        with pytest.raises(TypeError) as excinfo:
+            fparam(None, 1)
+        assert excinfo.value.args[0] == \
+            "Parameter 'a' has a coroutine factory, converters or " \
+            "validators; use 'resolve'"
+
+    @pytest.mark.parametrize(('bound',), [
+        pytest.param(True, id='bound'),
+        pytest.param(False, id='unbound'),
+    ])
+    def test_resolve_factory(self, loop, bound):
+        """
+        Ensure that ``resolve`` awaits coroutine default factories of both
+        ``bound`` and unbound parameters
+        """
+        async def factory():
+            return 1
+
+        fparam = FParameter(
+            POSITIONAL_ONLY,
+            name='a',
+            factory=factory,
+            bound=bound,
+        )
+        assert fparam.is_async
+        assert loop.run_until_complete(fparam.resolve(None, empty)) == 1
+        assert loop.run_until_complete(fparam.resolve(None, 2)) == 2
+
+    def test__call__bound_factory(self):
+        """
+        Ensure that calling a ``bound`` parameter without a value calls the
+        default factory
+        """
+        fparam = FParameter(POSITIONAL_ONLY, factory=lambda: 1, bound=True)
+        assert fparam(None, empty) == 1
+
+    def test_resolve_sync(self, loop):
+        """
+        Ensure that ``resolve`` works with synchronous pipelines
+        """
+        fparam = FParameter(POSITIONAL_ONLY, converter=lambda c, n, v: v + 1)
+        assert not fparam.is_async
+        assert loop.run_until_complete(fparam.resolve(None, 1)) == 2
+
     @pytest.mark.parametrize(('rkey', 'rval'), [
         pytest.param('kind', KEYWORD_ONLY, id='kind'),
         pytest.param('default', 1, id='default'),
@@ -437,6 +602,107 @@ class TestFParameter:
                 v = Factory(dummy_func)
             assert getattr(fparam2, k) == v
 
+    @pytest.mark.parametrize(('changes',), [
+        pytest.param({'kind': KEYWORD_ONLY}, id='kind'),
+        pytest.param({'name': 'c'}, id='name'),
+        pytest.param({'name': None}, id='name_none'),
+        pytest.param({'interface_name': 'c'}, id='interface_name'),
+        pytest.param({'default': empty, 'bound': False}, id='default'),
+        pytest.param({'factory': dummy_func}, id='factory'),
+        pytest.param({'converter': [dummy_converter] * 2}, id='converter'),
+        pytest.param({'converter': None}, id='converter_none'),
+        pytest.param({'validator': dummy_validator}, id='validator'),
+        pytest.param({'metadata': None}, id='metadata'),
+    ])
+    def test_replace_evolve(self, changes):
+        """
+        Ensure that ``replace`` (which copies slots, rather than re-running
+        ``__init__``) is equivalent to creating a new instance
+        """
+        fparam = FParameter(
+            kind=POSITIONAL_OR_KEYWORD,
+            name='a',
+            interface_name='b',
+            default=1,
+            converter=increment_converter,
+            bound=True,
+            metadata={'meta': 'data'},
+        )
+        fparam2 = fparam.replace(**changes)
+        kwargs = immutable.asdict(fparam)
+        if 'factory' in changes:
+            kwargs['default'] = empty
+        kwargs.update(changes)
+        expected = FParameter(**kwargs)
+        assert fparam2 == expected
+        assert fparam2._creation_order > fparam._creation_order
+        assert fparam2(None, 1) == expected(None, 1)
+        for slot in ('_convert', '_validate', '_pipeline'):
+            assert (getattr(fparam2, slot) is None) == \
+                (getattr(expected, slot) is None)
+
+    def test_replace_evolve_pipeline(self, loop):
+        """
+        Ensure that ``replace`` re-compiles the coroutine pipeline when it
+        depends on the changed fields
+        """
+        async def converter(ctx, name, value):
+            return name
+
+        fparam = FParameter(POSITIONAL_ONLY, 'a', converter=converter)
+        fparam2 = fparam.replace(name='b')
+        assert loop.run_until_complete(fparam2.resolve(None, 1)) == 'b'
+        assert not fparam2.replace(converter=None).is_async
+        assert FParameter(POSITIONAL_ONLY, 'a').\
+            replace(validator=converter).is_async
+
+    @pytest.mark.parametrize(('changes', 'message'), [
+        pytest.param(
+            {'name': 1},
+            'name must be a str, not a 1',
+            id='name',
+        ),
+        pytest.param(
+            {'interface_name': 1},
+            'interface_name must be a str, not a 1',
+            id='interface_name',
+        ),
+        pytest.param(
+            {'default': 1, 'factory': dummy_func},
+            'expected either "default" or "factory", received both',
+            id='default_and_factory',
+        ),
+        pytest.param(
+            {'bound': True},
+            'bound arguments must have a default value',
+            id='bound',
+        ),
+    ])
+    def test_replace_evolve_raises(self, changes, message):
+        """
+        Ensure that ``replace`` validates the changed fields
+        """
+        fparam = FParameter(POSITIONAL_ONLY, 'a')
+        with pytest.raises(TypeError) as excinfo:
+            fparam.replace(**changes)
+        assert excinfo.value.args[0] == message
+
+    def test_replace_subclass(self):
+        """
+        Ensure that ``replace`` retains the class of the instance, and the
+        fields of the subclass
+        """
+        class SubParameter(FParameter):
+            __slots__ = ('tag',)
+
+            def __init__(self, *args, tag=None, **kwargs):
+                super().__init__(*args, **kwargs)
+                immutable.Immutable.__init__(self, tag=tag)
+
+        fparam = SubParameter(POSITIONAL_ONLY, 'a', tag='t').replace(name='b')
+        assert type(fparam) is SubParameter
+        assert (fparam.name, fparam.tag) == ('b', 't')
+
     def test_native(self):
         """
         Ensure the ``native`` property produces an expected instance of
@@ -703,6 +969,139 @@ class TestFParameter:
             interface_name=kwargs['name'],
         )
 
+    def test_pickle(self):
+        """
+        Ensure ``FParameter`` instances can be pickled, and that their
+        pipelines are re-compiled
+        """
+        fparam = FParameter(
+            POSITIONAL_ONLY,
+            name='a',
+            factory=dict,
+            converter=[increment_converter, increment_converter],
+            metadata={'meta': 'data'},
+        )
+        restored = pickle.loads(pickle.dumps(fparam))
+        assert restored == fparam
+        assert restored(None, 1) == 3
+
+    def test__hash__(self):
+        """
+        Ensure parameters are hashable (including their metadata), and hash
+        consistently with the equality check
+        """
+        assert hash(forge.arg('a')) == hash(forge.arg('a'))
+        assert hash(forge.arg('a', metadata={'meta': 'data'})) == \
+            hash(forge.arg('a', metadata={'meta': 'data'}))
+        assert len({
+            forge.arg('a'),
+            forge.arg('a'),
+            forge.arg('a', metadata={'meta': 'data'}),
+            forge.arg('b'),
+        }) == 3
+
+    def test_empty_metadata_shared(self):
+        """
+        Ensure parameters without metadata share an empty mapping
+        """
+        assert forge.arg('a').metadata is forge.kwarg('b').metadata
+        assert forge.arg('a').replace(metadata={}).metadata is \
+            forge.arg('a').metadata
+
+
+@pytest.mark.usefixtures('reset_intern_parameters')
+class TestIntern:
+    @pytest.mark.parametrize(('factory',), [
+        pytest.param(forge.pos, id='pos'),
+        pytest.param(forge.arg, id='arg'),
+        pytest.param(forge.kwarg, id='kwarg'),
+        pytest.param(forge.ctx, id='ctx'),
+        pytest.param(forge.vpo, id='vpo'),
+        pytest.param(forge.vkw, id='vkw'),
+    ])
+    def test_constructors(self, factory):
+        """
+        Ensure constructors return shared instances of identical parameters
+        """
+        forge.set_intern_parameters(True)
+        assert factory('a') is factory('a')
+        assert factory('a') is not factory('b')
+
+    @pytest.mark.parametrize(('kwargs1', 'kwargs2'), [
+        pytest.param({'default': 1}, {'default': True}, id='default_type'),
+        pytest.param({'type': int}, {'type': str}, id='type'),
+        pytest.param(
+            {'converter': increment_converter},
+            {'converter': dummy_converter},
+            id='converter',
+        ),
+        pytest.param(
+            {'converter': increment_converter},
+            {'converter': [increment_converter]},
+            id='converter_shape',
+        ),
+        pytest.param({'metadata': {'a': 1}}, {'metadata': {'a': 2}}, id='meta'),
+    ])
+    def test_distinct(self, kwargs1, kwargs2):
+        """
+        Ensure parameters that differ aren't shared
+        """
+        forge.set_intern_parameters(True)
+        assert forge.arg('a', **kwargs1) is forge.arg('a', **kwargs1)
+        assert forge.arg('a', **kwargs1) is not forge.arg('a', **kwargs2)
+
+    def test_unhashable(self):
+        """
+        Ensure parameters with distinct unhashable defaults aren't shared
+        """
+        forge.set_intern_parameters(True)
+        assert forge.arg('a', default=[]) is not forge.arg('a', default=[])
+
+    def test_default_identity(self):
+        """
+        Ensure parameters are only shared if their (non-scalar) defaults are
+        the same object, as equal defaults may differ (e.g. by type)
+        """
+        forge.set_intern_parameters(True)
+        default = (1,)
+        assert forge.arg('a', default=default) is \
+            forge.arg('a', default=default)
+
+        fparam = forge.arg('b', default=(1,))
+        assert forge.arg('b', default=(1.0,)) is not fparam
+        assert type(forge.arg('b', default=(1.0,)).default[0]) is float
+
+    def test_from_native(self):
+        """
+        Ensure ``FSignature.from_native`` shares identical parameters
+        """
+        forge.set_intern_parameters(True)
+        def func1(self, limit=100, *, offset=0):
+            pass
+        def func2(self, limit=100, *, offset=0):
+            pass
+
+        fsig1, fsig2 = fsignature(func1), fsignature(func2)
+        assert all(p1 is p2 for p1, p2 in zip(fsig1, fsig2))
+
+    def test_disabled(self):
+        """
+        Ensure parameters aren't interned by default
+        """
+        assert not forge.get_intern_parameters()
+        assert forge.arg('a') is not forge.arg('a')
+
+    def test_released(self):
+        """
+        Ensure interned parameters are released when no longer referenced
+        """
+        forge.set_intern_parameters(True)
+        size = len(forge._signature._interned)
+        fparam = forge.arg('released')
+        assert len(forge._signature._interned) == size + 1
+        del fparam
+        assert len(forge._signature._interned) == size
+
 
 class TestVarPositional:
     @staticmethod
@@ -911,6 +1310,29 @@ class TestFSignature:
     def test_fsignature(self):
         assert fsignature == FSignature.from_callable
 
+    @pytest.mark.parametrize(('other', 'equal'), [
+        pytest.param(FSignature([forge.arg('a')]), True, id='equal'),
+        pytest.param(FSignature([forge.arg('b')]), False, id='parameters'),
+        pytest.param(
+            FSignature([forge.arg('a')], return_annotation=int),
+            False,
+            id='return_annotation',
+        ),
+        pytest.param([forge.arg('a')], False, id='list'),
+    ])
+    def test__eq__(self, other, equal):
+        """
+        Ensure that signatures compare their parameters and return annotation
+        """
+        assert (FSignature([forge.arg('a')]) == other) is equal
+
+    def test__iter__(self):
+        """
+        Ensure that iterating a signature yields its parameters
+        """
+        params = [forge.arg('a'), forge.arg('b')]
+        assert list(FSignature(params)) == params
+
     # Begin test sequence methods
     @pytest.mark.parametrize(('in_', 'key', 'out_'), [
         # int
@@ -1302,6 +1724,102 @@ class TestFSignature:
         )
         fsig.validate()
 
+    def test_validated(self):
+        """
+        Ensure that validation marks a signature as ``validated``, and that
+        replacing the ``return_annotation`` retains the mark
+        """
+        fsig = FSignature([forge.arg('a')])
+        assert not fsig.validated
+        fsig.validate()
+        assert fsig.validated
+        assert fsig.replace(return_annotation=int).validated
+
+    @pytest.mark.parametrize(('start', 'stop', 'parameters'), [
+        pytest.param(0, 0, [], id='empty'),
+        pytest.param(1, 2, [forge.arg('z')], id='replace'),
+        pytest.param(1, 3, [], id='delete'),
+        pytest.param(4, 4, [forge.vkw('z')], id='append'),
+        pytest.param(1, 2, [forge.arg('b')], id='swap_name'),
+        pytest.param(1, 1, [forge.arg('c')], id='name_raises'),
+        pytest.param(1, 1, [forge.arg('z', 'c')], id='interface_name_raises'),
+        pytest.param(0, 0, [forge.arg('z')], id='contextual_raises'),
+        pytest.param(1, 1, [forge.ctx('z')], id='late_contextual_raises'),
+        pytest.param(4, 4, [forge.arg('z')], id='kind_raises'),
+        pytest.param(3, 3, [forge.arg('z')], id='default_raises'),
+        pytest.param(
+            3, 3, [forge.vpo('y'), forge.vpo('z')],
+            id='var_positional_raises',
+        ),
+        pytest.param(1, 1, [forge.arg()], id='unnamed_raises'),
+    ])
+    def test_validate_splice(self, start, stop, parameters):
+        """
+        Ensure that validating a signature spliced from a validated signature
+        (which only checks the splice) agrees with validation from scratch
+        """
+        fsig = FSignature([
+            forge.ctx('self'),
+            forge.arg('a'),
+            forge.arg('b', default=1),
+            forge.kwarg('c'),
+        ], __validate_parameters__=True)
+        spliced = fsig._splice(start, stop, parameters)
+        expected = FSignature(spliced)
+
+        try:
+            expected.validate()
+        except (SyntaxError, TypeError, ValueError) as exc:
+            with pytest.raises(type(exc)) as excinfo:
+                spliced.validate()
+            assert excinfo.value.args == exc.args
+            assert not spliced.validated
+        else:
+            spliced.validate()
+            assert spliced._valid == expected._valid
+
+    def test_validate_splice_incremental(self):
+        """
+        Ensure that only signatures spliced from validated signatures are
+        validated incrementally, and that the splices are released
+        """
+        fsig = FSignature([forge.arg('a'), forge.kwarg('b')])
+        with patch.object(FSignature, '_validate_all') as validate_all:
+            fsig._splice(1, 1, [forge.arg('c')]).validate()
+        validate_all.assert_called_once_with()
+
+        fsig.validate()
+        spliced = fsig._splice(1, 1, [forge.arg('c')])
+        with patch.object(FSignature, '_validate_all') as validate_all:
+            spliced.validate()
+        validate_all.assert_not_called()
+        assert spliced.validated
+        assert spliced._base is None
+
+    def test_validate_splice_intermediate(self):
+        """
+        Ensure that intermediate splices (e.g. of ``compose``) needn't be
+        valid
+        """
+        fsig = FSignature([forge.arg('a')], __validate_parameters__=True)
+        # The intermediate signature has two parameters named 'a'
+        spliced = fsig._splice(0, 0, [forge.arg('a', 'b')])._splice(1, 2, [])
+        spliced.validate()
+        assert spliced == FSignature([forge.arg('a', 'b')])
+        assert spliced.validated
+
+    def test_pickle(self):
+        """
+        Ensure ``FSignature`` instances can be pickled
+        """
+        fsig = FSignature(
+            [forge.arg('a'), forge.kwarg('b', default=1)],
+            return_annotation=int,
+        )
+        restored = pickle.loads(pickle.dumps(fsig))
+        assert restored == fsig
+        assert list(restored) == list(fsig)
+
 
 class TestSignatureConvenience:
     @pytest.mark.parametrize(('name', 'obj'), [
@@ -1354,6 +1872,123 @@ def test_findparam(kls, selector, expected_name):
         assert not list(result)
 
 
+@pytest.mark.parametrize(('selector', 'expected'), [
+    pytest.param('b', [1], id='str'),
+    pytest.param(iter(['c', 'a']), [0, 2], id='iter_str'),
+    pytest.param(lambda param: param.name != 'b', [0, 2], id='callable'),
+    pytest.param('d', [], id='DNE'),
+])
+def test_findindex(selector, expected):
+    """
+    Ensure that findindex yields the indices of the matched parameters, in
+    order (consuming an iterable selector only once)
+    """
+    params = [forge.arg('a'), forge.arg('b'), forge.arg('c')]
+    result = findindex(params, selector)
+    assert isinstance(result, typing.Iterator)
+    assert list(result) == expected
+
+
+class TestSelector:
+    @staticmethod
+    def make_fsig():
+        return FSignature([
+            forge.arg('a', metadata={'tag': 1}),
+            forge.arg('b_id', metadata={'tag': 2}),
+            forge.kwo('c_id'),
+            forge.kwo('d', metadata={'other': True}),
+        ])
+
+    @pytest.mark.parametrize(('selector', 'expected'), [
+        pytest.param('a', ['a'], id='str'),
+        pytest.param(re.compile('.*_id'), ['b_id', 'c_id'], id='regex'),
+        pytest.param(KEYWORD_ONLY, ['c_id', 'd'], id='kind'),
+        pytest.param(
+            lambda param: param.name.startswith('c'),
+            ['c_id'],
+            id='callable',
+        ),
+        pytest.param(('d', 'a', 'x'), ['a', 'd'], id='iter_str'),
+        pytest.param(
+            ['d', re.compile('b.*'), POSITIONAL_OR_KEYWORD],
+            ['a', 'b_id', 'd'],
+            id='iter_mixed',
+        ),
+        pytest.param(Selector.glob('*_id'), ['b_id', 'c_id'], id='glob'),
+        pytest.param(
+            Selector.kind(POSITIONAL_OR_KEYWORD, VAR_KEYWORD),
+            ['a', 'b_id'],
+            id='kind_classmethod',
+        ),
+        pytest.param(Selector.metadata('tag'), ['a', 'b_id'], id='metadata'),
+        pytest.param(
+            Selector.metadata(tag=2),
+            ['b_id'],
+            id='metadata_items',
+        ),
+        pytest.param('x', [], id='DNE'),
+    ])
+    def test_find(self, selector, expected):
+        """
+        Ensure that selectors of each form match the correct parameters,
+        whether they're found in a signature (by index) or an iterable
+        """
+        fsig = self.make_fsig()
+        compiled = Selector(selector)
+        for parameters in (fsig, list(fsig)):
+            assert [p.name for p in compiled.find(parameters)] == expected
+            assert [fsig[i].name for i in compiled.indices(parameters)] == \
+                expected
+
+    def test_find_native(self):
+        """
+        Ensure that selectors match ``inspect.Parameter`` instances, which
+        have no metadata
+        """
+        params = inspect.signature(lambda a, *, b_id: None).parameters.values()
+        assert [p.name for p in Selector.glob('*_id').find(params)] == ['b_id']
+        assert not list(Selector.metadata('tag').find(params))
+
+    def test_indices_duplicate_names(self):
+        """
+        Ensure that the name index of an (unvalidated) signature retains every
+        parameter with a name
+        """
+        fsig = FSignature([forge.arg('a'), forge.arg('b'), forge.arg('a')])
+        assert list(Selector('a').indices(fsig)) == [0, 2]
+        assert list(Selector(['b', 'a']).indices(fsig)) == [0, 1, 2]
+
+    def test_compiled(self):
+        """
+        Ensure that compiled selectors are used as-is, and that iterators are
+        consumed once
+        """
+        selector = Selector(iter(['a', 'd']))
+        assert Selector(selector) is selector
+        assert [p.name for p in selector.find(self.make_fsig())] == ['a', 'd']
+        assert [p.name for p in selector.find(self.make_fsig())] == ['a', 'd']
+
+    def test_invalid_raises(self):
+        """
+        Ensure that selectors of an unknown form raise
+        """
+        with pytest.raises(TypeError) as excinfo:
+            Selector(1)
+        assert excinfo.value.args[0] == (
+            'selectors must be strings, regular expressions, parameter '
+            'kinds, callables or iterables, not 1'
+        )
+
+    def test__str__(self):
+        """
+        Ensure that selectors are printed as their source (e.g. in the
+        messages of revisions that don't match any parameter)
+        """
+        assert str(Selector(('a', 'b'))) == "('a', 'b')"
+        assert str(Selector.glob('*_id')) == '*_id'
+        assert repr(Selector('a')) == "<Selector 'a'>"
+
+
 @pytest.mark.parametrize(('params', 'expected'), [
     ((forge.ctx('a'),), forge.ctx('a')),
     ((forge.arg('a'),), None),
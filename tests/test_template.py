@@ -0,0 +1,125 @@
+import asyncio
+import itertools
+
+import pytest
+
+import forge
+from forge._template import template
+
+# pylint: disable=C0103, invalid-name
+# pylint: disable=R0201, no-self-use
+
+
+def request(method, url, **kwargs):
+    return method, url, kwargs
+
+
+@pytest.fixture
+def with_method():
+    """
+    Provides a template of ``request`` whose ``method`` can be specialized
+    """
+    return template(
+        forge.modify('method', kind=forge.FParameter.POSITIONAL_ONLY),
+        request,
+    )
+
+
+class TestTemplate:
+    def test__init__(self, with_method):
+        """
+        Ensure the callable is revised once, when the template is created
+        """
+        assert with_method.callable is request
+        assert with_method.fsignature == forge.FSignature([
+            forge.pos('method'),
+            forge.arg('url'),
+            forge.vkw('kwargs'),
+        ])
+
+    def test__repr__(self, with_method):
+        """
+        Ensure the template is represented by its callable and signature
+        """
+        assert repr(with_method) == \
+            '<template request(method, /, url, **kwargs)>'
+
+    def test_specialize(self, with_method):
+        """
+        Ensure variants supply their values for the specialized parameters,
+        which are removed from their signature
+        """
+        get = with_method.specialize(method='GET')
+        post = with_method.specialize(method='POST')
+
+        assert forge.repr_callable(post) == 'request(url, **kwargs)'
+        assert get('/') == ('GET', '/', {})
+        assert post('/', data=1) == ('POST', '/', {'data': 1})
+
+    def test_specialize_plan_shared(self, with_method):
+        """
+        Ensure variants that specialize the same parameters share a plan
+        """
+        get = with_method.specialize(method='GET')
+        post = with_method.specialize(method='POST')
+        assert get.__mapper__.plan is post.__mapper__.plan
+
+        other = with_method.specialize(method='GET', url='/')
+        assert other.__mapper__.plan is not get.__mapper__.plan
+        assert forge.repr_callable(other) == 'request(**kwargs)'
+        assert other() == ('GET', '/', {})
+
+    def test_specialize_factory(self, with_method):
+        """
+        Ensure ``Factory`` values generate a value for each call
+        """
+        counter = itertools.count()
+        func = with_method.specialize(
+            method=forge.Factory(lambda: 'M{}'.format(next(counter))),
+        )
+        assert [func('/')[0] for _ in range(2)] == ['M0', 'M1']
+
+    def test_specialize_converter(self):
+        """
+        Ensure the specialized values are converted
+        """
+        func = template(
+            forge.modify('method', kind=forge.FParameter.POSITIONAL_ONLY,
+                         converter=lambda ctx, name, value: value.upper()),
+            request,
+        ).specialize(method='get')
+        assert func('/') == ('GET', '/', {})
+
+    def test_specialize_revised(self, with_method):
+        """
+        Ensure that revising a variant retains its specialized values
+        """
+        post = with_method.specialize(method='POST')
+        assert post.__mapper__.fsignature['method'].default == 'POST'
+
+        revised = forge.modify('url', default='/')(post)
+        assert forge.repr_callable(revised) == "request(url='/', **kwargs)"
+        assert revised() == ('POST', '/', {})
+
+    def test_specialize_coroutine_function(self, loop):
+        """
+        Ensure variants of coroutine functions are coroutine functions
+        """
+        async def arequest(method, url):
+            return method, url
+
+        func = template(
+            forge.modify('method', kind=forge.FParameter.POSITIONAL_ONLY),
+            arequest,
+        ).specialize(method='GET')
+        assert asyncio.iscoroutinefunction(func)
+        assert loop.run_until_complete(func('/')) == ('GET', '/')
+
+    def test_specialize_unknown_raises(self, with_method):
+        """
+        Ensure specializing parameters that don't exist raises
+        """
+        with pytest.raises(TypeError) as excinfo:
+            with_method.specialize(method='GET', nope=1, other=2)
+        assert excinfo.value.args[0] == \
+            "'request' has no parameter(s) named 'nope', 'other'"
@@ -1,8 +1,11 @@
+import asyncio
 import inspect
+import pickle
 import sys
 
 import pytest
 
+from forge._exceptions import ImmutableInstanceError
 from forge._signature import (
     KEYWORD_ONLY,
     POSITIONAL_ONLY,
@@ -10,7 +13,13 @@ from forge._signature import (
     VAR_KEYWORD,
     VAR_POSITIONAL,
 )
-from forge._utils import CallArguments, callwith, repr_callable, sort_arguments
+from forge._utils import (
+    CallArguments,
+    callwith,
+    markcoroutinefunction,
+    repr_callable,
+    sort_arguments,
+)
 
 # pylint: disable=C0103, invalid-name
 # pylint: disable=R0201, no-self-use
@@ -67,6 +76,45 @@ class TestCallArguments:
         assert repr(CallArguments(*args, **kwargs)) == \
             '<CallArguments ({})>'.format(expected)
 
+    def test_unpack(self):
+        """
+        Ensure that ``CallArguments`` unpacks into ``args`` and ``kwargs``
+        """
+        args, kwargs = CallArguments(1, b=2)
+        assert (args, dict(kwargs)) == ((1,), {'b': 2})
+
+    def test_immutable(self):
+        """
+        Ensure that ``CallArguments`` attributes can't be assigned, and that
+        ``kwargs`` is a read-only view
+        """
+        call_args = CallArguments(1, b=2)
+        with pytest.raises(ImmutableInstanceError) as excinfo:
+            call_args.args = ()
+        assert excinfo.value.args[0] == "cannot assign to field 'args'"
+        with pytest.raises(TypeError):
+            call_args.kwargs['b'] = 3
+
+    @pytest.mark.parametrize(('other', 'equal'), [
+        pytest.param(CallArguments(1, b=2), True, id='equal'),
+        pytest.param(CallArguments(1, b=3), False, id='unequal'),
+        pytest.param(((1,), {'b': 2}), False, id='tuple'),
+    ])
+    def test__eq__(self, other, equal):
+        """
+        Ensure that ``CallArguments`` only equal other ``CallArguments``
+        """
+        call_args = CallArguments(1, b=2)
+        assert (call_args == other) is equal
+        assert (call_args != other) is not equal
+
+    def test_pickle(self):
+        """
+        Ensure that ``CallArguments`` survive a round-trip through pickle
+        """
+        call_args = CallArguments(1, b=2)
+        assert pickle.loads(pickle.dumps(call_args)) == call_args
+
 
 @pytest.mark.parametrize(('strategy',), [('class_callable',), ('function',)])
 def test_repr_callable(strategy):
@@ -206,3 +254,15 @@ def test_callwith():
     func = lambda a, b=2, *args, c, d=4, **kwargs: (a, b, args, c, d, kwargs)
     assert callwith(func, dict(a=1, c=3, e=5), ('args1',)) == \
         (1, 2, ('args1',), 3, 4, {'e': 5})
+
+
+def test_markcoroutinefunction():
+    """
+    Ensure that ``markcoroutinefunction`` marks a function as a coroutine
+    function
+    """
+    def func():
+        pass
+    assert not asyncio.iscoroutinefunction(func)
+    assert markcoroutinefunction(func) is func
+    assert asyncio.iscoroutinefunction(func)